@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class PythonfunConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'Pythonfun'
+
+    def ready(self):
+        # 注册模型信号
+        from . import signals  # noqa: F401
@@ -0,0 +1,107 @@
+"""
+前台文章页面查询
+列表只读取标题等轻量列；当前文章的正文（content_html）延迟加载，
+渲染后的正文片段按 (文章ID, 更新时间) 缓存，命中时不再读取正文。
+代码内容（content_code）前台页面不使用，不再读取。
+"""
+from django.shortcuts import get_object_or_404
+
+from .models import Article, ArticleNavigation
+from .serializers import ARTICLE_LIST_COLUMNS
+
+# 前台页面显示当前文章需要的列（正文由模板片段缓存未命中时按需读取）
+CURRENT_ARTICLE_COLUMNS = (
+    'id', 'title', 'subtitle', 'summary', 'content_type',
+    'read_time_minutes', 'is_published', 'created_at', 'updated_at',
+    'category', 'category__name', 'category__slug',
+    'category__parent', 'category__parent__name', 'category__parent__slug',
+)
+
+
+def published_articles(content_type):
+    """已发布文章列表（最新在前），不读取正文列"""
+    return (
+        Article.objects
+        .filter(content_type=content_type, is_published=True)
+        .select_related('category')
+        .only(*ARTICLE_LIST_COLUMNS)
+        .order_by('-created_at')
+    )
+
+
+def get_current_article(request, content_type, **filters):
+    """
+    获取页面默认显示的文章（最早发布的一篇），分类及主分类随文章一起查询
+    没有已发布的文章且用户是管理员时，返回未发布的文章用于预览
+    """
+    articles = (
+        Article.objects
+        .filter(content_type=content_type, **filters)
+        .select_related('category__parent')
+        .only(*CURRENT_ARTICLE_COLUMNS)
+        .order_by('created_at')
+    )
+    current_article = articles.filter(is_published=True).first()
+    if not current_article and request.user.is_authenticated and request.user.is_staff:
+        current_article = articles.filter(is_published=False).first()
+    return current_article
+
+
+def get_article_for_display(pk):
+    """按ID获取文章及其导航索引，读取的列与当前文章相同，不存在时抛出 Http404"""
+    return get_object_or_404(
+        Article.objects
+        .select_related('category__parent', 'navigation')
+        .only(*CURRENT_ARTICLE_COLUMNS, *NAVIGATION_COLUMNS),
+        pk=pk
+    )
+
+
+# ========== 导航索引 ==========
+
+# 每篇文章保存的相关教程数量
+RELATED_LIMIT = 5
+
+# 随文章一起读取的导航索引列
+NAVIGATION_COLUMNS = (
+    'navigation__previous', 'navigation__next', 'navigation__related', 'navigation__updated_at',
+)
+
+
+def rebuild_navigation(category_id, content_type):
+    """
+    重建一个分类、一种内容类型下所有文章的导航索引（1条查询读取，1条语句写入）
+    上一篇/下一篇按发布顺序（最早在前），相关教程为其余已发布文章中最新的几篇
+    """
+    articles = list(
+        Article.objects
+        .filter(category_id=category_id, content_type=content_type)
+        .order_by('created_at', 'id')
+        .values_list('id', 'title', 'is_published')
+    )
+    published = [{'id': article_id, 'title': title} for article_id, title, is_published in articles if is_published]
+    positions = {item['id']: index for index, item in enumerate(published)}
+    newest = published[::-1][:RELATED_LIMIT + 1]
+
+    navigations = []
+    for article_id, title, is_published in articles:
+        index = positions.get(article_id)
+        navigations.append(ArticleNavigation(
+            article_id=article_id,
+            previous=published[index - 1] if index else None,
+            next=published[index + 1] if index is not None and index + 1 < len(published) else None,
+            related=[item for item in newest if item['id'] != article_id][:RELATED_LIMIT],
+        ))
+    ArticleNavigation.objects.bulk_create(
+        navigations, update_conflicts=True, unique_fields=['article'],
+        update_fields=['previous', 'next', 'related', 'updated_at']
+    )
+
+
+def get_navigation(article):
+    """获取文章的导航索引，索引尚未建立时（如历史数据）先重建所在分组"""
+    try:
+        return article.navigation
+    except ArticleNavigation.DoesNotExist:
+        rebuild_navigation(article.category_id, article.content_type)
+        return ArticleNavigation.objects.get(article=article)
@@ -0,0 +1,667 @@
+"""
+性能基准测试
+生成可复现的合成数据集，按真实请求比例（前台页面、函数库、函数查询/搜索、导出、导入）
+回放请求，统计吞吐量、p50/p95/p99 延迟和每个请求的SQL查询次数。
+请求可以发给进程内的 Django 测试客户端，也可以发给本地启动的 gunicorn；
+查询次数读取 Server-Timing 响应头（见 request_metrics），两种方式都能统计。
+报告为按键排序的 JSON，可以提交到仓库并在不同提交之间直接 diff。
+并发扩展测试在进程内直接调用 ASGI 应用（相当于一个 uvicorn worker），
+逐级提高并发数，配合模拟的数据库延迟观察吞吐量随并发的变化。
+连接复用测试在进程内直接调用 WSGI 应用（相当于一个 gunicorn 同步 worker），
+对比每个请求新建连接和持久连接下的延迟。
+"""
+import asyncio
+import io
+import json
+import math
+import random
+import re
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from urllib import error, request as urllib_request
+
+from django.db import connections, transaction
+from django.db.backends.signals import connection_created
+
+from . import caching
+from .article_pages import rebuild_navigation
+from .category_tree import CACHE_NAMESPACE as CATEGORY_TREE_CACHE
+from .function_catalog import invalidate_function_library
+from .function_import import TEMPLATE_HEADERS
+from .models import Article, MainCategory, SubCategory, Library, Module, OperationType, Function, Parameter
+
+# 合成数据的名称前缀，清理数据时只删除带前缀的记录
+PREFIX = 'bench'
+
+# 默认数据量：子分类数为每个主分类下的数量，文章数为每个子分类下的数量，以此类推
+DEFAULT_COUNTS = {
+    'main_categories': 5,
+    'sub_categories': 4,
+    'articles': 10,
+    'libraries': 5,
+    'modules': 5,
+    'functions': 40,
+    'parameters': 3,
+}
+
+# 生成文本和搜索词使用的词表
+WORDS = [
+    'path', 'file', 'list', 'string', 'number', 'index', 'value', 'key', 'loop', 'class',
+    'object', 'module', 'import', 'return', 'iterator', 'generator', 'format', 'split', 'join', 'sort',
+]
+WORDS_CN = ['路径', '文件', '列表', '字符串', '数字', '索引', '值', '键', '循环', '对象']
+
+# 函数查询接口使用的搜索词（英文前缀、完整词项和中文子串）
+SEARCH_TERMS = ['path', 'sort', 'str', 'file join', '列表', '字符串']
+
+# 导入请求上传的函数数量
+IMPORT_FUNCTIONS = 50
+
+# 请求名称 -> 权重，按站点的实际访问比例设置
+REQUEST_MIX = {
+    'index': 20,
+    'category': 15,
+    'tutorial_detail': 20,
+    'function_library': 5,
+    'function_library_api': 10,
+    'function_query': 10,
+    'function_search': 10,
+    'export_csv': 2,
+    'import_xlsx': 1,
+}
+
+# 只读JSON接口的请求比例（并发扩展测试使用，均为异步视图）
+API_MIX = {
+    'function_library_api': 2,
+    'function_query': 4,
+    'function_search': 2,
+    'function_lists': 2,
+}
+
+# 并发扩展测试默认的并发级别
+CONCURRENCY_LEVELS = (1, 2, 4, 8, 16)
+
+_QUERY_COUNT_RE = re.compile(r'desc="(\d+) queries"')
+
+
+# ========== 合成数据 ==========
+
+def clear_dataset():
+    """删除合成数据（只删除带前缀的记录）"""
+    with transaction.atomic():
+        Article.objects.filter(category__parent__slug__startswith=f'{PREFIX}-').delete()
+        MainCategory.objects.filter(slug__startswith=f'{PREFIX}-').delete()
+        Library.objects.filter(library_name__startswith=f'{PREFIX}_').delete()
+        OperationType.objects.filter(operation_name__startswith=f'{PREFIX}_').delete()
+    caching.bump_generation(CATEGORY_TREE_CACHE)
+    invalidate_function_library()
+
+
+def _sentence(rng, words, length):
+    return ' '.join(rng.choice(words) for _ in range(length))
+
+
+def seed_dataset(counts=None, seed=0):
+    """
+    生成合成数据集，同样的 counts 和 seed 生成的数据相同
+    批量写入不触发信号，写入后统一重建导航索引并使缓存失效
+    返回各表写入的行数
+    """
+    counts = {**DEFAULT_COUNTS, **(counts or {})}
+    rng = random.Random(seed)
+    content_types = list(Article.ContentType)
+
+    with transaction.atomic():
+        main_categories = MainCategory.objects.bulk_create([
+            MainCategory(name=f'{PREFIX}主分类{i}', slug=f'{PREFIX}-main-{i}', order=i)
+            for i in range(counts['main_categories'])
+        ])
+        sub_categories = SubCategory.objects.bulk_create([
+            SubCategory(parent=main_category, name=f'{PREFIX}子分类{i}-{j}', slug=f'{PREFIX}-sub-{i}-{j}')
+            for i, main_category in enumerate(main_categories)
+            for j in range(counts['sub_categories'])
+        ])
+        articles = Article.objects.bulk_create([
+            Article(
+                title=f'{PREFIX} {_sentence(rng, WORDS, 3)} {index}',
+                summary=_sentence(rng, WORDS_CN, 10),
+                content_html=''.join(f'<p>{_sentence(rng, WORDS, 60)}</p>' for _ in range(rng.randint(5, 20))),
+                content_type=content_types[index % len(content_types)],
+                category=sub_category,
+                # 约十分之一为草稿
+                is_published=rng.random() >= 0.1,
+            )
+            for sub_category in sub_categories
+            for index in range(counts['articles'])
+        ])
+        for category_id, content_type in {(article.category_id, article.content_type) for article in articles}:
+            rebuild_navigation(category_id, content_type)
+
+        operation_types = OperationType.objects.bulk_create([
+            OperationType(operation_name=f'{PREFIX}_{word}', operation_name_cn=f'{PREFIX}{word_cn}')
+            for word, word_cn in zip(WORDS, WORDS_CN)
+        ])
+        libraries = Library.objects.bulk_create([
+            Library(library_name=f'{PREFIX}_lib{i}', library_name_cn=f'{PREFIX}库{i}')
+            for i in range(counts['libraries'])
+        ])
+        modules = Module.objects.bulk_create([
+            Module(library=library, module_name=f'mod{j}', description=_sentence(rng, WORDS, 8))
+            for library in libraries
+            for j in range(counts['modules'])
+        ])
+        functions = Function.objects.bulk_create([
+            Function(
+                module=module,
+                function_name=f'{rng.choice(WORDS)}_{rng.choice(WORDS)}_{k}',
+                function_name_cn=f'{rng.choice(WORDS_CN)}{k}',
+                description=_sentence(rng, WORDS, 12),
+                description_cn=_sentence(rng, WORDS_CN, 12),
+                operation_type=rng.choice(operation_types + [None]),
+                syntax=f'func_{k}(path, *args)',
+                parameters_text='path, *args',
+                return_value='str',
+                example=f'func_{k}("a")',
+            )
+            for module in modules
+            for k in range(counts['functions'])
+        ], batch_size=1000)
+        # 部分数据库（如 MySQL）批量写入不返回主键，重新读取函数ID
+        function_ids = list(
+            Function.objects.filter(module__in=modules).order_by('function_id').values_list('function_id', flat=True)
+        )
+        parameters = Parameter.objects.bulk_create([
+            Parameter(
+                function_id=function_id,
+                parameter_name=f'arg{position}',
+                data_type=rng.choice(['str', 'int', 'list', 'dict']),
+                is_required=position == 0,
+                description=_sentence(rng, WORDS, 6),
+                position=position,
+            )
+            for function_id in function_ids
+            for position in range(counts['parameters'])
+        ], batch_size=1000)
+
+    caching.bump_generation(CATEGORY_TREE_CACHE)
+    invalidate_function_library()
+    return {
+        'main_categories': len(main_categories),
+        'sub_categories': len(sub_categories),
+        'articles': len(articles),
+        'libraries': len(libraries),
+        'modules': len(modules),
+        'functions': len(functions),
+        'parameters': len(parameters),
+    }
+
+
+def build_import_workbook(function_count=IMPORT_FUNCTIONS):
+    """生成导入请求上传的XLSX（一个独立的库、模块及其函数），重复导入结果相同"""
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    wb.remove(wb.active)
+    library_name = f'{PREFIX}_import'
+    sheets = {
+        'Library': [[library_name, f'{PREFIX}导入库', None, None, None, False, False]],
+        'Module': [[library_name, 'mod0', None, False]],
+        'Function': [
+            [library_name, 'mod0', f'imported_{k}', None, f'Imported function {k}', None,
+             None, None, None, 'str', None, None, None, None, None]
+            for k in range(function_count)
+        ],
+    }
+    for sheet_name, rows in sheets.items():
+        ws = wb.create_sheet(sheet_name)
+        ws.append(TEMPLATE_HEADERS[sheet_name])
+        for row in rows:
+            ws.append(row)
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+# ========== 请求回放 ==========
+
+class RequestPlan:
+    """根据数据库中的已发布文章和函数库生成按权重随机的请求序列"""
+
+    def __init__(self, seed=0, mix=None):
+        self.rng = random.Random(seed)
+        self.mix = mix or REQUEST_MIX
+        articles = list(
+            Article.objects
+            .filter(is_published=True, category__isnull=False)
+            .order_by('id')
+            .values_list('id', 'category__slug', 'content_type')
+        )
+        self.article_ids = [article_id for article_id, slug, content_type in articles]
+        type_params = {
+            Article.ContentType.GRAMMAR: 'grammar',
+            Article.ContentType.DATA_STRUCTURE: 'data-structure',
+            Article.ContentType.AI_PROGRAMMING: 'ai-programming',
+        }
+        self.categories = sorted({(slug, type_params[content_type]) for article_id, slug, content_type in articles})
+        self.modules = list(Module.objects.order_by('module_id').values_list('library__library_name', 'module_name'))
+        self.operation_types = list(
+            OperationType.objects.order_by('operation_type_id').values_list('operation_name_cn', flat=True)
+        )
+        self.import_file = None
+
+    def next_request(self):
+        """返回 (请求名称, 方法, 路径, 上传文件)"""
+        names = list(self.mix)
+        name = self.rng.choices(names, weights=[self.mix[n] for n in names])[0]
+        return (name, *getattr(self, f'_{name}')())
+
+    def _index(self):
+        return 'GET', self.rng.choice(['/', '/data-structure/', '/ai-programming/']), None
+
+    def _category(self):
+        slug, content_type = self.rng.choice(self.categories)
+        return 'GET', f'/category/{slug}/?type={content_type}', None
+
+    def _tutorial_detail(self):
+        return 'GET', f'/tutorial/{self.rng.choice(self.article_ids)}/', None
+
+    def _function_library(self):
+        return 'GET', self.rng.choice(['/function-library/', '/function-query/']), None
+
+    def _function_library_api(self):
+        return 'GET', '/api/function-library/', None
+
+    def _function_query(self):
+        library_name, module_name = self.rng.choice(self.modules)
+        filters = self.rng.choice([
+            f'library={library_name}',
+            f'library={library_name}&module={module_name}',
+            f'operation_type={self.rng.choice(self.operation_types)}' if self.operation_types else '',
+            f'cursor={self.rng.randint(0, 1000)}',
+        ])
+        return 'GET', f'/api/function-query/?{filters}', None
+
+    def _function_search(self):
+        return 'GET', f'/api/function-query/?search={self.rng.choice(SEARCH_TERMS)}', None
+
+    def _function_lists(self):
+        return 'GET', self.rng.choice([
+            '/api/function-libraries/', '/api/function-modules/',
+            '/api/function-operation-types/', '/api/function-stats/',
+        ]), None
+
+    def _export_csv(self):
+        return 'GET', '/api/export-functions/?format=csv', None
+
+    def _import_xlsx(self):
+        if self.import_file is None:
+            self.import_file = build_import_workbook()
+        return 'POST', '/api/upload-functions/', ('bench_import.xlsx', self.import_file)
+
+
+class ClientTarget:
+    """进程内的 Django 测试客户端（单线程）"""
+    concurrent = False
+
+    def __init__(self):
+        from django.test import Client
+        self.client = Client()
+
+    def send(self, method, path, upload=None):
+        if upload is not None:
+            from django.core.files.uploadedfile import SimpleUploadedFile
+            file_name, content = upload
+            response = self.client.post(path, {'file': SimpleUploadedFile(file_name, content)})
+        else:
+            response = self.client.generic(method, path)
+        # 流式响应（CSV导出）读完响应体才算请求结束
+        if response.streaming:
+            b''.join(response.streaming_content)
+        return response.status_code, response.get('Server-Timing', '')
+
+
+class HttpTarget:
+    """通过 HTTP 访问已启动的服务（如本地 gunicorn），支持并发"""
+    concurrent = True
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/')
+
+    def send(self, method, path, upload=None):
+        data = None
+        headers = {}
+        if upload is not None:
+            file_name, content = upload
+            boundary = uuid.uuid4().hex
+            data = (
+                f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="{file_name}"\r\n'
+                f'Content-Type: application/octet-stream\r\n\r\n'
+            ).encode() + content + f'\r\n--{boundary}--\r\n'.encode()
+            headers['Content-Type'] = f'multipart/form-data; boundary={boundary}'
+        url = self.base_url + urllib_request.quote(path, safe='/?=&')
+        req = urllib_request.Request(url, data=data, headers=headers, method=method)
+        try:
+            with urllib_request.urlopen(req) as response:
+                response.read()
+                return response.status, response.headers.get('Server-Timing', '')
+        except error.HTTPError as e:
+            return e.code, e.headers.get('Server-Timing', '')
+
+
+class AsgiTarget:
+    """
+    进程内直接调用 ASGI 应用，相当于一个 uvicorn worker：
+    所有请求共用一个事件循环，同步代码（包括异步 ORM 的查询）在每个请求各自的线程中执行
+    """
+    concurrent = True
+
+    def __init__(self):
+        from django.core.asgi import get_asgi_application
+        self.app = get_asgi_application()
+
+    async def asend(self, method, path, upload=None):
+        if upload is not None:
+            raise ValueError('AsgiTarget 只用于只读接口，不支持上传文件')
+        path, _, query_string = path.partition('?')
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': method,
+            'scheme': 'http',
+            'path': path,
+            'raw_path': path.encode(),
+            'query_string': query_string.encode(),
+            'headers': [(b'host', b'testserver')],
+            'client': ('127.0.0.1', 0),
+            'server': ('testserver', 80),
+        }
+        finished = asyncio.Event()
+        response = {}
+
+        async def receive():
+            if not response:
+                response['started'] = False
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            # Django 在处理请求的同时监听客户端断开，响应结束前不能返回断开消息
+            await finished.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                response['status'] = message['status']
+                response['headers'] = dict(message['headers'])
+            elif not message.get('more_body'):
+                finished.set()
+
+        await self.app(scope, receive, send)
+        finished.set()
+        return response['status'], response['headers'].get(b'server-timing', b'').decode()
+
+
+class WsgiTarget:
+    """
+    进程内直接调用 WSGI 应用，相当于一个 gunicorn 同步 worker：
+    与测试客户端不同，请求开始和结束时会按 CONN_MAX_AGE 关闭过期的数据库连接
+    """
+    concurrent = False
+
+    def __init__(self):
+        from django.core.wsgi import get_wsgi_application
+        self.app = get_wsgi_application()
+
+    def send(self, method, path, upload=None):
+        if upload is not None:
+            raise ValueError('WsgiTarget 只用于只读请求，不支持上传文件')
+        # WSGI 环境变量中的字符串为 latin-1 解码的原始字节
+        path, _, query_string = urllib_request.quote(path, safe='/?=&').partition('?')
+        environ = {
+            'REQUEST_METHOD': method,
+            'SCRIPT_NAME': '',
+            'PATH_INFO': urllib_request.unquote_to_bytes(path).decode('iso-8859-1'),
+            'QUERY_STRING': query_string,
+            'SERVER_NAME': 'testserver',
+            'SERVER_PORT': '80',
+            'SERVER_PROTOCOL': 'HTTP/1.1',
+            'REMOTE_ADDR': '127.0.0.1',
+            'wsgi.version': (1, 0),
+            'wsgi.url_scheme': 'http',
+            'wsgi.input': io.BytesIO(),
+            'wsgi.errors': io.StringIO(),
+            'wsgi.multithread': False,
+            'wsgi.multiprocess': True,
+            'wsgi.run_once': False,
+        }
+        started = {}
+
+        def start_response(status, headers, exc_info=None):
+            started['status'] = int(status.split(' ', 1)[0])
+            started['headers'] = dict(headers)
+
+        body = self.app(environ, start_response)
+        try:
+            b''.join(body)
+        finally:
+            # WSGI 服务器在响应结束后调用 close()，触发 request_finished
+            body.close()
+        return started['status'], started['headers'].get('Server-Timing', '')
+
+
+def install_db_latency(seconds):
+    """
+    每条SQL执行前额外等待 seconds 秒，模拟远程数据库（如 Supabase）的网络往返
+    对之后建立的所有连接生效，返回撤销函数
+    """
+    def wrapper(execute, sql, params, many, context):
+        time.sleep(seconds)
+        return execute(sql, params, many, context)
+
+    def install(connection, **kwargs):
+        connection.execute_wrappers.insert(0, wrapper)
+
+    for connection in connections.all(initialized_only=True):
+        install(connection)
+    connection_created.connect(install, weak=False)
+
+    def uninstall():
+        connection_created.disconnect(install)
+        for connection in connections.all(initialized_only=True):
+            if wrapper in connection.execute_wrappers:
+                connection.execute_wrappers.remove(wrapper)
+
+    return uninstall
+
+
+def install_connect_latency(seconds):
+    """
+    每次建立数据库连接时额外等待 seconds 秒，模拟连接远程数据库的 TCP/TLS 握手和认证
+    返回撤销函数
+    """
+    def receiver(connection, **kwargs):
+        time.sleep(seconds)
+
+    connection_created.connect(receiver, weak=False)
+    return lambda: connection_created.disconnect(receiver)
+
+
+def set_conn_max_age(seconds, using='default'):
+    """修改数据库连接的 CONN_MAX_AGE 并关闭当前连接，下次建立连接时生效；返回原来的值"""
+    connection = connections[using]
+    previous = connection.settings_dict['CONN_MAX_AGE']
+    connection.settings_dict['CONN_MAX_AGE'] = seconds
+    connection.close()
+    return previous
+
+
+def _send(target, planned):
+    name, method, path, upload = planned
+    start = time.perf_counter()
+    status, server_timing = target.send(method, path, upload)
+    latency = time.perf_counter() - start
+    match = _QUERY_COUNT_RE.search(server_timing)
+    return {
+        'name': name,
+        'status': status,
+        'latency': latency,
+        'queries': int(match.group(1)) if match else None,
+    }
+
+
+async def _asend(target, planned, semaphore):
+    name, method, path, upload = planned
+    async with semaphore:
+        start = time.perf_counter()
+        status, server_timing = await target.asend(method, path, upload)
+        latency = time.perf_counter() - start
+    match = _QUERY_COUNT_RE.search(server_timing)
+    return {
+        'name': name,
+        'status': status,
+        'latency': latency,
+        'queries': int(match.group(1)) if match else None,
+    }
+
+
+async def _run_async(target, planned, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(_asend(target, item, semaphore) for item in planned))
+    return list(results), time.perf_counter() - start
+
+
+def run_benchmark(target, plan, requests=500, warmup=50, concurrency=1):
+    """回放请求，返回 (每个请求的结果, 总耗时秒数)；预热请求不计入结果"""
+    if isinstance(target, AsgiTarget):
+        asyncio.run(_run_async(target, [plan.next_request() for _ in range(warmup)], concurrency))
+        return asyncio.run(_run_async(target, [plan.next_request() for _ in range(requests)], concurrency))
+
+    for _ in range(warmup):
+        _send(target, plan.next_request())
+
+    planned = [plan.next_request() for _ in range(requests)]
+    start = time.perf_counter()
+    if target.concurrent and concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(lambda item: _send(target, item), planned))
+    else:
+        results = [_send(target, item) for item in planned]
+    return results, time.perf_counter() - start
+
+
+def run_concurrency_sweep(target, plan, levels=CONCURRENCY_LEVELS, requests=200, warmup=20):
+    """在同一个 worker 上逐级提高并发数，返回 {并发数: 汇总结果}"""
+    sweep = {}
+    for level in levels:
+        results, elapsed = run_benchmark(target, plan, requests=requests, warmup=warmup, concurrency=level)
+        sweep[str(level)] = _summarize(results, elapsed)
+    return sweep
+
+
+def run_connection_benchmark(plan, conn_max_age=600, requests=200, warmup=20, using='default'):
+    """
+    在一个同步 worker（WsgiTarget）上分别以每个请求新建连接（CONN_MAX_AGE=0）和持久连接回放请求，
+    返回 {模式: 汇总结果}，汇总结果中的 connections 为期间新建的连接数
+    """
+    target = WsgiTarget()
+    opened = []
+
+    def count(connection, **kwargs):
+        if connection.alias == using:
+            opened.append(connection)
+
+    modes = {}
+    previous = connections[using].settings_dict['CONN_MAX_AGE']
+    connection_created.connect(count, weak=False)
+    try:
+        for mode, max_age in (('per_request', 0), ('persistent', conn_max_age)):
+            set_conn_max_age(max_age, using)
+            for _ in range(warmup):
+                _send(target, plan.next_request())
+            opened.clear()
+            start = time.perf_counter()
+            results = [_send(target, plan.next_request()) for _ in range(requests)]
+            modes[mode] = _summarize(results, time.perf_counter() - start)
+            modes[mode]['connections'] = len(opened)
+    finally:
+        connection_created.disconnect(count)
+        set_conn_max_age(previous, using)
+    return modes
+
+
+# ========== 报告 ==========
+
+def percentiles(values):
+    """返回 (p50, p95, p99)，按最近秩取值"""
+    ordered = sorted(values)
+    return tuple(
+        ordered[max(math.ceil(len(ordered) * p / 100) - 1, 0)]
+        for p in (50, 95, 99)
+    )
+
+
+def _summarize(results, elapsed):
+    latencies = [result['latency'] * 1000 for result in results]
+    queries = [result['queries'] for result in results if result['queries'] is not None]
+    p50, p95, p99 = percentiles(latencies)
+    return {
+        'requests': len(results),
+        'errors': sum(1 for result in results if result['status'] >= 400),
+        'throughput_rps': round(len(results) / elapsed, 1) if elapsed else None,
+        'mean_ms': round(statistics.fmean(latencies), 1),
+        'p50_ms': round(p50, 1),
+        'p95_ms': round(p95, 1),
+        'p99_ms': round(p99, 1),
+        'queries_mean': round(statistics.fmean(queries), 1) if queries else None,
+        'queries_max': max(queries) if queries else None,
+    }
+
+
+def build_report(results, elapsed, meta=None):
+    """
+    汇总结果：总体及每种请求的吞吐量、延迟分位数和查询次数
+    各请求的吞吐量按其在总耗时中的占比计算（请求数 / 总耗时）
+    """
+    by_name = {}
+    for result in results:
+        by_name.setdefault(result['name'], []).append(result)
+    return {
+        'meta': meta or {},
+        'total': _summarize(results, elapsed),
+        'requests': {name: _summarize(items, elapsed) for name, items in sorted(by_name.items())},
+    }
+
+
+def dump_report(report):
+    """报告序列化为按键排序、缩进的 JSON，便于 diff"""
+    return json.dumps(report, ensure_ascii=False, indent=2, sort_keys=True) + '\n'
+
+
+REPORT_COLUMNS = ('requests', 'errors', 'throughput_rps', 'p50_ms', 'p95_ms', 'p99_ms', 'queries_mean')
+
+
+def format_report(report, baseline=None):
+    """报告格式化为文本表格；给出基准报告时附带延迟和查询次数的变化"""
+    rows = [('total', report['total'])] + list(report['requests'].items())
+    lines = ['{:<22}'.format('request') + ''.join(f'{column:>16}' for column in REPORT_COLUMNS)]
+    for name, summary in rows:
+        lines.append(f'{name:<22}' + ''.join(f'{_cell(summary.get(column)):>16}' for column in REPORT_COLUMNS))
+        if baseline is None:
+            continue
+        base = baseline['total'] if name == 'total' else baseline['requests'].get(name)
+        if base:
+            lines.append(f'{"":<22}' + ''.join(
+                f'{_change(base.get(column), summary.get(column)):>16}' for column in REPORT_COLUMNS
+            ))
+    return '\n'.join(lines)
+
+
+def _cell(value):
+    return '-' if value is None else str(value)
+
+
+def _change(before, after):
+    if not before or after is None:
+        return ''
+    return f'{(after - before) / before * 100:+.1f}%'
@@ -0,0 +1,122 @@
+"""
+带版本号的缓存工具
+每个命名空间维护一个代数（generation），数据写入时递增代数，
+旧代数的缓存键自然失效，无需逐个删除。
+
+代数保存在缓存中，只有共享缓存（Redis）才能让所有进程看到递增后的代数。
+本地内存缓存下其他 gunicorn worker、Vercel 实例会继续返回旧数据直到过期，
+因此本地内存缓存使用较短的有效期（LOCAL_CACHE_TIMEOUT），多个 worker 的 gunicorn 部署应使用共享缓存。
+"""
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured
+
+logger = logging.getLogger(__name__)
+
+def _generation_key(namespace):
+    return f'{namespace}:generation'
+
+
+def _stats_key(namespace, name):
+    return f'{namespace}:stats:{name}'
+
+
+def _initial_generation():
+    # 代数键丢失（例如缓存被清空）时，用时间戳作为新代数，避免与旧代数重复
+    return time.time_ns()
+
+
+def get_generation(namespace):
+    """获取命名空间当前的代数"""
+    generation = cache.get(_generation_key(namespace))
+    if generation is None:
+        cache.add(_generation_key(namespace), _initial_generation(), None)
+        generation = cache.get(_generation_key(namespace))
+    return generation
+
+
+def bump_generation(namespace):
+    """递增命名空间的代数，使该命名空间下的所有缓存失效"""
+    try:
+        return cache.incr(_generation_key(namespace))
+    except ValueError:
+        generation = _initial_generation()
+        cache.set(_generation_key(namespace), generation, None)
+        return generation
+
+
+def _record(namespace, name):
+    try:
+        cache.incr(_stats_key(namespace, name))
+    except ValueError:
+        if not cache.add(_stats_key(namespace, name), 1, None):
+            cache.incr(_stats_key(namespace, name))
+
+
+def is_shared_cache():
+    """默认缓存是否由所有进程共享"""
+    return not isinstance(caches['default'], LocMemCache)
+
+
+def default_timeout():
+    """
+    缓存数据的默认有效期（秒）
+    共享缓存中代数变化后旧数据自然过期；本地内存缓存的有效期即其他进程可能返回旧数据的最长时间
+    """
+    return settings.SHARED_CACHE_TIMEOUT if is_shared_cache() else settings.LOCAL_CACHE_TIMEOUT
+
+
+def require_shared_cache(processes):
+    """
+    检查多个进程同时提供服务时是否使用共享缓存，否则数据变更后各进程的缓存不一致
+    默认只记录警告，缓存按 LOCAL_CACHE_TIMEOUT 过期；REQUIRE_SHARED_CACHE 为真时抛出异常
+    """
+    if processes <= 1 or is_shared_cache():
+        return
+    if settings.REQUIRE_SHARED_CACHE:
+        raise ImproperlyConfigured(
+            f'{processes} 个进程同时提供服务时需要设置 REDIS_URL 使用共享缓存，'
+            f'本地内存缓存无法在进程之间同步失效'
+        )
+    logger.warning(
+        '%s 个进程使用本地内存缓存，数据变更后其他进程最多在 %s 秒内返回旧数据，设置 REDIS_URL 可使用共享缓存',
+        processes, settings.LOCAL_CACHE_TIMEOUT,
+    )
+
+
+def versioned_key(namespace, key):
+    """当前代数下的缓存键，代数递增后旧键不再被读取"""
+    return f'{namespace}:{key}:{get_generation(namespace)}'
+
+
+def get_or_build(namespace, key, builder):
+    """
+    读取当前代数下的缓存，未命中时调用 builder 生成并写入缓存（有效期见 default_timeout）
+    同时记录命中/未命中次数
+    """
+    cache_key = versioned_key(namespace, key)
+    value = cache.get(cache_key)
+    if value is None:
+        _record(namespace, 'misses')
+        value = builder()
+        cache.set(cache_key, value, default_timeout())
+    else:
+        _record(namespace, 'hits')
+    return value
+
+
+def get_stats(namespace):
+    """获取命名空间的缓存统计信息"""
+    hits = cache.get(_stats_key(namespace, 'hits'), 0)
+    misses = cache.get(_stats_key(namespace, 'misses'), 0)
+    total = hits + misses
+    return {
+        'generation': get_generation(namespace),
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total, 4) if total else 0.0
+    }
@@ -0,0 +1,60 @@
+"""
+分类树服务
+前台各页面（语法、数据结构、AI编程、分类页）共用的侧边栏分类树构建
+"""
+from django.db.models import Count, Q
+
+from . import caching
+from .models import SubCategory
+
+
+def build_category_tree(content_type):
+    """
+    构建指定内容类型的分类树
+
+    通过一次聚合查询取出所有含有该类型已发布文章的子分类（连同主分类），
+    再在内存中按主分类分组，查询次数与分类数量无关。
+    只包含启用的子分类，且其主分类也须启用；各页面（包括分类页）的侧边栏一致。
+
+    返回格式：[{'main_category': MainCategory, 'sub_categories': [SubCategory, ...]}, ...]
+    每个子分类带有 article_count 属性。
+    """
+    article_filter = Q(article__content_type=content_type, article__is_published=True)
+    sub_categories = (
+        SubCategory.objects
+        .filter(is_enabled=True, parent__is_enabled=True)
+        .select_related('parent')
+        .annotate(article_count=Count('article', filter=article_filter))
+        .filter(article_count__gt=0)
+        .order_by('parent__order', 'parent__id', 'id')
+    )
+
+    category_tree = []
+    current_group = None
+    for sub_category in sub_categories:
+        if current_group is None or current_group['main_category'].pk != sub_category.parent_id:
+            current_group = {
+                'main_category': sub_category.parent,
+                'sub_categories': []
+            }
+            category_tree.append(current_group)
+        current_group['sub_categories'].append(sub_category)
+
+    return category_tree
+
+
+# 分类树缓存的命名空间
+CACHE_NAMESPACE = 'category_tree'
+
+
+def get_category_tree(content_type):
+    """获取指定内容类型的分类树，优先从缓存读取"""
+    return caching.get_or_build(
+        CACHE_NAMESPACE, content_type,
+        lambda: build_category_tree(content_type)
+    )
+
+
+def invalidate_category_tree():
+    """使所有内容类型的分类树缓存失效"""
+    caching.bump_generation(CACHE_NAMESPACE)
@@ -0,0 +1,40 @@
+"""
+数据库连接与 gunicorn 多进程
+每个同步 worker 同一时间只处理一个请求，配置 CONN_MAX_AGE 后 worker 复用自己的一条持久连接，
+相当于每个 worker 一个连接的连接池，请求不再重复建立 TLS 连接。
+preload_app 时 Django 在主进程中加载，加载过程中（如启动检查）可能已经建立数据库连接；
+fork 出的 worker 会继承同一个套接字，多个进程共用一条连接会导致协议数据错乱。
+因此 fork 前在主进程中关闭连接，fork 后在 worker 中丢弃可能继承的连接，由 worker 自己重新建立。
+"""
+from django.apps import apps
+from django.db import connections
+
+# worker 中继承自主进程的底层连接：只保留引用，不关闭也不使用
+_inherited_connections = []
+
+
+def close_before_fork():
+    """gunicorn pre_fork 钩子（主进程）：关闭主进程中的所有数据库连接"""
+    if not apps.ready:
+        return
+    connections.close_all()
+
+
+def discard_connection(connection):
+    """
+    丢弃继承来的连接，下次查询时重新建立
+    不能调用 close()：关闭会通过共用的套接字通知数据库断开，主进程和其他 worker 的连接也会失效；
+    底层连接对象被回收时同样会关闭，因此保留引用
+    """
+    if connection.connection is None:
+        return
+    _inherited_connections.append(connection.connection)
+    connection.connection = None
+
+
+def reset_after_fork():
+    """gunicorn post_fork 钩子（worker 进程）：丢弃从主进程继承的数据库连接"""
+    if not apps.ready:
+        return
+    for connection in connections.all(initialized_only=True):
+        discard_connection(connection)
@@ -0,0 +1,201 @@
+"""
+函数库目录快照
+/api/function-library/ 返回的嵌套JSON预先构建并序列化为字节，
+在函数库数据变更前一直复用同一份快照。
+另提供列式格式（format=columnar）：重复的字符串放入字符串表，函数按列存为平行数组，
+压缩版本（gzip/brotli）在首次请求时生成并缓存。
+"""
+import gzip
+import hashlib
+import json
+
+from asgiref.sync import sync_to_async
+from django.db.models import Prefetch
+
+from . import caching
+from .models import Library, Module, Function
+
+# 函数库快照缓存的命名空间
+CACHE_NAMESPACE = 'function_library'
+
+
+def build_function_library():
+    """一次性取出库、模块、函数（共3条查询），构建函数库嵌套数据"""
+    functions = (
+        Function.objects
+        .select_related('operation_type')
+        .only(
+            'function_id', 'module_id', 'function_name', 'description', 'description_cn',
+            'parameters_text', 'return_value', 'return_value_cn',
+            'operation_type', 'operation_type__operation_name_cn'
+        )
+        .order_by('function_id')
+    )
+    modules = (
+        Module.objects
+        .only('module_id', 'library_id', 'module_name', 'description')
+        .order_by('module_id')
+        .prefetch_related(Prefetch('functions', queryset=functions))
+    )
+    libraries = (
+        Library.objects
+        .only('library_id', 'library_name', 'library_name_cn')
+        .order_by('library_id')
+        .prefetch_related(Prefetch('modules', queryset=modules))
+    )
+
+    data = {}
+    for library in libraries:
+        data[library.library_name] = {
+            'name': library.library_name_cn,
+            'modules': [{
+                'name': module.module_name,
+                'description': module.description or '',
+                'items': [{
+                    'type': 'function',
+                    'name': function.function_name,
+                    'semantic': function.description_cn or function.description or '',
+                    'operation': function.operation_type.operation_name_cn if function.operation_type else '',
+                    'input': function.parameters_text or '',
+                    'output': function.return_value_cn or function.return_value or ''
+                } for function in module.functions.all()]
+            } for module in library.modules.all()]
+        }
+    return data
+
+
+# 支持的格式：嵌套JSON（默认）和列式JSON
+CATALOG_FORMATS = ('nested', 'columnar')
+
+# 函数的列，columnar 格式中按列存放；STRING_TABLE_COLUMNS 中的列存放字符串表下标
+FUNCTION_COLUMNS = ('name', 'semantic', 'operation', 'input', 'output')
+STRING_TABLE_COLUMNS = ('operation', 'input', 'output')
+
+
+def build_columnar_function_library(data):
+    """
+    把嵌套的函数库数据转换为列式结构：
+    libraries/modules 各列为平行数组，modules 按库依次排列，libraries.module_count 表示各库的模块数；
+    functions 按模块依次排列，modules.function_count 表示各模块的函数数；
+    操作类型、输入、输出的取值重复较多，存为 strings 字符串表中的下标
+    """
+    strings = []
+    string_index = {}
+
+    def intern(value):
+        if value not in string_index:
+            string_index[value] = len(strings)
+            strings.append(value)
+        return string_index[value]
+
+    libraries = {'key': [], 'name': [], 'module_count': []}
+    modules = {'name': [], 'description': [], 'function_count': []}
+    functions = {column: [] for column in FUNCTION_COLUMNS}
+    for library_key, library in data.items():
+        libraries['key'].append(library_key)
+        libraries['name'].append(library['name'])
+        libraries['module_count'].append(len(library['modules']))
+        for module in library['modules']:
+            modules['name'].append(module['name'])
+            modules['description'].append(module['description'])
+            modules['function_count'].append(len(module['items']))
+            for item in module['items']:
+                for column in FUNCTION_COLUMNS:
+                    value = item[column]
+                    functions[column].append(intern(value) if column in STRING_TABLE_COLUMNS else value)
+    return {
+        'version': 1,
+        'strings': strings,
+        'libraries': libraries,
+        'modules': modules,
+        'functions': functions,
+    }
+
+
+def _dump(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def build_function_library_snapshot():
+    """构建函数库快照：两种格式序列化后的JSON字节及其ETag（以嵌套格式内容计算）"""
+    data = build_function_library()
+    content = _dump(data)
+    return {
+        'etag': hashlib.sha1(content).hexdigest(),
+        'content': content,
+        'columnar': _dump(build_columnar_function_library(data)),
+    }
+
+
+def get_function_library_snapshot():
+    """获取当前函数库快照，数据变更后首次访问时重新构建"""
+    return caching.get_or_build(CACHE_NAMESPACE, 'snapshot', build_function_library_snapshot)
+
+
+async def aget_function_library_snapshot():
+    """异步视图使用：缓存读取（未命中时构建快照）在线程中执行，不阻塞事件循环"""
+    return await sync_to_async(get_function_library_snapshot)()
+
+
+def _brotli():
+    """brotli 为可选依赖，未安装时只提供 gzip"""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def available_encodings():
+    """按优先顺序返回可用的压缩编码"""
+    return ('br', 'gzip') if _brotli() else ('gzip',)
+
+
+def choose_encoding(accept_encoding):
+    """根据 Accept-Encoding 选择压缩编码，客户端都不接受时返回 identity"""
+    accepted = set()
+    for part in accept_encoding.split(','):
+        coding, _, params = part.partition(';')
+        params = params.replace(' ', '')
+        try:
+            quality = float(params[2:]) if params.startswith('q=') else 1.0
+        except ValueError:
+            quality = 1.0
+        if coding.strip() and quality > 0:
+            accepted.add(coding.strip().lower())
+    for encoding in available_encodings():
+        if encoding in accepted or '*' in accepted:
+            return encoding
+    return 'identity'
+
+
+def compress(content, encoding):
+    if encoding == 'br':
+        return _brotli().compress(content, quality=11)
+    return gzip.compress(content, compresslevel=9, mtime=0)
+
+
+def get_function_library_payload(format_type='nested', encoding='identity'):
+    """
+    获取指定格式和压缩编码的函数库数据，返回 {'etag', 'content'}
+    压缩版本在首次请求时生成（brotli 最高压缩级别较慢，只在数据变更后执行一次）
+    """
+    snapshot = get_function_library_snapshot()
+    content = snapshot['content'] if format_type == 'nested' else snapshot[format_type]
+    etag = snapshot['etag'] if format_type == 'nested' else f"{snapshot['etag']}-{format_type}"
+    if encoding == 'identity':
+        return {'etag': etag, 'content': content}
+    compressed = caching.get_or_build(
+        CACHE_NAMESPACE, f'snapshot:{format_type}:{encoding}', lambda: compress(content, encoding)
+    )
+    return {'etag': f'{etag}-{encoding}', 'content': compressed}
+
+
+async def aget_function_library_payload(format_type='nested', encoding='identity'):
+    """异步视图使用的 get_function_library_payload"""
+    return await sync_to_async(get_function_library_payload)(format_type, encoding)
+
+
+def invalidate_function_library():
+    """使函数库快照失效"""
+    caching.bump_generation(CACHE_NAMESPACE)
@@ -0,0 +1,205 @@
+"""
+函数数据导出
+用 values_list 按主键分段读取函数表，不创建模型实例，
+导出文件边生成边输出（CSV）或逐行写入临时文件（XLSX），内存占用与数据量无关。
+完整备份按导入模板的五个工作表导出，可直接通过上传接口恢复。
+"""
+import csv
+import tempfile
+from itertools import chain, islice
+
+from .function_import import TEMPLATE_HEADERS
+from .models import Library, Module, OperationType, Function, Parameter
+
+# 每次从数据库读取的行数
+CHUNK_SIZE = 2000
+
+# 估算XLSX列宽时采样的行数
+WIDTH_SAMPLE_ROWS = 500
+
+# XLSX列宽上限
+MAX_COLUMN_WIDTH = 50
+
+# 导出表头
+EXPORT_HEADERS = [
+    '库名称', '模块名称', '函数名称', '函数中文名称', '描述',
+    '操作类型', '语法', '参数', '返回值', '示例'
+]
+
+# 导出需要读取的列，顺序与 _export_row 中的解包顺序一致
+EXPORT_COLUMNS = (
+    'module__library__library_name_cn', 'module__module_name', 'function_name', 'function_name_cn',
+    'description_cn', 'description', 'operation_type__operation_name_cn', 'syntax',
+    'parameters_text', 'return_value_cn', 'return_value', 'example_cn', 'example',
+)
+
+
+def _export_row(values):
+    (library_name, module_name, function_name, function_name_cn,
+     description_cn, description, operation_name, syntax,
+     parameters_text, return_value_cn, return_value, example_cn, example) = values
+    return [
+        library_name,
+        module_name,
+        function_name,
+        function_name_cn or '',
+        description_cn or description or '',
+        operation_name or '',
+        syntax or '',
+        parameters_text or '',
+        return_value_cn or return_value or '',
+        example_cn or example or '',
+    ]
+
+
+def iter_by_key(queryset, key, columns, chunk_size=CHUNK_SIZE):
+    """
+    按主键分段读取 columns：每段一条 WHERE key > 上一段最后的主键 ORDER BY key LIMIT chunk_size 查询
+    不使用服务端游标（iterator）：Supabase 事务模式连接池不能在事务之间保留游标，
+    关闭服务端游标后 psycopg 又会一次取回全部结果；分段查询在各种连接方式下内存占用都只与 chunk_size 有关
+    """
+    queryset = queryset.order_by(key).values_list(key, *columns)
+    last_key = None
+    while True:
+        chunk = queryset if last_key is None else queryset.filter(**{f'{key}__gt': last_key})
+        rows = list(chunk[:chunk_size])
+        for row in rows:
+            yield row[1:]
+        if len(rows) < chunk_size:
+            return
+        last_key = rows[-1][0]
+
+
+def iter_export_rows(chunk_size=CHUNK_SIZE):
+    """逐行生成导出数据（不含表头）"""
+    for values in iter_by_key(Function.objects.all(), 'function_id', EXPORT_COLUMNS, chunk_size):
+        yield _export_row(values)
+
+
+class _Echo:
+    """csv.writer 的写入目标，直接返回写入的内容"""
+
+    def write(self, value):
+        return value
+
+
+def iter_csv(chunk_size=CHUNK_SIZE):
+    """逐行生成CSV文本，第一行为BOM和表头"""
+    writer = csv.writer(_Echo())
+    yield '\ufeff' + writer.writerow(EXPORT_HEADERS)
+    for row in iter_export_rows(chunk_size):
+        yield writer.writerow(row)
+
+
+def sample_column_widths(headers, rows):
+    """根据表头和采样行估算列宽"""
+    widths = [len(str(header)) for header in headers]
+    for row in rows:
+        for index, value in enumerate(row):
+            widths[index] = max(widths[index], len(str(value)))
+    return [min(width + 2, MAX_COLUMN_WIDTH) for width in widths]
+
+
+def _write_sheet(wb, title, headers, rows, data_alignment=None):
+    """
+    向只写模式工作簿追加一个工作表
+    列宽由前 WIDTH_SAMPLE_ROWS 行估算，数据行逐行写出，不在内存中保留整张表
+    """
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill, Alignment
+    from openpyxl.utils import get_column_letter
+
+    ws = wb.create_sheet(title)
+
+    rows = iter(rows)
+    sample = list(islice(rows, WIDTH_SAMPLE_ROWS))
+    for col, width in enumerate(sample_column_widths(headers, sample), 1):
+        ws.column_dimensions[get_column_letter(col)].width = width
+
+    # 表头样式
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    header_alignment = Alignment(horizontal="center", vertical="center")
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header)
+        cell.font = header_font
+        cell.fill = header_fill
+        cell.alignment = header_alignment
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    if data_alignment is None:
+        for row in chain(sample, rows):
+            ws.append(row)
+        return
+
+    for row in chain(sample, rows):
+        cells = []
+        for value in row:
+            cell = WriteOnlyCell(ws, value=value)
+            cell.alignment = data_alignment
+            cells.append(cell)
+        ws.append(cells)
+
+
+def write_xlsx(file, chunk_size=CHUNK_SIZE):
+    """以只写模式生成函数数据表XLSX并写入 file"""
+    from openpyxl import Workbook
+    from openpyxl.styles import Alignment
+
+    wb = Workbook(write_only=True)
+    data_alignment = Alignment(horizontal="left", vertical="top", wrap_text=True)
+    _write_sheet(wb, "函数数据库表", EXPORT_HEADERS, iter_export_rows(chunk_size), data_alignment)
+    wb.save(file)
+
+
+# ========== 完整备份 ==========
+
+# 工作表名称 -> 读取的列，列顺序与导入模板字段一致，导出顺序即恢复时的依赖顺序
+SNAPSHOT_SHEETS = [
+    ('Library', Library, 'library_id', (
+        'library_name', 'library_name_cn', 'description', 'version',
+        'category', 'is_builtin', 'is_standard',
+    )),
+    ('OperationType', OperationType, 'operation_type_id', (
+        'operation_name', 'operation_name_cn', 'description',
+    )),
+    ('Module', Module, 'module_id', (
+        'library__library_name', 'module_name', 'description', 'is_builtin',
+    )),
+    ('Function', Function, 'function_id', (
+        'module__library__library_name', 'module__module_name', 'function_name', 'function_name_cn',
+        'description', 'description_cn', 'operation_type__operation_name_cn', 'syntax',
+        'parameters_text', 'return_value', 'return_value_cn', 'example',
+        'example_cn', 'availability', 'version_added',
+    )),
+    ('Parameter', Parameter, 'parameter_id', (
+        'function__module__library__library_name', 'function__module__module_name', 'function__function_name',
+        'parameter_name', 'parameter_name_cn', 'data_type', 'is_required', 'default_value',
+        'description', 'description_cn',
+    )),
+]
+
+
+def write_snapshot_xlsx(file, chunk_size=CHUNK_SIZE):
+    """按导入模板格式导出五个工作表，不超过 chunk_size 行的表只查询一次"""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    for sheet_name, model, order_field, columns in SNAPSHOT_SHEETS:
+        rows = iter_by_key(model.objects.all(), order_field, columns, chunk_size)
+        _write_sheet(wb, sheet_name, TEMPLATE_HEADERS[sheet_name], rows)
+    wb.save(file)
+
+
+def export_xlsx_file(writer=write_xlsx, chunk_size=CHUNK_SIZE):
+    """用 writer 生成XLSX临时文件并返回已定位到开头的文件对象，文件关闭后自动删除"""
+    temp_file = tempfile.NamedTemporaryFile(suffix='.xlsx')
+    try:
+        writer(temp_file, chunk_size)
+        temp_file.seek(0)
+    except Exception:
+        temp_file.close()
+        raise
+    return temp_file
@@ -0,0 +1,468 @@
+"""
+函数数据批量导入
+预先加载库、模块、函数、操作类型的查找表，用 pandas 按列批量清洗数据，
+在一个事务内分批 bulk_create(update_conflicts=True) 写入。
+写入前逐行检查字段长度；某一批写入出错时在保存点内逐行重试，出错的行记录错误，其余行照常导入。
+"""
+from django.db import DataError, IntegrityError, models, transaction
+
+from .function_catalog import invalidate_function_library
+from .models import Library, Module, OperationType, Function, Parameter
+
+# 每批写入的行数
+BATCH_SIZE = 1000
+
+# 模板各工作表的字段（按列顺序）
+LIBRARY_FIELDS = [
+    'library_name', 'library_name_cn', 'description', 'version',
+    'category', 'is_builtin', 'is_standard'
+]
+MODULE_FIELDS = [
+    'library_name', 'module_name', 'description', 'is_builtin'
+]
+FUNCTION_FIELDS = [
+    'library_name', 'module_name', 'function_name', 'function_name_cn',
+    'description', 'description_cn', 'operation_type', 'syntax',
+    'parameters_text', 'return_value', 'return_value_cn', 'example',
+    'example_cn', 'availability', 'version_added'
+]
+PARAMETER_FIELDS = [
+    'library_name', 'module_name', 'function_name', 'parameter_name',
+    'parameter_name_cn', 'data_type', 'is_required', 'default_value',
+    'description', 'description_cn'
+]
+OPERATION_TYPE_FIELDS = [
+    'operation_name', 'operation_name_cn', 'description'
+]
+
+# 工作表名称 -> (数据类型, 字段)，同时支持英文和中文工作表名称
+TEMPLATE_SHEETS = {
+    'Library': ('library', LIBRARY_FIELDS),
+    'Module': ('module', MODULE_FIELDS),
+    'Function': ('function', FUNCTION_FIELDS),
+    'Parameter': ('parameter', PARAMETER_FIELDS),
+    'OperationType': ('operation_type', OPERATION_TYPE_FIELDS),
+    '库信息': ('library', LIBRARY_FIELDS),
+    '模块信息': ('module', MODULE_FIELDS),
+    '函数信息': ('function', FUNCTION_FIELDS),
+    '参数信息': ('parameter', PARAMETER_FIELDS),
+    '操作类型': ('operation_type', OPERATION_TYPE_FIELDS),
+}
+
+# 模板各工作表的表头（与字段一一对应）
+TEMPLATE_HEADERS = {
+    'Library': [
+        '库名称(英文)', '库名称(中文)', '描述', '版本',
+        '分类', '是否内置', '是否标准库'
+    ],
+    'Module': [
+        '所属库名称', '模块名称', '描述', '是否内置'
+    ],
+    'Function': [
+        '所属库名称', '所属模块名称', '函数名称(英文)', '函数名称(中文)',
+        '描述(英文)', '描述(中文)', '操作类型', '语法',
+        '参数文本', '返回值(英文)', '返回值(中文)', '示例(英文)',
+        '示例(中文)', '可用性', '版本'
+    ],
+    'Parameter': [
+        '所属库名称', '所属模块名称', '所属函数名称', '参数名称(英文)',
+        '参数名称(中文)', '数据类型', '是否必需', '默认值',
+        '描述(英文)', '描述(中文)'
+    ],
+    'OperationType': [
+        '操作类型(英文)', '操作类型(中文)', '描述'
+    ],
+}
+
+# 导入顺序：被引用的数据先导入
+IMPORT_ORDER = ['library', 'operation_type', 'module', 'function', 'parameter']
+
+# 各字段中表示“是”的取值
+TRUE_VALUES = ['true', '1', 'yes', '是', 't']
+
+
+def read_import_file(file, file_extension, errors):
+    """
+    读取上传的Excel/CSV文件，返回 [(数据类型, 清洗后的DataFrame), ...]
+    不在模板中或字段数量不匹配的工作表跳过，并把原因追加到 errors
+    """
+    import pandas as pd
+    import io
+
+    # 读取Excel文件
+    if file_extension in ['.xlsx', '.xls']:
+        excel_file = pd.ExcelFile(file)
+        sheet_names = excel_file.sheet_names
+    else:
+        # CSV文件处理
+        content = file.read().decode('utf-8')
+        df = pd.read_csv(io.StringIO(content))
+        sheet_names = ['CSV_Data']
+        excel_file = None
+
+    sheets = []
+    for sheet_name in sheet_names:
+        try:
+            # 读取工作表数据
+            if excel_file is not None:
+                df = pd.read_excel(excel_file, sheet_name=sheet_name)
+
+            # 跳过空行和说明行
+            df = df.dropna(how='all')
+            df = df[~df.iloc[:, 0].astype(str).str.contains('说明', na=False)]
+
+            if df.empty:
+                continue
+
+            # 验证工作表是否在模板中
+            if sheet_name not in TEMPLATE_SHEETS:
+                errors.append(f"工作表 '{sheet_name}' 不在模板中，跳过处理")
+                continue
+
+            kind, expected_fields = TEMPLATE_SHEETS[sheet_name]
+
+            # 检查字段数量（按列顺序对应模板字段，允许中文表头）
+            if len(df.columns) != len(expected_fields):
+                errors.append(f"工作表 '{sheet_name}' 字段数量不匹配。期望：{len(expected_fields)}，实际：{len(df.columns)}")
+                continue
+
+            sheets.append((kind, clean_sheet(df, expected_fields)))
+
+        except Exception as sheet_error:
+            errors.append(f"处理工作表 '{sheet_name}' 时出错：{str(sheet_error)}")
+
+    return sheets
+
+
+def clean_sheet(df, fields):
+    """
+    清洗工作表数据：按模板顺序重命名列，空值转为空字符串，所有单元格转为去除首尾空格的字符串
+    """
+    df = df.copy()
+    df.columns = fields
+    df = df.astype(object).where(df.notna(), '')
+    return df.astype(str).apply(lambda column: column.str.strip())
+
+
+def parse_boolean_column(column):
+    """批量解析布尔列"""
+    return column.str.lower().isin(TRUE_VALUES)
+
+
+class FunctionImporter:
+    """
+    函数数据导入引擎
+    每行的处理结果与逐行导入一致：关键字段为空的行跳过，引用不存在、字段超长或写入失败的行记录错误
+    """
+
+    def __init__(self, progress_callback=None):
+        self.success_count = 0
+        self.errors = []
+        self.total_rows = 0
+        self.processed_rows = 0
+        # 每写入一批数据后调用 progress_callback(importer)，用于报告进度
+        self.progress_callback = progress_callback
+
+    def run(self, sheets):
+        """
+        导入多个工作表
+        sheets: [(数据类型, 清洗后的DataFrame), ...]，按依赖顺序处理
+        """
+        self.total_rows = sum(len(df) for _, df in sheets)
+        handlers = {
+            'library': self.import_libraries,
+            'module': self.import_modules,
+            'function': self.import_functions,
+            'parameter': self.import_parameters,
+            'operation_type': self.import_operation_types,
+        }
+        ordered = sorted(sheets, key=lambda sheet: IMPORT_ORDER.index(sheet[0]))
+        with transaction.atomic():
+            for kind, df in ordered:
+                rows_before = self.processed_rows
+                handlers[kind](df)
+                self.processed_rows = rows_before + len(df)
+                self._report_progress()
+            transaction.on_commit(invalidate_function_library)
+
+    def _report_progress(self):
+        if self.progress_callback:
+            self.progress_callback(self)
+
+    def _save(self, model, entries, row_count, label, **options):
+        """
+        分批写入 [(行号, 模型实例), ...]，每批写入后按比例更新已处理行数，返回写入失败的行数
+        每批在保存点内写入，出错时回滚该批并逐行重试，失败的行记录错误
+        """
+        entries = list(entries)
+        rows_before = self.processed_rows
+        failed = 0
+        for offset in range(0, len(entries), BATCH_SIZE):
+            batch = entries[offset:offset + BATCH_SIZE]
+            try:
+                with transaction.atomic():
+                    model.objects.bulk_create([obj for _, obj in batch], **options)
+            except (IntegrityError, DataError):
+                failed += self._save_rows(model, batch, label, **options)
+            self.processed_rows = rows_before + row_count * (offset + len(batch)) // len(entries)
+            self._report_progress()
+        return failed
+
+    def _save_rows(self, model, entries, label, **options):
+        failed = 0
+        for index, obj in entries:
+            try:
+                with transaction.atomic():
+                    model.objects.bulk_create([obj], **options)
+            except (IntegrityError, DataError) as e:
+                self._error(index, f"{label}: {e}")
+                failed += 1
+        return failed
+
+    def _error(self, index, message):
+        self.errors.append(f"处理第 {index + 2} 行数据时出错：{message}")
+
+    def _check_lengths(self, index, obj, label):
+        """检查字符字段长度（PostgreSQL 超长时整条语句失败），超长时记录错误并返回 False"""
+        for field in obj._meta.concrete_fields:
+            if not isinstance(field, models.CharField) or not field.max_length:
+                continue
+            value = getattr(obj, field.attname)
+            if value and len(value) > field.max_length:
+                self._error(index, f"{label}: 字段 '{field.verbose_name}' 超过 {field.max_length} 个字符")
+                return False
+        return True
+
+    # ========== 查找表 ==========
+
+    def _library_ids(self):
+        return dict(Library.objects.values_list('library_name', 'library_id'))
+
+    def _module_ids(self):
+        return {
+            (library_name, module_name): module_id
+            for module_id, library_name, module_name in Module.objects.values_list(
+                'module_id', 'library__library_name', 'module_name'
+            )
+        }
+
+    def _function_ids(self):
+        return {
+            (library_name, module_name, function_name): function_id
+            for function_id, library_name, module_name, function_name in Function.objects.values_list(
+                'function_id', 'module__library__library_name', 'module__module_name', 'function_name'
+            )
+        }
+
+    def _operation_type_ids(self):
+        # 同一中文名称对应多个操作类型时取最早创建的
+        operation_type_ids = {}
+        for name_cn, operation_type_id in OperationType.objects.order_by('operation_type_id').values_list(
+            'operation_name_cn', 'operation_type_id'
+        ):
+            operation_type_ids.setdefault(name_cn, operation_type_id)
+        return operation_type_ids
+
+    # ========== 各类数据 ==========
+
+    def import_libraries(self, df):
+        df = df[df['library_name'].ne('') & df['library_name'].ne('nan')]
+        df = df.assign(
+            library_name_cn=df['library_name_cn'].where(df['library_name_cn'].ne(''), df['library_name']),
+            is_builtin=parse_boolean_column(df['is_builtin']),
+            is_standard=parse_boolean_column(df['is_standard']),
+        )
+
+        label = '处理库数据失败'
+        libraries = {}
+        accepted = 0
+        for row in df.itertuples():
+            library = Library(
+                library_name=row.library_name,
+                library_name_cn=row.library_name_cn,
+                description=row.description,
+                version=row.version,
+                category=row.category,
+                is_builtin=row.is_builtin,
+                is_standard=row.is_standard,
+            )
+            if not self._check_lengths(row.Index, library, label):
+                continue
+            # 同一文件中重复的行以最后一行为准
+            libraries[row.library_name] = (row.Index, library)
+            accepted += 1
+
+        failed = self._save(
+            Library, libraries.values(), len(df), label,
+            update_conflicts=True, unique_fields=['library_name'],
+            update_fields=['library_name_cn', 'description', 'version', 'category',
+                           'is_builtin', 'is_standard', 'updated_at']
+        )
+        self.success_count += accepted - failed
+
+    def import_operation_types(self, df):
+        df = df[df['operation_name'].ne('') & df['operation_name'].ne('nan')]
+        df = df.assign(
+            operation_name_cn=df['operation_name_cn'].where(df['operation_name_cn'].ne(''), df['operation_name'])
+        )
+
+        label = '处理操作类型数据失败'
+        operation_types = {}
+        accepted = 0
+        for row in df.itertuples():
+            operation_type = OperationType(
+                operation_name=row.operation_name,
+                operation_name_cn=row.operation_name_cn,
+                description=row.description,
+            )
+            if not self._check_lengths(row.Index, operation_type, label):
+                continue
+            operation_types[row.operation_name] = (row.Index, operation_type)
+            accepted += 1
+
+        failed = self._save(
+            OperationType, operation_types.values(), len(df), label,
+            update_conflicts=True, unique_fields=['operation_name'],
+            update_fields=['operation_name_cn', 'description', 'updated_at']
+        )
+        self.success_count += accepted - failed
+
+    def import_modules(self, df):
+        keys = ['library_name', 'module_name']
+        df = df[(df[keys].ne('') & df[keys].ne('nan')).all(axis=1)]
+        df = df.assign(is_builtin=parse_boolean_column(df['is_builtin']))
+        library_ids = self._library_ids()
+
+        label = '处理模块数据失败'
+        modules = {}
+        accepted = 0
+        for row in df.itertuples():
+            library_id = library_ids.get(row.library_name)
+            if library_id is None:
+                self._error(row.Index, f"{label}: 库 '{row.library_name}' 不存在")
+                continue
+            module = Module(
+                library_id=library_id,
+                module_name=row.module_name,
+                description=row.description,
+                is_builtin=row.is_builtin,
+            )
+            if not self._check_lengths(row.Index, module, label):
+                continue
+            modules[(library_id, row.module_name)] = (row.Index, module)
+            accepted += 1
+
+        failed = self._save(
+            Module, modules.values(), len(df), label,
+            update_conflicts=True, unique_fields=['library', 'module_name'],
+            update_fields=['description', 'is_builtin', 'updated_at']
+        )
+        self.success_count += accepted - failed
+
+    def import_functions(self, df):
+        keys = ['library_name', 'module_name', 'function_name']
+        df = df[(df[keys].ne('') & df[keys].ne('nan')).all(axis=1)]
+        module_ids = self._module_ids()
+
+        # 补建函数引用但尚不存在的操作类型（英文名称与中文名称相同）
+        # 英文名称已被其他操作类型使用时插入被忽略，引用它的行在下面记录错误
+        operation_type_ids = self._operation_type_ids()
+        name_length = OperationType._meta.get_field('operation_name').max_length
+        new_operation_types = {
+            name for name in set(df['operation_type']) - set(operation_type_ids) - {'', 'nan'}
+            if len(name) <= name_length
+        }
+        if new_operation_types:
+            OperationType.objects.bulk_create(
+                [OperationType(operation_name=name, operation_name_cn=name) for name in new_operation_types],
+                batch_size=BATCH_SIZE, ignore_conflicts=True
+            )
+            operation_type_ids = self._operation_type_ids()
+
+        label = '处理函数数据失败'
+        functions = {}
+        accepted = 0
+        for row in df.itertuples():
+            module_id = module_ids.get((row.library_name, row.module_name))
+            if module_id is None:
+                self._error(row.Index, f"{label}: 模块 '{row.library_name}.{row.module_name}' 不存在")
+                continue
+            operation_type_id = None
+            if row.operation_type not in ('', 'nan'):
+                operation_type_id = operation_type_ids.get(row.operation_type)
+                if operation_type_id is None:
+                    reason = (
+                        f"超过 {name_length} 个字符" if len(row.operation_type) > name_length
+                        else "不存在，且英文名称已被其他操作类型使用，无法自动创建"
+                    )
+                    self._error(row.Index, f"{label}: 操作类型 '{row.operation_type}' {reason}")
+                    continue
+            function = Function(
+                module_id=module_id,
+                function_name=row.function_name,
+                function_name_cn=row.function_name_cn,
+                description=row.description,
+                description_cn=row.description_cn,
+                operation_type_id=operation_type_id,
+                syntax=row.syntax,
+                parameters_text=row.parameters_text,
+                return_value=row.return_value,
+                return_value_cn=row.return_value_cn,
+                example=row.example,
+                example_cn=row.example_cn,
+                availability=row.availability,
+                version_added=row.version_added,
+            )
+            if not self._check_lengths(row.Index, function, label):
+                continue
+            functions[(module_id, row.function_name)] = (row.Index, function)
+            accepted += 1
+
+        failed = self._save(
+            Function, functions.values(), len(df), label,
+            update_conflicts=True, unique_fields=['module', 'function_name'],
+            update_fields=['function_name_cn', 'description', 'description_cn', 'operation_type',
+                           'syntax', 'parameters_text', 'return_value', 'return_value_cn',
+                           'example', 'example_cn', 'availability', 'version_added', 'updated_at']
+        )
+        self.success_count += accepted - failed
+
+    def import_parameters(self, df):
+        keys = ['library_name', 'module_name', 'function_name', 'parameter_name']
+        df = df[(df[keys].ne('') & df[keys].ne('nan')).all(axis=1)]
+        df = df.assign(is_required=parse_boolean_column(df['is_required']))
+        function_ids = self._function_ids()
+
+        label = '处理参数数据失败'
+        parameters = {}
+        accepted = 0
+        for row in df.itertuples():
+            function_id = function_ids.get((row.library_name, row.module_name, row.function_name))
+            if function_id is None:
+                self._error(
+                    row.Index,
+                    f"{label}: 函数 '{row.library_name}.{row.module_name}.{row.function_name}' 不存在"
+                )
+                continue
+            parameter = Parameter(
+                function_id=function_id,
+                parameter_name=row.parameter_name,
+                parameter_name_cn=row.parameter_name_cn,
+                data_type=row.data_type,
+                is_required=row.is_required,
+                default_value=row.default_value,
+                description=row.description,
+                description_cn=row.description_cn,
+            )
+            if not self._check_lengths(row.Index, parameter, label):
+                continue
+            parameters[(function_id, row.parameter_name)] = (row.Index, parameter)
+            accepted += 1
+
+        failed = self._save(
+            Parameter, parameters.values(), len(df), label,
+            update_conflicts=True, unique_fields=['function', 'parameter_name'],
+            update_fields=['parameter_name_cn', 'data_type', 'is_required', 'default_value',
+                           'description', 'description_cn']
+        )
+        self.success_count += accepted - failed
@@ -0,0 +1,266 @@
+"""
+函数全文搜索
+PostgreSQL 下使用 tsvector 表达式索引（GIN）匹配英文词项，pg_trgm 三元组索引匹配中文及子串，
+少于 3 个字符的查询改用中文列的单字/双字数组索引（GIN）；
+其他数据库（如测试使用的 SQLite）使用进程内倒排索引。
+两种实现都返回按相关度排序、可直接交给 Paginator 分页的结果。
+"""
+import heapq
+import math
+import re
+from collections import defaultdict
+from bisect import bisect_left
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField
+from django.db.models.expressions import RawSQL
+
+from . import caching
+from .function_catalog import CACHE_NAMESPACE as FUNCTION_LIBRARY_CACHE
+from .models import Function
+
+# 英文词项使用的全文检索配置，需与迁移 0006 中创建的索引表达式保持一致
+SEARCH_CONFIG = 'simple'
+
+# 参与三元组（子串）匹配的列
+TRIGRAM_COLUMNS = ('function_name', 'function_name_cn', 'description_cn')
+
+# 三元组索引只能加速至少 3 个字符的子串匹配，更短的查询匹配以下列的单字/双字数组（迁移 0011）
+TRIGRAM_MIN_LENGTH = 3
+NGRAM_COLUMNS = ('function_name_cn', 'description_cn')
+
+# 各字段在倒排索引中的权重
+FIELD_WEIGHTS = (
+    ('function_name', 3.0),
+    ('function_name_cn', 3.0),
+    ('description', 1.0),
+    ('description_cn', 1.0),
+)
+
+# 单个前缀最多展开的词项数，避免过短的前缀拖慢查询
+MAX_PREFIX_EXPANSIONS = 200
+
+_TOKEN_RE = re.compile(r'[a-z0-9]+|[\u4e00-\u9fff]+')
+
+
+def search_vector_sql(prefix=''):
+    """tsvector 表达式；索引中不带表名前缀，查询中带表名前缀"""
+    return (
+        f"to_tsvector('{SEARCH_CONFIG}', coalesce({prefix}function_name, '') || ' ' || "
+        f"coalesce({prefix}description, ''))"
+    )
+
+
+def ngram_array_sql(prefix=''):
+    """中文列的单字/双字数组表达式，与 search_vector_sql 相同，索引中不带表名前缀"""
+    return ' || '.join(f'function_search_ngrams({prefix}{column})' for column in NGRAM_COLUMNS)
+
+
+def search_functions(queryset, search):
+    """
+    在 queryset 范围内搜索函数，按相关度从高到低排序
+    PostgreSQL 下返回 QuerySet，其他数据库返回 RankedResults
+    """
+    if connection.vendor == 'postgresql':
+        return _search_postgresql(queryset, search)
+    return _search_inverted_index(queryset, search)
+
+
+# ========== PostgreSQL 实现 ==========
+
+def _escape_like(value):
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _search_postgresql(queryset, search):
+    prefix = f'"{Function._meta.db_table}".'
+    vector = search_vector_sql(prefix)
+    terms = _TOKEN_RE.findall(search.lower())
+    tsquery = ' & '.join(f'{term}:*' for term in terms)
+
+    if len(search.strip()) < TRIGRAM_MIN_LENGTH:
+        # 1~2 个字符的 ILIKE '%x%' 提取不出三元组，会退化为全表扫描
+        conditions = [f'{ngram_array_sql(prefix)} @> ARRAY[%s]']
+        params = [search.strip().lower()]
+    else:
+        conditions = [f'{prefix}{column} ILIKE %s' for column in TRIGRAM_COLUMNS]
+        params = [f'%{_escape_like(search)}%'] * len(TRIGRAM_COLUMNS)
+    rank_sql = f'similarity({prefix}function_name, %s)'
+    rank_params = [search]
+    if tsquery:
+        conditions.insert(0, f"{vector} @@ to_tsquery('{SEARCH_CONFIG}', %s)")
+        params.insert(0, tsquery)
+        rank_sql += f" + ts_rank({vector}, to_tsquery('{SEARCH_CONFIG}', %s))"
+        rank_params.append(tsquery)
+    rank_sql += f' + CASE WHEN lower({prefix}function_name) = %s THEN 1 ELSE 0 END'
+    rank_params.append(search.lower())
+
+    return (
+        queryset
+        .filter(RawSQL(' OR '.join(conditions), params, output_field=BooleanField()))
+        .annotate(search_rank=RawSQL(rank_sql, rank_params, output_field=FloatField()))
+        .order_by('-search_rank', 'function_id')
+    )
+
+
+# ========== 倒排索引实现 ==========
+
+def tokenize(text):
+    """英文按单词切分，中文切分为单字和双字词"""
+    tokens = []
+    for run in _TOKEN_RE.findall((text or '').lower()):
+        if run[0] >= '\u4e00':
+            tokens.extend(run)
+            tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.append(run)
+    return tokens
+
+
+def _query_terms(search):
+    """查询词项：英文词按前缀匹配，中文使用双字词（单字时使用单字）精确匹配"""
+    terms = []
+    for run in _TOKEN_RE.findall(search.lower()):
+        if run[0] >= '\u4e00':
+            if len(run) == 1:
+                terms.append((run, False))
+            else:
+                terms.extend((run[i:i + 2], False) for i in range(len(run) - 1))
+        else:
+            terms.append((run, len(run) > 1))
+    return terms
+
+
+class InvertedIndex:
+    """函数倒排索引：词项 -> {函数ID: 得分}，得分在构建时按字段权重和IDF预先计算"""
+
+    def __init__(self, rows):
+        weights = defaultdict(dict)
+        name_ids = defaultdict(list)
+        doc_count = 0
+        for function_id, *values in rows:
+            doc_count += 1
+            name_ids[(values[0] or '').lower()].append(function_id)
+            for (field, weight), value in zip(FIELD_WEIGHTS, values):
+                for token in tokenize(value):
+                    doc_weights = weights[token]
+                    doc_weights[function_id] = doc_weights.get(function_id, 0.0) + weight
+
+        self.postings = {}
+        for token, doc_weights in weights.items():
+            idf = math.log(1 + doc_count / len(doc_weights))
+            self.postings[token] = {function_id: weight * idf for function_id, weight in doc_weights.items()}
+        self.vocabulary = sorted(self.postings)
+        self.name_ids = dict(name_ids)
+        self.doc_count = doc_count
+
+    @classmethod
+    def build(cls):
+        fields = [field for field, _ in FIELD_WEIGHTS]
+        rows = (
+            Function.objects
+            .order_by('function_id')
+            .values_list('function_id', *fields)
+            .iterator(chunk_size=2000)
+        )
+        return cls(rows)
+
+    def _expand(self, term, prefix):
+        if not prefix:
+            return [term] if term in self.postings else []
+        start = bisect_left(self.vocabulary, term)
+        matches = []
+        for token in self.vocabulary[start:start + MAX_PREFIX_EXPANSIONS]:
+            if not token.startswith(term):
+                break
+            matches.append(token)
+        return matches
+
+    def _term_scores(self, term, prefix):
+        tokens = self._expand(term, prefix)
+        if len(tokens) == 1:
+            return self.postings[tokens[0]]
+        term_scores = {}
+        for token in tokens:
+            for function_id, score in self.postings[token].items():
+                if score > term_scores.get(function_id, 0.0):
+                    term_scores[function_id] = score
+        return term_scores
+
+    def search(self, search):
+        """返回 {函数ID: 得分}，所有查询词项都必须命中；返回的字典不可修改"""
+        terms = _query_terms(search)
+        if not terms:
+            return {}
+
+        scores = None
+        for term, prefix in terms:
+            term_scores = self._term_scores(term, prefix)
+            if scores is None:
+                scores = term_scores
+            else:
+                smaller, larger = sorted((scores, term_scores), key=len)
+                scores = {
+                    function_id: score + larger[function_id]
+                    for function_id, score in smaller.items()
+                    if function_id in larger
+                }
+            if not scores:
+                return {}
+
+        exact_ids = [
+            function_id for function_id in self.name_ids.get(search.strip().lower(), [])
+            if function_id in scores
+        ]
+        if exact_ids:
+            scores = dict(scores)
+            for function_id in exact_ids:
+                scores[function_id] += 100.0
+        return scores
+
+
+_index_state = {'generation': None, 'index': None}
+
+
+def get_inverted_index():
+    """获取倒排索引，函数库数据变更后重新构建"""
+    generation = caching.get_generation(FUNCTION_LIBRARY_CACHE)
+    if _index_state['index'] is None or _index_state['generation'] != generation:
+        _index_state['index'] = InvertedIndex.build()
+        _index_state['generation'] = generation
+    return _index_state['index']
+
+
+class RankedResults:
+    """按得分从高到低分页读取 queryset 的结果序列，供 Paginator 使用"""
+
+    def __init__(self, queryset, scores):
+        self.queryset = queryset
+        self.scores = scores
+
+    def __len__(self):
+        return len(self.scores)
+
+    def count(self):
+        return len(self.scores)
+
+    def ranked_ids(self, stop=None):
+        """得分最高的前 stop 个函数ID，只需前几页时避免整体排序"""
+        if stop is None or stop >= len(self.scores):
+            return sorted(self.scores, key=self.scores.__getitem__, reverse=True)
+        return heapq.nlargest(stop, self.scores, key=self.scores.__getitem__)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            page_ids = self.ranked_ids(index.stop)[index]
+            functions = self.queryset.in_bulk(page_ids)
+            return [functions[function_id] for function_id in page_ids if function_id in functions]
+        return self[index:index + 1][0]
+
+
+def _search_inverted_index(queryset, search):
+    scores = get_inverted_index().search(search)
+    if scores and queryset.query.has_filters():
+        allowed = set(queryset.values_list('function_id', flat=True))
+        scores = {function_id: score for function_id, score in scores.items() if function_id in allowed}
+    return RankedResults(queryset.order_by(), scores)
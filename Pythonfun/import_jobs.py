@@ -0,0 +1,185 @@
+"""
+函数数据后台导入任务
+上传的文件先保存为临时文件并登记为导入任务，由进程内的单线程工作池依次执行，
+无需额外的消息队列。导入在一个事务内完成，执行过程中的进度写入任务记录供状态接口轮询。
+
+进程内线程只适用于常驻的 gunicorn 进程，需设置 IMPORT_JOBS_BACKGROUND 开启：
+Vercel 等无服务器环境在返回响应后冻结实例，后台线程不会继续执行。
+worker 回收或重启时未完成的任务随进程丢失，fail_stale_jobs 把超过 IMPORT_JOB_TIMEOUT
+没有进度的任务标记为失败并删除临时文件。
+"""
+import logging
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, connection
+from django.utils import timezone
+
+from .function_import import FunctionImporter, read_import_file
+from .models import ImportJob
+
+logger = logging.getLogger(__name__)
+
+# 状态接口最多返回的错误条数
+MAX_REPORTED_ERRORS = 10
+
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='function-import')
+
+# 导入在事务内执行，事务提交前其他连接看不到其中的写入；
+# 后台任务的进度由单独的线程（单独的数据库连接）在事务外写入
+_progress_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='function-import-progress')
+
+
+def enqueue_import(uploaded_file, file_extension):
+    """保存上传文件并创建导入任务，返回任务对象"""
+    fail_stale_jobs()
+
+    with tempfile.NamedTemporaryFile(suffix=file_extension, delete=False) as temp_file:
+        for chunk in uploaded_file.chunks():
+            temp_file.write(chunk)
+
+    job = ImportJob.objects.create(file_name=uploaded_file.name, file_path=temp_file.name)
+
+    # IMPORT_JOBS_EAGER 为真时在当前线程内直接执行（用于测试）
+    if getattr(settings, 'IMPORT_JOBS_EAGER', False):
+        run_import_job(job.job_id)
+    else:
+        _executor.submit(_run_in_worker, job.job_id)
+    return job
+
+
+def _run_in_worker(job_id):
+    close_old_connections()
+    try:
+        run_import_job(job_id, separate_progress_connection=True)
+    finally:
+        connection.close()
+        _progress_executor.submit(connection.close).result()
+
+
+def save_progress(job_id, importer):
+    """把导入进度写入任务记录，同时作为心跳刷新 updated_at"""
+    ImportJob.objects.filter(job_id=job_id).update(
+        total_rows=importer.total_rows,
+        processed_rows=importer.processed_rows,
+        error_count=len(importer.errors),
+        updated_at=timezone.now(),
+    )
+
+
+def _save_progress_outside_transaction(job_id, importer):
+    try:
+        _progress_executor.submit(save_progress, job_id, importer).result()
+    except DatabaseError as e:
+        # 进度只用于展示，写入失败不影响导入
+        logger.warning('导入任务 %s 进度写入失败: %s', job_id, e)
+        _progress_executor.submit(connection.close).result()
+
+
+def run_import_job(job_id, separate_progress_connection=False):
+    """
+    执行导入任务，结束后记录结果并删除临时文件
+    任务在执行期间被 fail_stale_jobs 标记为失败时不再覆盖其状态，返回数据库中的任务记录
+    """
+    job = ImportJob.objects.get(job_id=job_id)
+    job.status = ImportJob.STATUS_RUNNING
+    job.started_at = timezone.now()
+    job.save(update_fields=['status', 'started_at', 'updated_at'])
+
+    def report(importer):
+        if separate_progress_connection:
+            _save_progress_outside_transaction(job_id, importer)
+        else:
+            save_progress(job_id, importer)
+
+    importer = FunctionImporter(progress_callback=report)
+    try:
+        with open(job.file_path, 'rb') as file:
+            sheets = read_import_file(file, os.path.splitext(job.file_path)[1], importer.errors)
+        importer.run(sheets)
+        job.status = ImportJob.STATUS_SUCCEEDED
+        job.message = f'文件处理完成。成功导入 {importer.success_count} 条记录。'
+    except Exception as e:
+        job.status = ImportJob.STATUS_FAILED
+        job.message = f'上传失败: {str(e)}'
+    finally:
+        _remove_file(job.file_path)
+
+    updated = ImportJob.objects.filter(job_id=job_id, status=ImportJob.STATUS_RUNNING).update(
+        status=job.status,
+        message=job.message,
+        total_rows=importer.total_rows,
+        processed_rows=importer.processed_rows,
+        success_count=importer.success_count,
+        errors=importer.errors,
+        error_count=len(importer.errors),
+        finished_at=timezone.now(),
+        updated_at=timezone.now(),
+    )
+    if not updated:
+        logger.warning('导入任务 %s 已不在导入中（可能已被标记为超时），不再写入结果', job_id)
+    job.refresh_from_db()
+    return job
+
+
+def _remove_file(path):
+    if path and os.path.exists(path):
+        os.remove(path)
+
+
+def fail_stale_jobs(timeout=None):
+    """
+    把超过 timeout 秒（默认 IMPORT_JOB_TIMEOUT）没有进度的排队中/导入中任务标记为失败，
+    删除其临时文件，返回标记的任务数
+    执行任务的进程退出后（worker 回收、重启、部署）任务不会再更新，由此清理
+    """
+    if timeout is None:
+        timeout = settings.IMPORT_JOB_TIMEOUT
+    active = [ImportJob.STATUS_PENDING, ImportJob.STATUS_RUNNING]
+    stale = ImportJob.objects.filter(
+        status__in=active, updated_at__lt=timezone.now() - timedelta(seconds=timeout)
+    ).values_list('job_id', 'file_path')
+
+    count = 0
+    for job_id, file_path in stale:
+        # 只在状态未被其他进程改变时标记，避免覆盖刚刚完成的任务
+        updated = ImportJob.objects.filter(job_id=job_id, status__in=active).update(
+            status=ImportJob.STATUS_FAILED,
+            message=f'导入任务超时：{timeout} 秒内没有进度，执行导入的进程可能已退出，请重新上传',
+            finished_at=timezone.now(),
+            updated_at=timezone.now(),
+        )
+        if updated:
+            _remove_file(file_path)
+            count += 1
+    if count:
+        logger.warning('已将 %s 个超时的导入任务标记为失败', count)
+    return count
+
+
+def get_job_status(job):
+    """导入任务状态：进度、错误及吞吐量（行/秒）"""
+    rows_per_second = 0.0
+    if job.started_at:
+        elapsed = ((job.finished_at or timezone.now()) - job.started_at).total_seconds()
+        if elapsed > 0:
+            rows_per_second = round(job.processed_rows / elapsed, 1)
+
+    return {
+        'job_id': str(job.job_id),
+        'file_name': job.file_name,
+        'status': job.status,
+        'status_display': job.get_status_display(),
+        'total_rows': job.total_rows,
+        'processed_rows': job.processed_rows,
+        'success_count': job.success_count,
+        'error_count': job.error_count,
+        'errors': job.errors[:MAX_REPORTED_ERRORS],
+        'rows_per_second': rows_per_second,
+        'message': job.message,
+        'created_at': job.created_at.isoformat(),
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+    }
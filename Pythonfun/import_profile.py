@@ -0,0 +1,144 @@
+"""
+冷启动导入分析
+Vercel 以 mysite/wsgi.py 作为无服务器函数部署，冷启动时导入 WSGI 应用和URL配置的耗时直接计入用户的首个请求。
+在子进程中以 python -X importtime 启动应用，汇总各模块/包的导入耗时；
+另用测试数据库在子进程中访问只读前台页面，检查是否导入了 pandas、openpyxl 等重量级模块
+（这些模块只应在Excel导入导出时按需导入）。
+"""
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+
+# 只读前台页面和接口不允许导入的模块（按顶层包名匹配）
+HEAVY_MODULES = ('pandas', 'numpy', 'openpyxl', 'markdown', 'lxml', 'xlrd')
+
+# 加载设置时导入的第三方模块：Django 已导入其依赖（logging、urllib 等），累计耗时即额外开销
+SETTINGS_MODULES = ('dj_database_url', 'decouple')
+
+# 只读请求（见 benchmark.RequestPlan），用于检查页面访问时导入的模块
+READ_ONLY_REQUESTS = (
+    'index', 'category', 'tutorial_detail', 'function_library', 'function_library_api',
+    'function_query', 'function_search', 'function_lists',
+)
+
+# 无服务器函数冷启动：导入 WSGI 应用（含 django.setup()）并加载URL配置（导入全部视图）
+STARTUP_SCRIPT = '''
+import json, sys, time
+start = time.perf_counter()
+import mysite.wsgi
+from django.urls import get_resolver
+get_resolver().url_patterns
+elapsed = time.perf_counter() - start
+print(json.dumps({'startup_ms': round(elapsed * 1000, 1), 'modules': sorted(sys.modules)}))
+'''
+
+# 用内存中的测试数据库访问只读页面，输出各请求的状态码和最终加载的模块
+FRONT_PAGES_SCRIPT = '''
+import json, os, sys
+sys.argv = ['manage.py', 'test']
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'mysite.settings')
+import django
+django.setup()
+from django.conf import settings
+from django.test import Client
+from django.test.utils import get_runner, setup_test_environment
+from Pythonfun.benchmark import RequestPlan, seed_dataset
+
+setup_test_environment()
+runner = get_runner(settings)(verbosity=0)
+old_config = runner.setup_databases()
+seed_dataset({
+    'main_categories': 2, 'sub_categories': 2, 'articles': 2,
+    'libraries': 1, 'modules': 2, 'functions': 3, 'parameters': 1,
+})
+client = Client()
+statuses = {}
+for name in %(requests)r:
+    _, method, path, _ = RequestPlan(mix={name: 1}).next_request()
+    statuses[path] = client.generic(method, path, HTTP_ACCEPT_ENCODING='gzip, br').status_code
+runner.teardown_databases(old_config)
+print(json.dumps({'statuses': statuses, 'modules': sorted(sys.modules)}))
+'''
+
+
+def parse_importtime(output):
+    """
+    解析 -X importtime 的输出，返回 [(模块名, 自身耗时微秒, 累计耗时微秒, 嵌套层级), ...]
+    输出格式：import time: self [us] | cumulative | imported package
+    """
+    records = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        records.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return records
+
+
+def summarize_imports(records, top=15):
+    """汇总导入耗时：总耗时、按顶层包累计的自身耗时、累计耗时最长的模块"""
+    packages = defaultdict(int)
+    for name, self_us, _, _ in records:
+        packages[name.split('.')[0]] += self_us
+    return {
+        'import_ms': round(sum(self_us for _, self_us, _, _ in records) / 1000, 1),
+        'module_count': len(records),
+        'packages': [
+            (package, round(self_us / 1000, 1))
+            for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]
+        ],
+        'slowest': [
+            (name, round(cumulative_us / 1000, 1))
+            for name, _, cumulative_us, _ in sorted(records, key=lambda record: -record[2])[:top]
+        ],
+    }
+
+
+def settings_imports(records):
+    """加载设置时导入的第三方模块及其累计耗时（毫秒）"""
+    return [
+        (name, round(cumulative_us / 1000, 1))
+        for name, _, cumulative_us, _ in records if name in SETTINGS_MODULES
+    ]
+
+
+def heavy_modules(modules):
+    """已加载模块中的重量级模块（顶层包名）"""
+    return sorted({name.split('.')[0] for name in modules} & set(HEAVY_MODULES))
+
+
+def _run(script, env=None):
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', script],
+        cwd=settings.BASE_DIR, env={**os.environ, **(env or {})},
+        capture_output=True, text=True, check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f'子进程执行失败：\n{result.stderr[-2000:]}')
+    # 应用启动时可能有其他输出，结果在最后一行
+    return json.loads(result.stdout.strip().splitlines()[-1]), parse_importtime(result.stderr)
+
+
+def profile_startup(top=15, env=None):
+    """在新的子进程中冷启动 WSGI 应用，返回启动耗时、导入耗时汇总和加载的重量级模块"""
+    data, records = _run(STARTUP_SCRIPT, env)
+    return {
+        'startup_ms': data['startup_ms'],
+        **summarize_imports(records, top),
+        'settings_imports': settings_imports(records),
+        'heavy_modules': heavy_modules(data['modules']),
+    }
+
+
+def profile_front_pages():
+    """在新的子进程中访问只读前台页面，返回各请求状态码和加载的重量级模块"""
+    data, _ = _run(FRONT_PAGES_SCRIPT % {'requests': READ_ONLY_REQUESTS})
+    return {
+        'statuses': data['statuses'],
+        'heavy_modules': heavy_modules(data['modules']),
+    }
@@ -0,0 +1,38 @@
+"""
+模板构建检查：用缓存模板加载器预先解析 templates/ 下的全部模板，有语法错误时以错误退出
+vercel-build 中在部署前运行，模板错误在构建阶段暴露，而不是在用户请求时
+用法：
+    python manage.py check_templates --settings=mysite.settings_production
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from Pythonfun.warmup import compile_templates
+
+# 检查的模板子目录
+TEMPLATE_SUBDIRS = ('front', 'admin')
+
+
+class Command(BaseCommand):
+    help = '预先解析项目模板，模板有语法错误时构建失败'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dirs', nargs='+', default=list(TEMPLATE_SUBDIRS),
+            help=f'templates/ 下要检查的子目录（默认 {" ".join(TEMPLATE_SUBDIRS)}）'
+        )
+
+    def handle(self, *args, **options):
+        errors = []
+        start = time.perf_counter()
+        count = compile_templates(subdirs=options['dirs'], errors=errors)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        for name, message in errors:
+            self.stderr.write(f'{name}: {message}')
+        if errors:
+            raise CommandError(f'{len(errors)} 个模板解析失败')
+        if not count:
+            raise CommandError(f'没有找到模板：{" ".join(options["dirs"])}')
+        self.stdout.write(self.style.SUCCESS(f'{count} 个模板解析通过（{elapsed:.1f}ms）'))
@@ -0,0 +1,66 @@
+"""
+冷启动导入分析：在子进程中以 python -X importtime 冷启动 WSGI 应用（Vercel 无服务器函数的入口），
+输出启动耗时、按包汇总的导入耗时和最慢的模块；超出 STARTUP_BUDGET_MS 或加载了重量级模块时以错误退出
+用法：
+    python manage.py profile_imports
+    # 同时检查只读前台页面是否导入 pandas/openpyxl 等模块（使用内存测试数据库）
+    python manage.py profile_imports --pages --output startup.json
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from Pythonfun.benchmark import dump_report
+from Pythonfun.import_profile import profile_front_pages, profile_startup
+
+
+class Command(BaseCommand):
+    help = '分析冷启动时的模块导入耗时，检查启动预算和只读页面导入的重量级模块'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=15, help='显示耗时最长的包/模块数量（默认 15）')
+        parser.add_argument('--pages', action='store_true', help='同时访问只读前台页面，检查导入的模块')
+        parser.add_argument(
+            '--budget-ms', type=float, default=settings.STARTUP_BUDGET_MS,
+            help='启动耗时预算毫秒数（默认取 STARTUP_BUDGET_MS）'
+        )
+        parser.add_argument('--output', help='JSON 报告输出路径')
+
+    def handle(self, *args, **options):
+        report = {'startup': profile_startup(top=options['top'])}
+        startup = report['startup']
+        self.stdout.write(
+            f'启动耗时 {startup["startup_ms"]}ms（预算 {options["budget_ms"]}ms），'
+            f'导入 {startup["module_count"]} 个模块共 {startup["import_ms"]}ms'
+        )
+        self.stdout.write('\n按包汇总（自身耗时）:')
+        for package, ms in startup['packages']:
+            self.stdout.write(f'  {ms:>8}ms  {package}')
+        self.stdout.write('\n最慢的模块（累计耗时）:')
+        for name, ms in startup['slowest']:
+            self.stdout.write(f'  {ms:>8}ms  {name}')
+        self.stdout.write('\n设置文件导入的模块（累计耗时）:')
+        for name, ms in startup['settings_imports']:
+            self.stdout.write(f'  {ms:>8}ms  {name}')
+
+        problems = []
+        if startup['startup_ms'] > options['budget_ms']:
+            problems.append(f'启动耗时 {startup["startup_ms"]}ms 超出预算 {options["budget_ms"]}ms')
+        if startup['heavy_modules']:
+            problems.append(f'启动时导入了重量级模块: {", ".join(startup["heavy_modules"])}')
+
+        if options['pages']:
+            report['pages'] = profile_front_pages()
+            self.stdout.write('\n只读页面:')
+            for path, status in report['pages']['statuses'].items():
+                self.stdout.write(f'  {status}  {path}')
+            if report['pages']['heavy_modules']:
+                problems.append(f'只读页面导入了重量级模块: {", ".join(report["pages"]["heavy_modules"])}')
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(dump_report(report))
+            self.stdout.write(self.style.SUCCESS(f'报告已写入 {options["output"]}'))
+
+        if problems:
+            raise CommandError('；'.join(problems))
+        self.stdout.write(self.style.SUCCESS('\n冷启动检查通过'))
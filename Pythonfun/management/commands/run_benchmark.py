@@ -0,0 +1,67 @@
+"""
+按真实请求比例回放请求并输出性能报告
+用法：
+    python manage.py run_benchmark --requests 1000 --output bench.json
+    python manage.py run_benchmark --url http://127.0.0.1:8000 --concurrency 8 --baseline bench.json
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from Pythonfun.benchmark import (
+    REQUEST_MIX, ClientTarget, HttpTarget, RequestPlan,
+    build_report, dump_report, format_report, run_benchmark,
+)
+from Pythonfun.models import Article, Function
+
+
+class Command(BaseCommand):
+    help = '回放前台页面和接口请求，统计吞吐量、延迟分位数和每个请求的查询次数'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=500, help='计入报告的请求数（默认 500）')
+        parser.add_argument('--warmup', type=int, default=50, help='预热请求数，不计入报告（默认 50）')
+        parser.add_argument('--seed', type=int, default=0, help='随机种子，相同种子回放相同的请求序列')
+        parser.add_argument('--url', help='服务地址（如本地 gunicorn），不指定时使用进程内的测试客户端')
+        parser.add_argument('--concurrency', type=int, default=1, help='并发数，仅在指定 --url 时有效')
+        parser.add_argument(
+            '--exclude', nargs='*', default=[], choices=list(REQUEST_MIX),
+            help='不回放的请求，如 --exclude import_xlsx export_csv'
+        )
+        parser.add_argument('--output', help='JSON 报告输出路径')
+        parser.add_argument('--baseline', help='对比的基准 JSON 报告')
+
+    def handle(self, *args, **options):
+        mix = {name: weight for name, weight in REQUEST_MIX.items() if name not in options['exclude']}
+        plan = RequestPlan(seed=options['seed'], mix=mix)
+        if not plan.article_ids or not plan.modules:
+            raise CommandError('没有可用的文章或函数数据，请先运行 seed_benchmark_data')
+
+        target = HttpTarget(options['url']) if options['url'] else ClientTarget()
+        results, elapsed = run_benchmark(
+            target, plan, requests=options['requests'], warmup=options['warmup'],
+            concurrency=options['concurrency']
+        )
+        report = build_report(results, elapsed, meta={
+            'target': options['url'] or 'client',
+            'concurrency': options['concurrency'] if options['url'] else 1,
+            'requests': options['requests'],
+            'warmup': options['warmup'],
+            'seed': options['seed'],
+            'mix': mix,
+            'dataset': {
+                'articles': Article.objects.count(),
+                'functions': Function.objects.count(),
+            },
+        })
+
+        baseline = None
+        if options['baseline']:
+            with open(options['baseline'], encoding='utf-8') as f:
+                baseline = json.load(f)
+        self.stdout.write(format_report(report, baseline))
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(dump_report(report))
+            self.stdout.write(self.style.SUCCESS(f'报告已写入 {options["output"]}'))
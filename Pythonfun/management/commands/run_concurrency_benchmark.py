@@ -0,0 +1,81 @@
+"""
+并发扩展测试：固定 worker 数量，逐级提高并发数，观察只读接口的吞吐量和延迟
+用法：
+    # 进程内：一个 ASGI worker，每条SQL模拟 20ms 网络往返
+    python manage.py run_concurrency_benchmark --db-latency-ms 20
+    # 同样条件下的一个同步 worker，作为对照
+    python manage.py run_concurrency_benchmark --db-latency-ms 20 --wsgi
+    # 已启动的服务：分别用 gunicorn.conf.py 和 gunicorn-asgi.conf.py 以相同 worker 数启动后对比
+    python manage.py run_concurrency_benchmark --url http://127.0.0.1:8000 --output asgi.json
+"""
+from django.core.management.base import BaseCommand, CommandError
+
+from Pythonfun.benchmark import (
+    API_MIX, CONCURRENCY_LEVELS, AsgiTarget, ClientTarget, HttpTarget, RequestPlan,
+    dump_report, install_db_latency, run_concurrency_sweep,
+)
+
+SWEEP_COLUMNS = ('requests', 'errors', 'throughput_rps', 'p50_ms', 'p95_ms', 'p99_ms')
+
+
+class Command(BaseCommand):
+    help = '固定 worker 数量，逐级提高并发数回放只读JSON接口请求，输出吞吐量和延迟分位数'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--levels', type=int, nargs='+', default=list(CONCURRENCY_LEVELS),
+            help=f'并发级别（默认 {" ".join(map(str, CONCURRENCY_LEVELS))}）'
+        )
+        parser.add_argument('--requests', type=int, default=200, help='每个并发级别的请求数（默认 200）')
+        parser.add_argument('--warmup', type=int, default=20, help='每个并发级别的预热请求数（默认 20）')
+        parser.add_argument('--seed', type=int, default=0, help='随机种子')
+        parser.add_argument('--url', help='服务地址，不指定时在进程内调用 ASGI 应用')
+        parser.add_argument('--wsgi', action='store_true', help='进程内使用同步处理（测试客户端）作为对照')
+        parser.add_argument(
+            '--db-latency-ms', type=float, default=0,
+            help='进程内测试时每条SQL模拟的网络往返毫秒数'
+        )
+        parser.add_argument('--output', help='JSON 报告输出路径')
+
+    def handle(self, *args, **options):
+        plan = RequestPlan(seed=options['seed'], mix=API_MIX)
+        if not plan.modules:
+            raise CommandError('没有可用的函数数据，请先运行 seed_benchmark_data')
+        if options['url'] and options['db_latency_ms']:
+            raise CommandError('--db-latency-ms 只用于进程内测试')
+
+        if options['url']:
+            target, target_name = HttpTarget(options['url']), options['url']
+        elif options['wsgi']:
+            target, target_name = ClientTarget(), 'wsgi'
+        else:
+            target, target_name = AsgiTarget(), 'asgi'
+
+        uninstall = install_db_latency(options['db_latency_ms'] / 1000) if options['db_latency_ms'] else None
+        try:
+            sweep = run_concurrency_sweep(
+                target, plan, levels=options['levels'],
+                requests=options['requests'], warmup=options['warmup']
+            )
+        finally:
+            if uninstall:
+                uninstall()
+
+        self.stdout.write('{:<14}'.format('concurrency') + ''.join(f'{column:>16}' for column in SWEEP_COLUMNS))
+        for level, summary in sweep.items():
+            self.stdout.write(f'{level:<14}' + ''.join(f'{str(summary[column]):>16}' for column in SWEEP_COLUMNS))
+
+        if options['output']:
+            report = {
+                'meta': {
+                    'target': target_name,
+                    'db_latency_ms': options['db_latency_ms'],
+                    'requests': options['requests'],
+                    'seed': options['seed'],
+                    'mix': API_MIX,
+                },
+                'concurrency': sweep,
+            }
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(dump_report(report))
+            self.stdout.write(self.style.SUCCESS(f'报告已写入 {options["output"]}'))
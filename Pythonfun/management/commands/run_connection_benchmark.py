@@ -0,0 +1,74 @@
+"""
+数据库连接复用测试：一个同步 worker 分别以每个请求新建连接和持久连接回放只读接口请求，对比延迟
+需要连接真实的 PostgreSQL（开发环境的 Supabase 连接池或 DATABASE_URL）；
+测试用的内存 SQLite 不会真正关闭连接，无法体现差别。
+用法：
+    python manage.py run_connection_benchmark
+    # 本地 PostgreSQL 没有远程握手开销，可以模拟每次建立连接的耗时
+    python manage.py run_connection_benchmark --connect-latency-ms 60 --output connections.json
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from Pythonfun.benchmark import (
+    API_MIX, RequestPlan, dump_report, install_connect_latency, run_connection_benchmark,
+)
+
+MODE_COLUMNS = ('requests', 'errors', 'connections', 'p50_ms', 'p95_ms', 'p99_ms', 'mean_ms')
+
+
+class Command(BaseCommand):
+    help = '对比每个请求新建数据库连接与持久连接下的请求延迟'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='每种模式的请求数（默认 200）')
+        parser.add_argument('--warmup', type=int, default=20, help='每种模式的预热请求数（默认 20）')
+        parser.add_argument('--seed', type=int, default=0, help='随机种子')
+        parser.add_argument(
+            '--conn-max-age', type=int, default=settings.DB_CONN_MAX_AGE or 600,
+            help='持久连接模式的 CONN_MAX_AGE 秒数（默认取 DB_CONN_MAX_AGE）'
+        )
+        parser.add_argument(
+            '--connect-latency-ms', type=float, default=0,
+            help='每次建立连接额外等待的毫秒数，模拟远程数据库的握手开销'
+        )
+        parser.add_argument('--output', help='JSON 报告输出路径')
+
+    def handle(self, *args, **options):
+        plan = RequestPlan(seed=options['seed'], mix=API_MIX)
+        if not plan.modules:
+            raise CommandError('没有可用的函数数据，请先运行 seed_benchmark_data')
+
+        uninstall = (
+            install_connect_latency(options['connect_latency_ms'] / 1000)
+            if options['connect_latency_ms'] else None
+        )
+        try:
+            modes = run_connection_benchmark(
+                plan, conn_max_age=options['conn_max_age'],
+                requests=options['requests'], warmup=options['warmup']
+            )
+        finally:
+            if uninstall:
+                uninstall()
+
+        self.stdout.write('{:<14}'.format('mode') + ''.join(f'{column:>14}' for column in MODE_COLUMNS))
+        for mode, summary in modes.items():
+            self.stdout.write(f'{mode:<14}' + ''.join(f'{str(summary[column]):>14}' for column in MODE_COLUMNS))
+        saved = modes['per_request']['p50_ms'] - modes['persistent']['p50_ms']
+        self.stdout.write(f'持久连接 p50 降低 {saved:.1f}ms')
+
+        if options['output']:
+            report = {
+                'meta': {
+                    'conn_max_age': options['conn_max_age'],
+                    'connect_latency_ms': options['connect_latency_ms'],
+                    'requests': options['requests'],
+                    'seed': options['seed'],
+                    'mix': API_MIX,
+                },
+                'modes': modes,
+            }
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(dump_report(report))
+            self.stdout.write(self.style.SUCCESS(f'报告已写入 {options["output"]}'))
@@ -0,0 +1,33 @@
+"""
+生成性能基准测试使用的合成数据集
+用法：python manage.py seed_benchmark_data --articles 20 --functions 100 --clear
+"""
+from django.core.management.base import BaseCommand
+
+from Pythonfun.benchmark import DEFAULT_COUNTS, clear_dataset, seed_dataset
+
+
+class Command(BaseCommand):
+    help = '生成性能基准测试使用的合成数据集（分类、文章、函数库）'
+
+    def add_arguments(self, parser):
+        for name, default in DEFAULT_COUNTS.items():
+            parser.add_argument(
+                f'--{name.replace("_", "-")}', type=int, default=default, dest=name,
+                help=f'{name} 数量（默认 {default}，子级数量为每个上级下的数量）'
+            )
+        parser.add_argument('--seed', type=int, default=0, help='随机种子，相同参数生成相同的数据')
+        parser.add_argument('--clear', action='store_true', help='生成前删除已有的合成数据')
+        parser.add_argument('--clear-only', action='store_true', help='只删除已有的合成数据')
+
+    def handle(self, *args, **options):
+        if options['clear'] or options['clear_only']:
+            clear_dataset()
+            self.stdout.write('已删除合成数据')
+            if options['clear_only']:
+                return
+
+        counts = seed_dataset({name: options[name] for name in DEFAULT_COUNTS}, seed=options['seed'])
+        for name, count in counts.items():
+            self.stdout.write(f'{name}: {count}')
+        self.stdout.write(self.style.SUCCESS('合成数据生成完成'))
@@ -0,0 +1,143 @@
+"""
+中间件
+前台页面整页缓存：匿名访问者看到的前台页面完全相同，渲染结果按路径及视图读取的查询参数缓存并附带 ETag，
+条件请求命中时直接返回 304，不执行视图也不渲染模板。
+页面依赖的数据变更时（信号递增缓存代数）缓存自然失效。
+不提供 Last-Modified：各表最近的 updated_at 反映不了删除及分类等没有 updated_at 的表的变更，
+会对已变化的页面返回 304；ETag 由页面内容计算，内容变化即变化。
+管理员可以预览未发布的文章，页面内容不同，不使用缓存。
+各中间件同时支持 WSGI 和 ASGI，ASGI 下异步视图不会因为中间件而被放到线程中执行。
+"""
+import hashlib
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+from . import caching
+from .category_tree import CACHE_NAMESPACE as CATEGORY_TREE_CACHE
+from .function_catalog import CACHE_NAMESPACE as FUNCTION_LIBRARY_CACHE
+
+# 页面依赖的数据：数据变更时递增代数的缓存命名空间
+PAGE_DEPENDENCIES = {
+    'articles': CATEGORY_TREE_CACHE,
+    'functions': FUNCTION_LIBRARY_CACHE,
+}
+
+# 可缓存的页面（URL名称）及其依赖的数据
+CACHED_PAGES = {
+    'index': 'articles',
+    'category': 'articles',
+    'tutorial_detail': 'articles',
+    'data_structure': 'articles',
+    'ai_programming': 'articles',
+    'function_library': 'functions',
+    'function_query': 'functions',
+}
+
+# 视图读取的查询参数及其取值，只有这些参数参与缓存键；
+# 带其他参数或其他取值的请求不使用缓存，避免任意查询字符串产生无限多的缓存条目
+PAGE_QUERY_PARAMS = {
+    'category': {'type': ('grammar', 'data-structure', 'ai-programming')},
+}
+
+
+def page_cache_key(url_name, request):
+    """页面缓存键：路径加视图读取的查询参数；带有未知参数或取值时返回 None"""
+    allowed = PAGE_QUERY_PARAMS.get(url_name, {})
+    if any(name not in allowed for name in request.GET):
+        return None
+    params = []
+    for name, values in allowed.items():
+        value = request.GET.get(name)
+        if value is None:
+            continue
+        if value not in values:
+            return None
+        params.append(f'{name}={value}')
+    return f"{request.path}?{'&'.join(params)}"
+
+
+class FrontPageCacheMiddleware(MiddlewareMixin):
+    """前台页面整页缓存及条件请求处理，需放在 AuthenticationMiddleware 之后"""
+
+    def process_response(self, request, response):
+        page = getattr(request, '_front_page', None)
+        if page is None or response.status_code != 200 or response.streaming or response.cookies:
+            return response
+
+        # 缓存未命中：保存渲染结果
+        cache_key = page
+        entry = {
+            'content': response.content,
+            'content_type': response['Content-Type'],
+            'etag': f'"{hashlib.sha1(response.content).hexdigest()}"',
+        }
+        cache.set(cache_key, entry, caching.default_timeout())
+        return self._respond(request, entry, response)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return None
+        match = request.resolver_match
+        if match.namespace != 'Pythonfun' or match.url_name not in CACHED_PAGES:
+            return None
+        if request.user.is_authenticated and request.user.is_staff:
+            return None
+
+        page_key = page_cache_key(match.url_name, request)
+        if page_key is None:
+            return None
+        namespace = PAGE_DEPENDENCIES[CACHED_PAGES[match.url_name]]
+        cache_key = caching.versioned_key(namespace, f'page:{settings.PAGE_CACHE_VERSION}:{page_key}')
+        entry = cache.get(cache_key)
+        if entry is None:
+            request._front_page = cache_key
+            return None
+        return self._respond(request, entry)
+
+    def _respond(self, request, entry, response=None):
+        conditional = get_conditional_response(request, etag=entry['etag'])
+        if conditional is not None:
+            response = conditional
+        elif response is None:
+            response = HttpResponse(entry['content'], content_type=entry['content_type'])
+
+        response['ETag'] = entry['etag']
+        # 浏览器每次都带验证器重新验证，管理员登录后不能复用匿名页面
+        patch_cache_control(response, no_cache=True)
+        patch_vary_headers(response, ('Cookie',))
+        return response
+
+
+class StaticFilesMiddleware(WhiteNoiseMiddleware):
+    """
+    同时支持 WSGI 和 ASGI 的 WhiteNoise 中间件
+    WhiteNoise 只提供同步版本，ASGI 下会让后面的整条中间件链和视图都在线程中执行；
+    静态文件查找只是内存字典查询，直接在事件循环中完成
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response=None, settings=settings):
+        super().__init__(get_response, settings)
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        if self.autorefresh:
+            static_file = self.find_file(request.path_info)
+        else:
+            static_file = self.files.get(request.path_info)
+        if static_file is not None:
+            return self.serve(static_file, request)
+        return await self.get_response(request)
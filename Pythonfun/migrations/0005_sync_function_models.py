@@ -0,0 +1,130 @@
+# Generated by Django 5.0.7 on 2026-10-18 06:21
+
+import django.utils.timezone
+from django.db import migrations, models
+
+# 模型与迁移记录不一致：线上数据库的 function_* 表及新增列是在迁移之外建立的，
+# 而迁移 0003 建立的是 library_info 等旧表。只调整状态，数据库按实际结构补齐缺少的部分：
+# 新表名已存在时不改名（旧表保留不动），已有的列不再添加。
+RENAMED_TABLES = [
+    ('library', 'library_info', 'function_library'),
+    ('module', 'module_info', 'function_module'),
+    ('operationtype', 'operation_type', 'function_operation_type'),
+    ('parameter', 'parameter_info', 'function_parameter'),
+]
+
+ADDED_FIELDS = [
+    ('library', 'library_type'),
+    ('module', 'module_name_cn'),
+    ('module', 'source_file'),
+    ('operationtype', 'created_at'),
+    ('operationtype', 'updated_at'),
+    ('parameter', 'constraints'),
+    ('parameter', 'example_usage'),
+    ('parameter', 'parameter_type'),
+    ('parameter', 'position'),
+]
+
+
+def sync_schema(apps, schema_editor):
+    """按当前数据库结构补齐表名和列（apps 为本迁移状态调整之后的模型）"""
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        tables = set(connection.introspection.table_names(cursor))
+
+    for model_name, old_table, new_table in RENAMED_TABLES:
+        if new_table not in tables and old_table in tables:
+            schema_editor.alter_db_table(apps.get_model('Pythonfun', model_name), old_table, new_table)
+            tables.add(new_table)
+
+    for model_name, field_name in ADDED_FIELDS:
+        model = apps.get_model('Pythonfun', model_name)
+        with connection.cursor() as cursor:
+            columns = {
+                column.name for column in connection.introspection.get_table_description(cursor, model._meta.db_table)
+            }
+        field = model._meta.get_field(field_name)
+        if field.column not in columns:
+            # created_at/updated_at 没有默认值，已有行按 auto_now 取当前时间
+            schema_editor.add_field(model, field)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Pythonfun', '0004_auto_20250815_1228'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(state_operations=[
+            migrations.AddField(
+                model_name='library',
+                name='library_type',
+                field=models.CharField(default='standard', max_length=100, verbose_name='库类型'),
+            ),
+            migrations.AddField(
+                model_name='module',
+                name='module_name_cn',
+                field=models.CharField(default='', max_length=100, verbose_name='模块中文名称'),
+            ),
+            migrations.AddField(
+                model_name='module',
+                name='source_file',
+                field=models.CharField(blank=True, max_length=200, null=True, verbose_name='源文件'),
+            ),
+            migrations.AddField(
+                model_name='operationtype',
+                name='created_at',
+                field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now, verbose_name='创建时间'),
+                preserve_default=False,
+            ),
+            migrations.AddField(
+                model_name='operationtype',
+                name='updated_at',
+                field=models.DateTimeField(auto_now=True, verbose_name='更新时间'),
+            ),
+            migrations.AddField(
+                model_name='parameter',
+                name='constraints',
+                field=models.TextField(blank=True, null=True, verbose_name='约束条件'),
+            ),
+            migrations.AddField(
+                model_name='parameter',
+                name='example_usage',
+                field=models.TextField(blank=True, null=True, verbose_name='使用示例'),
+            ),
+            migrations.AddField(
+                model_name='parameter',
+                name='parameter_type',
+                field=models.CharField(default='positional', max_length=100, verbose_name='参数类型'),
+            ),
+            migrations.AddField(
+                model_name='parameter',
+                name='position',
+                field=models.IntegerField(default=0, verbose_name='位置'),
+            ),
+            migrations.AlterField(
+                model_name='article',
+                name='content_type',
+                field=models.CharField(choices=[('GR', '语法'), ('DS', '数据结构'), ('AI', 'AI编程')], default='GR', max_length=2, verbose_name='内容类型'),
+            ),
+            migrations.AlterModelTable(
+                name='library',
+                table='function_library',
+            ),
+            migrations.AlterModelTable(
+                name='module',
+                table='function_module',
+            ),
+            migrations.AlterModelTable(
+                name='operationtype',
+                table='function_operation_type',
+            ),
+            migrations.AlterModelTable(
+                name='parameter',
+                table='function_parameter',
+            ),
+        ]),
+        # 无法判断回滚时哪些表和列是本迁移建立的，回滚只还原状态
+        migrations.RunPython(sync_schema, migrations.RunPython.noop),
+    ]
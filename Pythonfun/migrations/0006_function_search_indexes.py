@@ -0,0 +1,38 @@
+from django.db import migrations
+
+TRIGRAM_COLUMNS = ('function_name', 'function_name_cn', 'description_cn')
+
+# 全文检索索引仅在 PostgreSQL 上创建，其他数据库使用进程内倒排索引
+# 索引表达式需与 Pythonfun.function_search.search_vector_sql() 保持一致
+CREATE_SQL = [
+    'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+    "CREATE INDEX IF NOT EXISTS function_info_search_vector_idx ON function_info USING gin "
+    "((to_tsvector('simple', coalesce(function_name, '') || ' ' || coalesce(description, ''))))",
+] + [
+    f'CREATE INDEX IF NOT EXISTS function_info_{column}_trgm_idx ON function_info USING gin ({column} gin_trgm_ops)'
+    for column in TRIGRAM_COLUMNS
+]
+
+DROP_SQL = ['DROP INDEX IF EXISTS function_info_search_vector_idx'] + [
+    f'DROP INDEX IF EXISTS function_info_{column}_trgm_idx' for column in TRIGRAM_COLUMNS
+]
+
+
+def run_on_postgresql(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Pythonfun', '0005_sync_function_models'),
+    ]
+
+    operations = [
+        migrations.RunPython(run_on_postgresql(CREATE_SQL), run_on_postgresql(DROP_SQL)),
+    ]
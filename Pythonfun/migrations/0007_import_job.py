@@ -0,0 +1,37 @@
+# Generated by Django 5.0.7 on 2026-10-18 06:30
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Pythonfun', '0006_function_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportJob',
+            fields=[
+                ('job_id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='任务ID')),
+                ('file_name', models.CharField(max_length=255, verbose_name='文件名')),
+                ('file_path', models.CharField(blank=True, max_length=500, verbose_name='临时文件路径')),
+                ('status', models.CharField(choices=[('pending', '排队中'), ('running', '导入中'), ('succeeded', '已完成'), ('failed', '失败')], default='pending', max_length=20, verbose_name='状态')),
+                ('total_rows', models.PositiveIntegerField(default=0, verbose_name='总行数')),
+                ('processed_rows', models.PositiveIntegerField(default=0, verbose_name='已处理行数')),
+                ('success_count', models.PositiveIntegerField(default=0, verbose_name='成功导入数')),
+                ('errors', models.JSONField(blank=True, default=list, verbose_name='错误信息')),
+                ('message', models.TextField(blank=True, verbose_name='结果说明')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='创建时间')),
+                ('started_at', models.DateTimeField(blank=True, null=True, verbose_name='开始时间')),
+                ('finished_at', models.DateTimeField(blank=True, null=True, verbose_name='结束时间')),
+            ],
+            options={
+                'verbose_name': '导入任务',
+                'verbose_name_plural': '导入任务',
+                'db_table': 'function_import_job',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
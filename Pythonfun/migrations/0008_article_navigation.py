@@ -0,0 +1,29 @@
+# Generated by Django 5.0.7 on 2026-10-18 06:50
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Pythonfun', '0007_import_job'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleNavigation',
+            fields=[
+                ('article', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='navigation', serialize=False, to='Pythonfun.article', verbose_name='文章')),
+                ('previous', models.JSONField(blank=True, help_text='{id, title}', null=True, verbose_name='上一篇')),
+                ('next', models.JSONField(blank=True, help_text='{id, title}', null=True, verbose_name='下一篇')),
+                ('related', models.JSONField(blank=True, default=list, help_text='[{id, title}, ...]，最新发布的在前', verbose_name='相关教程')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='更新时间')),
+            ],
+            options={
+                'verbose_name': '文章导航',
+                'verbose_name_plural': '文章导航',
+                'db_table': 'article_navigation',
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.0.7 on 2026-10-18 06:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Pythonfun', '0008_article_navigation'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['content_type', 'created_at'], name='article_published_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['category', 'content_type', 'is_published', 'created_at'], name='article_category_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='function',
+            index=models.Index(fields=['module', 'function_id'], name='function_info_module_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='function',
+            index=models.Index(fields=['operation_type', 'function_id'], name='function_info_op_type_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='module',
+            index=models.Index(fields=['module_name'], name='function_module_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='operationtype',
+            index=models.Index(fields=['operation_name_cn'], name='function_op_name_cn_idx'),
+        ),
+    ]
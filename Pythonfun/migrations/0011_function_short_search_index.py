@@ -0,0 +1,44 @@
+from django.db import migrations
+
+NGRAM_COLUMNS = ('function_name_cn', 'description_cn')
+
+# 三元组索引无法加速少于 3 个字符的 ILIKE '%x%'，短查询改为匹配单字和双字数组（GIN）
+# 索引表达式需与 Pythonfun.function_search.ngram_array_sql() 保持一致
+CREATE_SQL = [
+    """
+    CREATE OR REPLACE FUNCTION function_search_ngrams(value text) RETURNS text[]
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT coalesce(array_agg(DISTINCT substr(lower(value), i, n)), '{}')
+        FROM generate_series(1, length(value)) AS i, (VALUES (1), (2)) AS sizes(n)
+        WHERE i + n - 1 <= length(value)
+    $$
+    """,
+    'CREATE INDEX IF NOT EXISTS function_info_cn_ngram_idx ON function_info USING gin (('
+    + ' || '.join(f'function_search_ngrams({column})' for column in NGRAM_COLUMNS)
+    + '))',
+]
+
+DROP_SQL = [
+    'DROP INDEX IF EXISTS function_info_cn_ngram_idx',
+    'DROP FUNCTION IF EXISTS function_search_ngrams(text)',
+]
+
+
+def run_on_postgresql(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Pythonfun', '0010_import_job_progress'),
+    ]
+
+    operations = [
+        migrations.RunPython(run_on_postgresql(CREATE_SQL), run_on_postgresql(DROP_SQL)),
+    ]
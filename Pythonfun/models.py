@@ -1,3 +1,5 @@
+import uuid
+
 from django.db import models
 from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
@@ -85,6 +87,17 @@ class Article(models.Model):
         verbose_name = _("文章")
         verbose_name_plural = verbose_name
         ordering = ['-created_at']
+        indexes = [
+            # 前台列表与默认文章：按内容类型筛选已发布文章并按创建时间排序
+            models.Index(
+                fields=['content_type', 'created_at'], name='article_published_type_idx',
+                condition=models.Q(is_published=True)
+            ),
+            # 分类页及导航索引重建：按分类、内容类型筛选并按创建时间排序
+            models.Index(
+                fields=['category', 'content_type', 'is_published', 'created_at'], name='article_category_type_idx'
+            ),
+        ]
 
     def clean(self):
         """模型验证"""
@@ -107,6 +120,26 @@ class Article(models.Model):
     def __str__(self):
         return self.title
 
+class ArticleNavigation(models.Model):
+    """
+    文章导航索引
+    同一分类、同一内容类型下已发布文章的上一篇/下一篇及相关教程，文章变更时重建，
+    详情页随文章一起读取，无需再查询同分类的文章
+    """
+    article = models.OneToOneField(Article, on_delete=models.CASCADE, primary_key=True, related_name='navigation', verbose_name=_("文章"))
+    previous = models.JSONField(_("上一篇"), blank=True, null=True, help_text=_("{id, title}"))
+    next = models.JSONField(_("下一篇"), blank=True, null=True, help_text=_("{id, title}"))
+    related = models.JSONField(_("相关教程"), default=list, blank=True, help_text=_("[{id, title}, ...]，最新发布的在前"))
+    updated_at = models.DateTimeField(_("更新时间"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("文章导航")
+        verbose_name_plural = verbose_name
+        db_table = 'article_navigation'
+
+    def __str__(self):
+        return f"{self.article} 导航"
+
 # ========== 函数库相关模型 ==========
 
 class Library(models.Model):
@@ -148,6 +181,10 @@ class Module(models.Model):
         verbose_name_plural = verbose_name
         db_table = 'function_module'
         unique_together = ('library', 'module_name')
+        indexes = [
+            # 函数查询按模块名筛选（不指定库时唯一约束的索引用不上）
+            models.Index(fields=['module_name'], name='function_module_name_idx'),
+        ]
 
     def __str__(self):
         return f"{self.library.library_name}.{self.module_name}"
@@ -165,6 +202,10 @@ class OperationType(models.Model):
         verbose_name = _("操作类型")
         verbose_name_plural = verbose_name
         db_table = 'function_operation_type'
+        indexes = [
+            # 函数查询按操作类型中文名筛选
+            models.Index(fields=['operation_name_cn'], name='function_op_name_cn_idx'),
+        ]
 
     def __str__(self):
         return f"{self.operation_name} ({self.operation_name_cn})"
@@ -194,6 +235,11 @@ class Function(models.Model):
         verbose_name_plural = verbose_name
         db_table = 'function_info'
         unique_together = ('module', 'function_name')
+        indexes = [
+            # 函数查询按模块/操作类型筛选后按 function_id 游标分页
+            models.Index(fields=['module', 'function_id'], name='function_info_module_id_idx'),
+            models.Index(fields=['operation_type', 'function_id'], name='function_info_op_type_id_idx'),
+        ]
 
     def __str__(self):
         return f"{self.module}.{self.function_name}"
@@ -221,4 +267,42 @@ class Parameter(models.Model):
         unique_together = ('function', 'parameter_name')
 
     def __str__(self):
-        return f"{self.function.function_name}.{self.parameter_name}"
\ No newline at end of file
+        return f"{self.function.function_name}.{self.parameter_name}"
+
+class ImportJob(models.Model):
+    """函数数据导入任务模型"""
+    STATUS_PENDING = 'pending'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_PENDING, _("排队中")),
+        (STATUS_RUNNING, _("导入中")),
+        (STATUS_SUCCEEDED, _("已完成")),
+        (STATUS_FAILED, _("失败")),
+    ]
+
+    job_id = models.UUIDField(_("任务ID"), primary_key=True, default=uuid.uuid4, editable=False)
+    file_name = models.CharField(_("文件名"), max_length=255)
+    file_path = models.CharField(_("临时文件路径"), max_length=500, blank=True)
+    status = models.CharField(_("状态"), max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    total_rows = models.PositiveIntegerField(_("总行数"), default=0)
+    processed_rows = models.PositiveIntegerField(_("已处理行数"), default=0)
+    success_count = models.PositiveIntegerField(_("成功导入数"), default=0)
+    errors = models.JSONField(_("错误信息"), default=list, blank=True)
+    message = models.TextField(_("结果说明"), blank=True)
+    created_at = models.DateTimeField(_("创建时间"), auto_now_add=True)
+    started_at = models.DateTimeField(_("开始时间"), blank=True, null=True)
+    finished_at = models.DateTimeField(_("结束时间"), blank=True, null=True)
+    error_count = models.PositiveIntegerField(_("错误数"), default=0)
+    # 每次写入进度时刷新，长时间未更新的排队中/导入中任务视为已丢失
+    updated_at = models.DateTimeField(_("更新时间"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("导入任务")
+        verbose_name_plural = verbose_name
+        db_table = 'function_import_job'
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.file_name} ({self.get_status_display()})"
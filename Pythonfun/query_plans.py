@@ -0,0 +1,41 @@
+"""
+查询计划检查
+对执行过的 SQL 运行 EXPLAIN，找出对大表的顺序扫描（全表扫描）。
+PostgreSQL 下在事务内关闭 enable_seqscan：小数据量时规划器本来就倾向顺序扫描，
+关闭后计划中仍出现 Seq Scan 说明没有可用的索引。
+SQLite 使用 EXPLAIN QUERY PLAN，不带索引的 SCAN 即为全表扫描。
+"""
+import re
+
+from django.db import connections, transaction
+
+from .models import Article, ArticleNavigation, Function, Module, Parameter
+
+# 数据量随内容增长的表，热点查询不允许对这些表全表扫描
+# 分类、标签、库、操作类型等表只有几十行，不做要求
+LARGE_TABLES = frozenset(model._meta.db_table for model in (
+    Article, ArticleNavigation, Function, Module, Parameter,
+))
+
+_POSTGRESQL_SEQ_SCAN_RE = re.compile(r'Seq Scan on "?(\w+)"?')
+# SQLite: "SCAN 表名"，走索引的全索引扫描为 "SCAN 表名 USING [COVERING] INDEX ..."
+_SQLITE_SCAN_RE = re.compile(r'\bSCAN (\w+)(?! USING)(?:\s|$)')
+
+
+def explain(sql, params=None, using='default'):
+    """返回 SQL 的执行计划文本（每个计划节点一行）"""
+    connection = connections[using]
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            cursor.execute(f'EXPLAIN {sql}', params)
+            return '\n'.join(row[0] for row in cursor.fetchall())
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        return '\n'.join(row[-1] for row in cursor.fetchall())
+
+
+def sequential_scans(sql, params=None, using='default', tables=LARGE_TABLES):
+    """返回执行计划中被全表扫描的大表名称"""
+    plan = explain(sql, params, using)
+    pattern = _POSTGRESQL_SEQ_SCAN_RE if connections[using].vendor == 'postgresql' else _SQLITE_SCAN_RE
+    return sorted({table for table in pattern.findall(plan) if table in tables})
@@ -0,0 +1,186 @@
+"""
+请求性能指标
+记录每个请求的SQL查询次数、数据库耗时、模板渲染耗时和响应大小，
+以 Server-Timing 响应头返回（浏览器开发者工具可直接查看），并按 JSON 格式写入日志。
+settings.REQUEST_BUDGETS 按 URL 名称配置预算，超出时记录警告；
+settings.REQUEST_BUDGET_RAISE 为 True 时（测试环境）直接抛出异常，视图性能退化时测试失败。
+同时支持 WSGI 和 ASGI：当前请求的指标保存在 ContextVar 中，异步 ORM 在线程中执行查询时也能统计到。
+"""
+import json
+import logging
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.template.backends.django import DjangoTemplates, Template, reraise
+from django.template.exceptions import TemplateDoesNotExist
+
+logger = logging.getLogger(__name__)
+
+# 当前请求的指标，模板后端通过它累计渲染耗时
+_current_metrics = ContextVar('request_metrics', default=None)
+
+# 预算项 -> 指标字段
+BUDGET_FIELDS = {
+    'queries': 'query_count',
+    'db_ms': 'db_ms',
+    'template_ms': 'template_ms',
+    'total_ms': 'total_ms',
+}
+
+
+class RequestBudgetExceeded(AssertionError):
+    """请求超出性能预算（仅在 REQUEST_BUDGET_RAISE 开启时抛出）"""
+
+
+class RequestMetrics:
+    """单个请求的性能指标"""
+
+    def __init__(self):
+        self.query_count = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self.start = time.perf_counter()
+
+
+def _execute_wrapper(execute, sql, params, many, context):
+    """统计当前请求的查询次数和耗时，不在请求中（如后台任务）时直接执行"""
+    metrics = _current_metrics.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.query_count += 1
+        metrics.db_time += time.perf_counter() - start
+
+
+def install_execute_wrapper(connection, **kwargs):
+    """
+    在数据库连接上常驻统计钩子
+    连接是线程私有的，ASGI 下异步 ORM 在每个请求各自的线程中建立连接，
+    因此在连接建立时（connection_created 信号）安装，而不是只包住当前线程的连接
+    """
+    if _execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_execute_wrapper)
+
+
+connection_created.connect(install_execute_wrapper)
+
+
+def record_template_time(seconds):
+    metrics = _current_metrics.get()
+    if metrics is not None:
+        metrics.template_time += seconds
+
+
+class TimedTemplate(Template):
+    """统计渲染耗时的模板（include/extends 在引擎内部完成，不会重复计时）"""
+
+    def render(self, context=None, request=None):
+        start = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            record_template_time(time.perf_counter() - start)
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """Django 模板后端，返回统计渲染耗时的模板"""
+
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        try:
+            return TimedTemplate(self.engine.get_template(template_name), self)
+        except TemplateDoesNotExist as exc:
+            reraise(exc, self)
+
+
+def response_size(response):
+    """响应体字节数，流式响应无法预先得知，返回 None"""
+    if response.streaming:
+        return None
+    return len(response.content)
+
+
+def check_budget(view_name, record):
+    """返回超出预算的项，如 ['queries: 7 > 5']"""
+    budget = settings.REQUEST_BUDGETS.get(view_name, {})
+    return [
+        f'{name}: {record[BUDGET_FIELDS[name]]} > {limit}'
+        for name, limit in budget.items()
+        if record[BUDGET_FIELDS[name]] > limit
+    ]
+
+
+class RequestMetricsMiddleware:
+    """请求性能指标中间件，放在中间件列表靠前的位置，以便统计整页缓存命中的请求"""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        # 本中间件加载前已建立的连接（如启动时的迁移检查）也需要安装钩子
+        for connection in connections.all(initialized_only=True):
+            install_execute_wrapper(connection)
+        metrics = RequestMetrics()
+        token = _current_metrics.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_metrics.reset(token)
+        return self.process_metrics(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current_metrics.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_metrics.reset(token)
+        return self.process_metrics(request, response, metrics)
+
+    def process_metrics(self, request, response, metrics):
+        """添加 Server-Timing 响应头、写日志并检查预算"""
+        total_time = time.perf_counter() - metrics.start
+        match = request.resolver_match
+        view_name = match.view_name if match else None
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'view': view_name,
+            'status': response.status_code,
+            'query_count': metrics.query_count,
+            'db_ms': round(metrics.db_time * 1000, 1),
+            'template_ms': round(metrics.template_time * 1000, 1),
+            'total_ms': round(total_time * 1000, 1),
+            'response_bytes': response_size(response),
+        }
+
+        response['Server-Timing'] = ', '.join([
+            f'db;dur={record["db_ms"]};desc="{metrics.query_count} queries"',
+            f'tpl;dur={record["template_ms"]}',
+            f'total;dur={record["total_ms"]}',
+        ])
+
+        exceeded = check_budget(view_name, record) if view_name else []
+        if exceeded:
+            record['budget_exceeded'] = exceeded
+            logger.warning(json.dumps(record, ensure_ascii=False), extra={'metrics': record})
+            if settings.REQUEST_BUDGET_RAISE:
+                raise RequestBudgetExceeded(f'{view_name} 超出性能预算: {", ".join(exceeded)}')
+        else:
+            logger.info(json.dumps(record, ensure_ascii=False), extra={'metrics': record})
+        return response
@@ -0,0 +1,135 @@
+"""
+API序列化
+列表类API共用的序列化逻辑，配合查询集上的 select_related / prefetch_related 使用，避免逐行查询
+"""
+from django.db.models import Prefetch
+
+from .models import Article, Tag, Function, Parameter
+
+# ========== 文章列表 ==========
+
+# 文章列表需要读取的列，富文本和代码内容不在列表中返回
+ARTICLE_LIST_COLUMNS = (
+    'id', 'title', 'subtitle', 'summary', 'content_type', 'read_time_minutes',
+    'is_published', 'created_at', 'updated_at', 'category', 'category__name',
+)
+
+
+def article_list_queryset(queryset=None):
+    """文章列表查询集：分类随文章一起查询，标签预取，不读取正文列"""
+    if queryset is None:
+        queryset = Article.objects.all()
+    return (
+        queryset
+        .select_related('category')
+        .prefetch_related(Prefetch('tags', queryset=Tag.objects.only('id', 'name')))
+        .only(*ARTICLE_LIST_COLUMNS)
+    )
+
+
+def serialize_article(article):
+    """序列化文章列表项"""
+    return {
+        'id': article.id,
+        'title': article.title,
+        'subtitle': article.subtitle,
+        'summary': article.summary,
+        'read_time_minutes': article.read_time_minutes,
+        'is_published': article.is_published,
+        'created_at': article.created_at.isoformat(),
+        'updated_at': article.updated_at.isoformat(),
+        'category_name': article.category.name if article.category else None,
+        'content_type': article.content_type,
+        'content_type_display': article.get_content_type_display(),
+        'tags': [tag.name for tag in article.tags.all()]
+    }
+
+
+# ========== 函数查询 ==========
+
+# 函数查询API可返回的字段及取值方式
+FUNCTION_FIELDS = {
+    'id': lambda function: function.function_id,
+    'library_name': lambda function: function.module.library.library_name_cn,
+    'module_name': lambda function: function.module.module_name,
+    'function_name': lambda function: function.function_name,
+    'function_name_cn': lambda function: function.function_name_cn,
+    'description': lambda function: function.description_cn or function.description,
+    'operation_type': lambda function: function.operation_type.operation_name_cn if function.operation_type else '',
+    'syntax': lambda function: function.syntax,
+    'parameters': lambda function: function.parameters_text,
+    'return_value': lambda function: function.return_value_cn or function.return_value,
+    'example': lambda function: function.example_cn or function.example,
+    'availability': lambda function: function.availability,
+    'version_added': lambda function: function.version_added,
+    'parameters_detail': lambda function: [serialize_parameter(param) for param in function.parameters.all()],
+}
+
+# 各字段需要从函数表读取的列，未选择的字段对应的列不会被查询
+FUNCTION_FIELD_COLUMNS = {
+    'function_name_cn': ('function_name_cn',),
+    'description': ('description', 'description_cn'),
+    'syntax': ('syntax',),
+    'parameters': ('parameters_text',),
+    'return_value': ('return_value', 'return_value_cn'),
+    'example': ('example', 'example_cn'),
+    'availability': ('availability',),
+    'version_added': ('version_added',),
+}
+
+# 无论选择哪些字段都需要读取的列
+FUNCTION_BASE_COLUMNS = (
+    'function_id', 'function_name', 'module', 'module__module_name',
+    'module__library', 'module__library__library_name_cn',
+    'operation_type', 'operation_type__operation_name_cn',
+)
+
+
+def parse_function_fields(value):
+    """
+    解析 fields 参数（逗号分隔），未指定时返回全部字段
+    包含未知字段时抛出 ValueError
+    """
+    if not value:
+        return list(FUNCTION_FIELDS)
+    fields = [field.strip() for field in value.split(',') if field.strip()]
+    unknown = [field for field in fields if field not in FUNCTION_FIELDS]
+    if unknown:
+        raise ValueError(f"未知字段: {', '.join(unknown)}")
+    return fields
+
+
+def function_queryset(fields):
+    """按所选字段构建函数查询集：只读取需要的列，参数按位置预取"""
+    columns = list(FUNCTION_BASE_COLUMNS)
+    for field in fields:
+        columns.extend(FUNCTION_FIELD_COLUMNS.get(field, ()))
+
+    queryset = (
+        Function.objects
+        .select_related('module', 'module__library', 'operation_type')
+        .only(*columns)
+    )
+    if 'parameters_detail' in fields:
+        queryset = queryset.prefetch_related(Prefetch(
+            'parameters',
+            queryset=Parameter.objects.order_by('position', 'parameter_id')
+        ))
+    return queryset
+
+
+def serialize_function(function, fields):
+    """序列化函数，只包含所选字段"""
+    return {field: FUNCTION_FIELDS[field](function) for field in fields}
+
+
+def serialize_parameter(param):
+    """序列化函数参数"""
+    return {
+        'name': param.parameter_name,
+        'name_cn': param.parameter_name_cn,
+        'data_type': param.data_type,
+        'is_required': param.is_required,
+        'default_value': param.default_value,
+        'description': param.description_cn or param.description
+    }
@@ -0,0 +1,55 @@
+"""
+模型信号处理
+数据变更时使相关缓存失效，并维护文章导航索引
+"""
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .article_pages import rebuild_navigation
+from .category_tree import invalidate_category_tree
+from .function_catalog import invalidate_function_library
+from .models import MainCategory, SubCategory, Article, Library, Module, OperationType, Function
+
+
+@receiver([post_save, post_delete], sender=MainCategory)
+@receiver([post_save, post_delete], sender=SubCategory)
+@receiver([post_save, post_delete], sender=Article)
+def category_tree_changed(sender, **kwargs):
+    """分类或文章变更时刷新分类树缓存"""
+    invalidate_category_tree()
+
+
+@receiver(pre_save, sender=Article)
+def remember_navigation_group(sender, instance, **kwargs):
+    """记录文章保存前所在的分组，分类或内容类型变化时原分组也需要重建"""
+    if instance.pk:
+        instance._navigation_group = (
+            Article.objects.filter(pk=instance.pk).values_list('category_id', 'content_type').first()
+        )
+
+
+@receiver([post_save, post_delete], sender=Article)
+def article_navigation_changed(sender, instance, **kwargs):
+    """文章新增、修改、发布/取消发布、删除时重建所在分组的导航索引"""
+    groups = {(instance.category_id, instance.content_type)}
+    previous_group = getattr(instance, '_navigation_group', None)
+    if previous_group:
+        groups.add(previous_group)
+    for category_id, content_type in groups:
+        rebuild_navigation(category_id, content_type)
+
+
+@receiver(post_delete, sender=SubCategory)
+def uncategorized_navigation_changed(sender, **kwargs):
+    """删除子分类后其文章的分类被置空，重建未分类文章的导航索引"""
+    for content_type in Article.ContentType.values:
+        rebuild_navigation(None, content_type)
+
+
+@receiver([post_save, post_delete], sender=Library)
+@receiver([post_save, post_delete], sender=Module)
+@receiver([post_save, post_delete], sender=OperationType)
+@receiver([post_save, post_delete], sender=Function)
+def function_library_changed(sender, **kwargs):
+    """函数库数据变更时刷新函数库快照"""
+    invalidate_function_library()
@@ -43,6 +43,7 @@ urlpatterns = [
     # 系统管理API
     path('api/create-superuser/', views.create_superuser_api, name='create_superuser_api'),
     path('api/reset-admin-password/', views.reset_admin_password_api, name='reset_admin_password_api'),
+    path('api/cache-stats/', views.cache_stats_api, name='cache_stats_api'),
     
     # 函数管理页面路由
     path('manage/function-management/', views.function_management_view, name='function_management'),
@@ -56,6 +57,7 @@ urlpatterns = [
     
     # 函数管理API路由
     path('api/upload-functions/', views.upload_functions_api, name='upload_functions'),
+    path('api/import-jobs/<uuid:job_id>/', views.import_job_status_api, name='import_job_status'),
     path('api/function-stats/', views.get_function_stats_api, name='get_function_stats'),
     path('api/table-structure/', views.get_table_structure_api, name='get_table_structure'),
     path('api/export-functions/', views.export_functions_api, name='export_functions'),
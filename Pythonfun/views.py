@@ -1,18 +1,43 @@
 import json
+import logging
 import os
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.core.paginator import Paginator, EmptyPage
-from django.http import JsonResponse
+from django.http import FileResponse, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render, get_object_or_404
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import quote_etag
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.db import models
-from .models import MainCategory, SubCategory, Article, Tag, Library, Module, OperationType, Function, Parameter
+from .models import MainCategory, SubCategory, Article, Tag, Library, Module, OperationType, Function, Parameter, ImportJob
+from . import caching
+from .article_pages import published_articles, get_current_article, get_article_for_display, get_navigation
+from .category_tree import get_category_tree, CACHE_NAMESPACE as CATEGORY_TREE_CACHE
+from .function_catalog import (
+    aget_function_library_payload, choose_encoding, CATALOG_FORMATS, CACHE_NAMESPACE as FUNCTION_LIBRARY_CACHE
+)
+from .function_search import search_functions
+from .serializers import (
+    parse_function_fields, function_queryset, serialize_function,
+    article_list_queryset, serialize_article
+)
+from .function_import import (
+    FunctionImporter, read_import_file, TEMPLATE_HEADERS,
+    LIBRARY_FIELDS, MODULE_FIELDS, FUNCTION_FIELDS, PARAMETER_FIELDS, OPERATION_TYPE_FIELDS
+)
+from .import_jobs import enqueue_import, fail_stale_jobs, get_job_status
+from .function_export import iter_csv, export_xlsx_file, write_snapshot_xlsx
 
 from django.contrib.auth import authenticate, login
 from django.contrib.auth.decorators import login_required
 from django.shortcuts import render, redirect
 from django.contrib import messages
 
+logger = logging.getLogger(__name__)
+
 # ========== 页面渲染视图 ==========
 
 def login_view(request):
@@ -31,52 +56,14 @@ def login_view(request):
 def index_view(request):
     """语法页面视图 - 显示语法类型的文章"""
     # 获取语法类型的文章
-    articles = Article.objects.filter(
-        content_type=Article.ContentType.GRAMMAR,
-        is_published=True
-    ).order_by('-created_at')
+    articles = published_articles(Article.ContentType.GRAMMAR)
     
     # 获取分类树
-    main_categories = MainCategory.objects.filter(is_enabled=True).order_by('order')
-    category_tree = []
-    for main_category in main_categories:
-        # 获取该主分类下有语法类型文章的子分类
-        sub_categories_with_articles = SubCategory.objects.filter(
-            parent=main_category,
-            is_enabled=True,
-            article__content_type=Article.ContentType.GRAMMAR,
-            article__is_published=True
-        ).distinct().order_by('id')
-        
-        # 只有当主分类下有文章时，才添加到分类树中
-        if sub_categories_with_articles.exists():
-            sub_categories_with_count = []
-            for sub in sub_categories_with_articles:
-                article_count = Article.objects.filter(
-                    category=sub,
-                    content_type=Article.ContentType.GRAMMAR,
-                    is_published=True
-                ).count()
-                sub.article_count = article_count
-                sub_categories_with_count.append(sub)
-            
-            category_tree.append({
-                'main_category': main_category,
-                'sub_categories': sub_categories_with_count
-            })
+    category_tree = get_category_tree(Article.ContentType.GRAMMAR)
     
     # 获取当前文章（用于显示默认文章）
-    current_article = Article.objects.filter(
-        content_type=Article.ContentType.GRAMMAR,
-        is_published=True
-    ).order_by('created_at').first()
-    
-    # 如果没有已发布的文章，且用户是管理员，尝试获取未发布的文章（用于管理员预览）
-    if not current_article and request.user.is_authenticated and request.user.is_staff:
-        current_article = Article.objects.filter(
-            content_type=Article.ContentType.GRAMMAR,
-            is_published=False
-        ).order_by('created_at').first()
+    # 没有已发布的文章时，管理员可预览未发布的文章
+    current_article = get_current_article(request, Article.ContentType.GRAMMAR)
     
     context = {
         'articles': articles,
@@ -106,62 +93,11 @@ def category_view(request, slug):
             }, status=404)
         
         # 获取当前分类的文章
-        current_article = Article.objects.filter(
-            category=current_category,
-            content_type=model_content_type,
-            is_published=True
-        ).order_by('created_at').first()
-        
-        # 如果没有已发布的文章，且用户是管理员，尝试获取未发布的文章（用于管理员预览）
-        if not current_article and request.user.is_authenticated and request.user.is_staff:
-            current_article = Article.objects.filter(
-                category=current_category,
-                content_type=model_content_type,
-                is_published=False
-            ).order_by('created_at').first()
+        # 没有已发布的文章时，管理员可预览未发布的文章
+        current_article = get_current_article(request, model_content_type, category=current_category)
         
         # 构建分类树，只包含有指定内容类型文章的分类
-        category_tree = []
-        
-        # 获取包含指定内容类型文章的子分类
-        sub_categories_with_articles = SubCategory.objects.filter(
-            article__content_type=model_content_type,
-            article__is_published=True,
-            is_enabled=True
-        ).distinct().order_by('parent__id', 'id')
-        
-        # 按主分类分组
-        current_main_category = None
-        current_sub_categories = []
-        
-        for sub_category in sub_categories_with_articles:
-            if current_main_category != sub_category.parent:
-                # 保存前一个主分类的数据
-                if current_main_category and current_sub_categories:
-                    category_tree.append({
-                        'main_category': current_main_category,
-                        'sub_categories': current_sub_categories
-                    })
-                
-                # 开始新的主分类
-                current_main_category = sub_category.parent
-                current_sub_categories = []
-            
-            # 计算文章数量
-            article_count = Article.objects.filter(
-                category=sub_category,
-                content_type=model_content_type,
-                is_published=True
-            ).count()
-            sub_category.article_count = article_count
-            current_sub_categories.append(sub_category)
-        
-        # 添加最后一个主分类的数据
-        if current_main_category and current_sub_categories:
-            category_tree.append({
-                'main_category': current_main_category,
-                'sub_categories': current_sub_categories
-            })
+        category_tree = get_category_tree(model_content_type)
         
         # 根据内容类型选择模板
         template_map = {
@@ -183,18 +119,12 @@ def category_view(request, slug):
         # 如果没有文章，添加提示信息
         if not current_article:
             context['no_articles_message'] = f'分类 "{current_category.name}" 暂无{content_type}类型的文章'
-        else:
-            # 如果有文章，确保文章内容被正确处理
-            if hasattr(current_article, 'content') and current_article.content:
-                # 如果文章有content字段，转换为HTML
-                import markdown
-                current_article.content_html = markdown.markdown(current_article.content)
         
         return render(request, template_name, context)
         
     except Exception as e:
         # 记录错误并返回友好的错误页面
-        print(f"Category view error: {str(e)}")
+        logger.exception('加载分类页面失败: %s', slug)
         return render(request, 'front/404.html', {
             'error_message': '加载分类页面时发生错误，请稍后重试'
         }, status=500)
@@ -216,18 +146,18 @@ def course_management_view(request):
     return render(request, 'admin/教程管理.html')
 
 def tutorial_detail_view(request, pk):
-    tutorial = get_object_or_404(Article, pk=pk)
+    tutorial = get_article_for_display(pk)
     is_admin = request.user.is_authenticated and request.user.is_staff
     if not tutorial.is_published and not is_admin:
         return render(request, 'front/404.html', {'error_message': '教程不存在或未发布'})
 
-    related_tutorials = Article.objects.filter(
-        category=tutorial.category, content_type=Article.ContentType.GRAMMAR, is_published=True
-    ).exclude(pk=pk)[:5]
+    # 上一篇/下一篇及相关教程来自预先计算的导航索引，随文章一起读取
+    navigation = get_navigation(tutorial)
     
     context = {
         'tutorial': tutorial,
-        'related_tutorials': related_tutorials,
+        'navigation': navigation,
+        'related_tutorials': navigation.related,
         'is_admin': is_admin
     }
     return render(request, 'front/tutorial_detail.html', context)
@@ -397,29 +327,39 @@ def sub_category_detail_api(request, pk):
         sub_category.delete()
         return JsonResponse({'status': 'success', 'message': 'Sub category deleted successfully'})
 
+# 文章列表API默认每页条数及上限
+ARTICLE_PAGE_SIZE = 20
+ARTICLE_MAX_PAGE_SIZE = 100
+
 @csrf_exempt
 @require_http_methods(["GET", "POST"])
 def article_api(request):
     if request.method == 'GET':
-        articles = Article.objects.all()
-        data = [{
-            'id': article.id,
-            'title': article.title,
-            'subtitle': article.subtitle,
-            'summary': article.summary,
-            'read_time_minutes': article.read_time_minutes,
-            'is_published': article.is_published,
-            'created_at': article.created_at.isoformat(),
-            'updated_at': article.updated_at.isoformat(),
-            'category_name': article.category.name if article.category else None,
-            'tags': [tag.name for tag in article.tags.all()]
-        } for article in articles]
-        return JsonResponse(data, safe=False)
+        page = request.GET.get('page', 1)
+        try:
+            page_size = min(max(int(request.GET.get('page_size', ARTICLE_PAGE_SIZE)), 1), ARTICLE_MAX_PAGE_SIZE)
+        except ValueError as e:
+            return JsonResponse({
+                'error': f'参数错误: {str(e)}'
+            }, status=400)
+
+        paginator = Paginator(article_list_queryset(), page_size)
+        try:
+            articles_page = paginator.page(page)
+        except EmptyPage:
+            articles_page = paginator.page(paginator.num_pages)
+
+        data = {
+            'items': [serialize_article(article) for article in articles_page.object_list],
+            'current_page': articles_page.number,
+            'total_pages': paginator.num_pages,
+            'total_items': paginator.count
+        }
+        return JsonResponse(data)
     elif request.method == 'POST':
         try:
-            print("收到POST请求到article_api")
             data = json.loads(request.body)
-            print("解析的请求数据:", data)
+            logger.debug('article_api 创建文章: %s', data.get('title'))
             
             # 验证必填字段
             errors = {}
@@ -589,7 +529,7 @@ def course_api(request):
         page_size = 10 # Assuming a default page size
 
         # 显示所有文章，不再限制内容类型
-        courses = Article.objects.all()
+        courses = article_list_queryset()
 
         # Add pagination
         paginator = Paginator(courses, page_size)
@@ -599,20 +539,7 @@ def course_api(request):
             courses_page = paginator.page(paginator.num_pages)
 
         data = {
-            'items': [{
-                'id': course.id,
-                'title': course.title,
-                'subtitle': course.subtitle,
-                'summary': course.summary,
-                'read_time_minutes': course.read_time_minutes,
-                'is_published': course.is_published,
-                'created_at': course.created_at.isoformat(),
-                'updated_at': course.updated_at.isoformat(),
-                'category_name': course.category.name if course.category else None,
-                'content_type': course.content_type,
-                'content_type_display': course.get_content_type_display(),
-                'tags': [tag.name for tag in course.tags.all()]
-            } for course in courses_page.object_list],
+            'items': [serialize_article(course) for course in courses_page.object_list],
             'current_page': courses_page.number,
             'total_pages': paginator.num_pages,
             'total_items': paginator.count
@@ -758,52 +685,14 @@ def function_query_view(request):
 def data_structure_view(request):
     """数据结构页面视图"""
     # 获取数据结构类型的文章
-    articles = Article.objects.filter(
-        content_type=Article.ContentType.DATA_STRUCTURE,
-        is_published=True
-    ).order_by('-created_at')
+    articles = published_articles(Article.ContentType.DATA_STRUCTURE)
     
     # 获取分类树
-    main_categories = MainCategory.objects.filter(is_enabled=True).order_by('order')
-    category_tree = []
-    for main_category in main_categories:
-        # 获取该主分类下有数据结构类型文章的子分类
-        sub_categories_with_articles = SubCategory.objects.filter(
-            parent=main_category,
-            is_enabled=True,
-            article__content_type=Article.ContentType.DATA_STRUCTURE,
-            article__is_published=True
-        ).distinct().order_by('id')
-        
-        # 只有当主分类下有文章时，才添加到分类树中
-        if sub_categories_with_articles.exists():
-            sub_categories_with_count = []
-            for sub in sub_categories_with_articles:
-                article_count = Article.objects.filter(
-                    category=sub,
-                    content_type=Article.ContentType.DATA_STRUCTURE,
-                    is_published=True
-                ).count()
-                sub.article_count = article_count
-                sub_categories_with_count.append(sub)
-            
-            category_tree.append({
-                'main_category': main_category,
-                'sub_categories': sub_categories_with_count
-            })
+    category_tree = get_category_tree(Article.ContentType.DATA_STRUCTURE)
     
     # 获取当前文章（用于显示默认文章）
-    current_article = Article.objects.filter(
-        content_type=Article.ContentType.DATA_STRUCTURE,
-        is_published=True
-    ).order_by('created_at').first()
-    
-    # 如果没有已发布的文章，且用户是管理员，尝试获取未发布的文章（用于管理员预览）
-    if not current_article and request.user.is_authenticated and request.user.is_staff:
-        current_article = Article.objects.filter(
-            content_type=Article.ContentType.DATA_STRUCTURE,
-            is_published=False
-        ).order_by('created_at').first()
+    # 没有已发布的文章时，管理员可预览未发布的文章
+    current_article = get_current_article(request, Article.ContentType.DATA_STRUCTURE)
     
     context = {
         'articles': articles,
@@ -816,52 +705,14 @@ def data_structure_view(request):
 def ai_programming_view(request):
     """AI编程页面视图"""
     # 获取AI编程类型的文章
-    articles = Article.objects.filter(
-        content_type=Article.ContentType.AI_PROGRAMMING,
-        is_published=True
-    ).order_by('-created_at')
+    articles = published_articles(Article.ContentType.AI_PROGRAMMING)
     
     # 获取分类树
-    main_categories = MainCategory.objects.filter(is_enabled=True).order_by('order')
-    category_tree = []
-    for main_category in main_categories:
-        # 获取该主分类下有AI编程类型文章的子分类
-        sub_categories_with_articles = SubCategory.objects.filter(
-            parent=main_category,
-            is_enabled=True,
-            article__content_type=Article.ContentType.AI_PROGRAMMING,
-            article__is_published=True
-        ).distinct().order_by('id')
-        
-        # 只有当主分类下有文章时，才添加到分类树中
-        if sub_categories_with_articles.exists():
-            sub_categories_with_count = []
-            for sub in sub_categories_with_articles:
-                article_count = Article.objects.filter(
-                    category=sub,
-                    content_type=Article.ContentType.AI_PROGRAMMING,
-                    is_published=True
-                ).count()
-                sub.article_count = article_count
-                sub_categories_with_count.append(sub)
-            
-            category_tree.append({
-                'main_category': main_category,
-                'sub_categories': sub_categories_with_count
-            })
+    category_tree = get_category_tree(Article.ContentType.AI_PROGRAMMING)
     
     # 获取当前文章（用于显示默认文章）
-    current_article = Article.objects.filter(
-        content_type=Article.ContentType.AI_PROGRAMMING,
-        is_published=True
-    ).order_by('created_at').first()
-    
-    # 如果没有已发布的文章，且用户是管理员，尝试获取未发布的文章（用于管理员预览）
-    if not current_article and request.user.is_authenticated and request.user.is_staff:
-        current_article = Article.objects.filter(
-            content_type=Article.ContentType.AI_PROGRAMMING,
-            is_published=False
-        ).order_by('created_at').first()
+    # 没有已发布的文章时，管理员可预览未发布的文章
+    current_article = get_current_article(request, Article.ContentType.AI_PROGRAMMING)
     
     context = {
         'articles': articles,
@@ -977,68 +828,96 @@ def reset_admin_password_api(request):
             'message': f'重置密码失败: {str(e)}'
         })
 
+@require_http_methods(["GET"])
+def cache_stats_api(request):
+    """缓存命中统计API"""
+    return JsonResponse({
+        'success': True,
+        'stats': {
+            CATEGORY_TREE_CACHE: caching.get_stats(CATEGORY_TREE_CACHE),
+            FUNCTION_LIBRARY_CACHE: caching.get_stats(FUNCTION_LIBRARY_CACHE)
+        }
+    })
+
 # ========== 函数库相关API视图 ==========
 
+# 函数查询API游标分页的默认和最大条数
+FUNCTION_QUERY_LIMIT = 50
+FUNCTION_QUERY_MAX_LIMIT = 200
+
 @require_http_methods(["GET"])
-def function_library_api(request):
-    """函数库数据API"""
+async def function_library_api(request):
+    """
+    函数库数据API - 返回预先构建的函数库快照，支持ETag条件请求
+    format=columnar 返回列式格式；按 Accept-Encoding 返回 gzip/brotli 压缩后的内容
+    """
     try:
-        # 获取所有库
-        libraries = Library.objects.all()
-        data = {}
-        
-        for library in libraries:
-            library_data = {
-                'name': library.library_name_cn,
-                'modules': []
-            }
-            
-            # 获取库下的所有模块
-            modules = library.modules.all()
-            for module in modules:
-                module_data = {
-                    'name': module.module_name,
-                    'description': module.description or '',
-                    'items': []
-                }
-                
-                # 获取模块下的所有函数
-                functions = module.functions.all()
-                for function in functions:
-                    function_data = {
-                        'type': 'function',
-                        'name': function.function_name,
-                        'semantic': function.description_cn or function.description or '',
-                        'operation': function.operation_type.operation_name_cn if function.operation_type else '',
-                        'input': function.parameters_text or '',
-                        'output': function.return_value_cn or function.return_value or ''
-                    }
-                    module_data['items'].append(function_data)
-                
-                library_data['modules'].append(module_data)
-            
-            data[library.library_name] = library_data
-        
-        return JsonResponse(data)
+        format_type = request.GET.get('format', 'nested')
+        if format_type not in CATALOG_FORMATS:
+            return JsonResponse({
+                'error': f'参数错误: format 只支持 {", ".join(CATALOG_FORMATS)}'
+            }, status=400)
+        encoding = choose_encoding(request.headers.get('Accept-Encoding', ''))
+        payload = await aget_function_library_payload(format_type, encoding)
+        etag = quote_etag(payload['etag'])
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(payload['content'], content_type='application/json; charset=utf-8')
+            if encoding != 'identity':
+                response['Content-Encoding'] = encoding
+        response['ETag'] = etag
+        patch_vary_headers(response, ('Accept-Encoding',))
+        return response
         
     except Exception as e:
         return JsonResponse({
             'error': str(e)
         }, status=500)
 
+def _search_page(functions, search, page, page_size, fields):
+    """全文搜索：按相关度排序并分页（Paginator 只有同步接口）"""
+    paginator = Paginator(search_functions(functions, search), page_size)
+    try:
+        functions_page = paginator.page(page)
+    except EmptyPage:
+        functions_page = paginator.page(paginator.num_pages)
+
+    return {
+        'items': [serialize_function(function, fields) for function in functions_page.object_list],
+        'current_page': functions_page.number,
+        'total_pages': paginator.num_pages,
+        'total_items': paginator.count
+    }
+
 @require_http_methods(["GET"])
-def function_query_api(request):
-    """函数查询API"""
+async def function_query_api(request):
+    """
+    函数查询API
+    无搜索词时按 function_id 游标分页（cursor/limit），有搜索词时按相关度分页（page/page_size）
+    fields 参数指定返回的字段（逗号分隔），默认返回全部字段
+    """
     try:
         # 获取查询参数
         library_name = request.GET.get('library')
         module_name = request.GET.get('module')
         function_name = request.GET.get('function')
+        function_id = request.GET.get('function_id')
         operation_type = request.GET.get('operation_type')
-        search = request.GET.get('search', '').lower()
+        search = request.GET.get('search', '').strip()
+        
+        try:
+            fields = parse_function_fields(request.GET.get('fields'))
+            function_id = int(function_id) if function_id else None
+            cursor = int(request.GET.get('cursor') or 0)
+            limit = min(max(int(request.GET.get('limit', FUNCTION_QUERY_LIMIT)), 1), FUNCTION_QUERY_MAX_LIMIT)
+            page_size = min(max(int(request.GET.get('page_size', 20)), 1), FUNCTION_QUERY_MAX_LIMIT)
+        except ValueError as e:
+            return JsonResponse({
+                'error': f'参数错误: {str(e)}'
+            }, status=400)
         
         # 构建查询
-        functions = Function.objects.select_related('module', 'module__library', 'operation_type')
+        functions = function_queryset(fields)
         
         if library_name:
             functions = functions.filter(module__library__library_name=library_name)
@@ -1049,51 +928,30 @@ def function_query_api(request):
         if function_name:
             functions = functions.filter(function_name__icontains=function_name)
         
+        if function_id is not None:
+            functions = functions.filter(function_id=function_id)
+        
         if operation_type:
             functions = functions.filter(operation_type__operation_name_cn=operation_type)
         
         if search:
-            functions = functions.filter(
-                models.Q(function_name__icontains=search) |
-                models.Q(description__icontains=search) |
-                models.Q(description_cn__icontains=search)
-            )
-        
-        # 序列化数据
-        data = []
-        for function in functions:
-            function_data = {
-                'id': function.function_id,
-                'library_name': function.module.library.library_name_cn,
-                'module_name': function.module.module_name,
-                'function_name': function.function_name,
-                'function_name_cn': function.function_name_cn,
-                'description': function.description_cn or function.description,
-                'operation_type': function.operation_type.operation_name_cn if function.operation_type else '',
-                'syntax': function.syntax,
-                'parameters': function.parameters_text,
-                'return_value': function.return_value_cn or function.return_value,
-                'example': function.example_cn or function.example,
-                'availability': function.availability,
-                'version_added': function.version_added,
-                'parameters_detail': []
-            }
-            
-            # 获取参数详细信息
-            for param in function.parameters.all():
-                param_data = {
-                    'name': param.parameter_name,
-                    'name_cn': param.parameter_name_cn,
-                    'data_type': param.data_type,
-                    'is_required': param.is_required,
-                    'default_value': param.default_value,
-                    'description': param.description_cn or param.description
-                }
-                function_data['parameters_detail'].append(param_data)
-            
-            data.append(function_data)
+            # 全文搜索：按相关度排序并分页
+            page = request.GET.get('page', 1)
+            return JsonResponse(await sync_to_async(_search_page)(functions, search, page, page_size, fields))
+        
+        # 游标分页：按 function_id 递增读取 cursor 之后的 limit 条
+        page_functions = [
+            function async for function in
+            functions.filter(function_id__gt=cursor).order_by('function_id')[:limit + 1]
+        ]
+        has_more = len(page_functions) > limit
+        page_functions = page_functions[:limit]
         
-        return JsonResponse(data, safe=False)
+        return JsonResponse({
+            'items': [serialize_function(function, fields) for function in page_functions],
+            'next_cursor': str(page_functions[-1].function_id) if has_more else None,
+            'has_more': has_more
+        })
         
     except Exception as e:
         return JsonResponse({
@@ -1101,7 +959,7 @@ def function_query_api(request):
         }, status=500)
 
 @require_http_methods(["GET"])
-def function_libraries_list_api(request):
+async def function_libraries_list_api(request):
     """获取库列表API"""
     try:
         libraries = Library.objects.all()
@@ -1112,7 +970,7 @@ def function_libraries_list_api(request):
             'description': library.description,
             'is_builtin': library.is_builtin,
             'is_standard': library.is_standard
-        } for library in libraries]
+        } async for library in libraries]
         
         return JsonResponse(data, safe=False)
         
@@ -1122,7 +980,7 @@ def function_libraries_list_api(request):
         }, status=500)
 
 @require_http_methods(["GET"])
-def function_modules_list_api(request):
+async def function_modules_list_api(request):
     """获取模块列表API"""
     try:
         library_id = request.GET.get('library_id')
@@ -1137,7 +995,7 @@ def function_modules_list_api(request):
             'description': module.description,
             'library_name': module.library.library_name_cn,
             'is_builtin': module.is_builtin
-        } for module in modules]
+        } async for module in modules]
         
         return JsonResponse(data, safe=False)
         
@@ -1147,7 +1005,7 @@ def function_modules_list_api(request):
         }, status=500)
 
 @require_http_methods(["GET"])
-def function_operation_types_api(request):
+async def function_operation_types_api(request):
     """获取操作类型列表API"""
     try:
         operation_types = OperationType.objects.all()
@@ -1156,7 +1014,7 @@ def function_operation_types_api(request):
             'name': op.operation_name,
             'name_cn': op.operation_name_cn,
             'description': op.description
-        } for op in operation_types]
+        } async for op in operation_types]
         
         return JsonResponse(data, safe=False)
         
@@ -1170,7 +1028,7 @@ def function_operation_types_api(request):
 @login_required
 def function_management_view(request):
     """函数管理页面视图"""
-    return render(request, 'admin/函数管理.html')
+    return render(request, 'admin/函数管理.html', {'background_import': settings.IMPORT_JOBS_BACKGROUND})
 
 @csrf_exempt
 @require_http_methods(["POST"])
@@ -1202,134 +1060,24 @@ def upload_functions_api(request):
                 'message': f'文件大小超过限制。最大允许：50MB，当前文件：{uploaded_file.size / (1024*1024):.2f}MB'
             }, status=400)
         
-        # 定义模板字段映射
-        template_fields = {
-            'Library': [
-                'library_name', 'library_name_cn', 'description', 'version', 
-                'category', 'is_builtin', 'is_standard'
-            ],
-            'Module': [
-                'library_name', 'module_name', 'description', 'is_builtin'
-            ],
-            'Function': [
-                'library_name', 'module_name', 'function_name', 'function_name_cn',
-                'description', 'description_cn', 'operation_type', 'syntax',
-                'parameters_text', 'return_value', 'return_value_cn', 'example',
-                'example_cn', 'availability', 'version_added'
-            ],
-            'Parameter': [
-                'library_name', 'module_name', 'function_name', 'parameter_name',
-                'parameter_name_cn', 'data_type', 'is_required', 'default_value',
-                'description', 'description_cn'
-            ],
-            'OperationType': [
-                'operation_name', 'operation_name_cn', 'description'
-            ],
-            # 支持现有的工作表名称
-            '库信息': [
-                'library_name', 'library_name_cn', 'description', 'version', 
-                'category', 'is_builtin', 'is_standard'
-            ],
-            '模块信息': [
-                'library_name', 'module_name', 'description', 'is_builtin'
-            ],
-            '函数信息': [
-                'library_name', 'module_name', 'function_name', 'function_name_cn',
-                'description', 'description_cn', 'operation_type', 'syntax',
-                'parameters_text', 'return_value', 'return_value_cn', 'example',
-                'example_cn', 'availability', 'version_added'
-            ],
-            '参数信息': [
-                'library_name', 'module_name', 'function_name', 'parameter_name',
-                'parameter_name_cn', 'data_type', 'is_required', 'default_value',
-                'description', 'description_cn'
-            ],
-            '操作类型': [
-                'operation_name', 'operation_name_cn', 'description'
-            ]
-        }
+        # 后台导入（需开启 IMPORT_JOBS_BACKGROUND）：保存文件后立即返回任务ID，前端轮询任务状态
+        if settings.IMPORT_JOBS_BACKGROUND and request.POST.get('background') in ('1', 'true'):
+            job = enqueue_import(uploaded_file, file_extension)
+            return JsonResponse({
+                'success': True,
+                'message': '文件已加入导入队列',
+                'job_id': str(job.job_id),
+                'status_url': reverse('Pythonfun:import_job_status', args=[job.job_id])
+            }, status=202)
         
-        # 处理文件
-        import pandas as pd
-        import io
+        # 读取并清洗每个工作表
+        importer = FunctionImporter()
+        sheets = read_import_file(uploaded_file, file_extension, importer.errors)
         
-        # 读取Excel文件
-        if file_extension in ['.xlsx', '.xls']:
-            excel_file = pd.ExcelFile(uploaded_file)
-            sheet_names = excel_file.sheet_names
-        else:
-            # CSV文件处理
-            content = uploaded_file.read().decode('utf-8')
-            uploaded_file.seek(0)  # 重置文件指针
-            df = pd.read_csv(io.StringIO(content))
-            sheet_names = ['CSV_Data']
-            excel_file = None
-        
-        processed_data = {}
-        errors = []
-        success_count = 0
-        
-        # 处理每个工作表
-        for sheet_name in sheet_names:
-            try:
-                # 读取工作表数据
-                if file_extension in ['.xlsx', '.xls']:
-                    df = pd.read_excel(excel_file, sheet_name=sheet_name)
-                else:
-                    # CSV已经读取过了
-                    pass
-                
-                # 跳过空行和说明行
-                df = df.dropna(how='all')
-                df = df[~df.iloc[:, 0].astype(str).str.contains('说明', na=False)]
-                
-                if df.empty:
-                    continue
-                
-                # 获取表头
-                headers = df.columns.tolist()
-                
-                # 验证字段是否匹配模板
-                expected_fields = None
-                for template_sheet, template_field_list in template_fields.items():
-                    if sheet_name == template_sheet:
-                        expected_fields = template_field_list
-                        break
-                
-                if expected_fields is None:
-                    errors.append(f"工作表 '{sheet_name}' 不在模板中，跳过处理")
-                    continue
-                
-                # 检查字段数量
-                if len(headers) != len(expected_fields):
-                    errors.append(f"工作表 '{sheet_name}' 字段数量不匹配。期望：{len(expected_fields)}，实际：{len(headers)}")
-                    continue
-                
-                # 检查字段名称（允许中文表头）
-                header_mapping = {}
-                for i, header in enumerate(headers):
-                    # 尝试匹配字段名
-                    if i < len(expected_fields):
-                        header_mapping[expected_fields[i]] = header
-                
-                # 处理数据
-                for index, row in df.iterrows():
-                    try:
-                        if sheet_name in ['Library', '库信息']:
-                            success_count += process_library_row(row, header_mapping)
-                        elif sheet_name in ['Module', '模块信息']:
-                            success_count += process_module_row(row, header_mapping)
-                        elif sheet_name in ['Function', '函数信息']:
-                            success_count += process_function_row(row, header_mapping)
-                        elif sheet_name in ['Parameter', '参数信息']:
-                            success_count += process_parameter_row(row, header_mapping)
-                        elif sheet_name in ['OperationType', '操作类型']:
-                            success_count += process_operation_type_row(row, header_mapping)
-                    except Exception as row_error:
-                        errors.append(f"处理第 {index + 2} 行数据时出错：{str(row_error)}")
-                
-            except Exception as sheet_error:
-                errors.append(f"处理工作表 '{sheet_name}' 时出错：{str(sheet_error)}")
+        # 在一个事务内按依赖顺序批量导入
+        importer.run(sheets)
+        errors = importer.errors
+        success_count = importer.success_count
         
         # 返回处理结果
         if errors:
@@ -1351,239 +1099,27 @@ def upload_functions_api(request):
             'message': f'上传失败: {str(e)}'
         }, status=500)
 
-def process_library_row(row, header_mapping):
-    """处理库数据行"""
-    try:
-        library_name = str(row[header_mapping['library_name']]).strip()
-        if not library_name or library_name == 'nan':
-            return 0
-        
-        # 检查是否已存在
-        library, created = Library.objects.get_or_create(
-            library_name=library_name,
-            defaults={
-                'library_name_cn': str(row[header_mapping['library_name_cn']]).strip() if 'library_name_cn' in header_mapping else library_name,
-                'description': str(row[header_mapping['description']]).strip() if 'description' in header_mapping else '',
-                'version': str(row[header_mapping['version']]).strip() if 'version' in header_mapping else '',
-                'category': str(row[header_mapping['category']]).strip() if 'category' in header_mapping else '',
-                'is_builtin': parse_boolean(row[header_mapping['is_builtin']]) if 'is_builtin' in header_mapping else False,
-                'is_standard': parse_boolean(row[header_mapping['is_standard']]) if 'is_standard' in header_mapping else False,
-            }
-        )
-        
-        if not created:
-            # 更新现有记录
-            library.library_name_cn = str(row[header_mapping['library_name_cn']]).strip() if 'library_name_cn' in header_mapping else library_name
-            library.description = str(row[header_mapping['description']]).strip() if 'description' in header_mapping else ''
-            library.version = str(row[header_mapping['version']]).strip() if 'version' in header_mapping else ''
-            library.category = str(row[header_mapping['category']]).strip() if 'category' in header_mapping else ''
-            library.is_builtin = parse_boolean(row[header_mapping['is_builtin']]) if 'is_builtin' in header_mapping else False
-            library.is_standard = parse_boolean(row[header_mapping['is_standard']]) if 'is_standard' in header_mapping else False
-            library.save()
-        
-        return 1
-    except Exception as e:
-        raise Exception(f"处理库数据失败: {str(e)}")
-
-def process_module_row(row, header_mapping):
-    """处理模块数据行"""
-    try:
-        library_name = str(row[header_mapping['library_name']]).strip()
-        module_name = str(row[header_mapping['module_name']]).strip()
-        
-        if not library_name or not module_name or library_name == 'nan' or module_name == 'nan':
-            return 0
-        
-        # 获取库
-        try:
-            library = Library.objects.get(library_name=library_name)
-        except Library.DoesNotExist:
-            raise Exception(f"库 '{library_name}' 不存在")
-        
-        # 检查是否已存在
-        module, created = Module.objects.get_or_create(
-            library=library,
-            module_name=module_name,
-            defaults={
-                'description': str(row[header_mapping['description']]).strip() if 'description' in header_mapping else '',
-                'is_builtin': parse_boolean(row[header_mapping['is_builtin']]) if 'is_builtin' in header_mapping else False,
-            }
-        )
-        
-        if not created:
-            # 更新现有记录
-            module.description = str(row[header_mapping['description']]).strip() if 'description' in header_mapping else ''
-            module.is_builtin = parse_boolean(row[header_mapping['is_builtin']]) if 'is_builtin' in header_mapping else False
-            module.save()
-        
-        return 1
-    except Exception as e:
-        raise Exception(f"处理模块数据失败: {str(e)}")
-
-def process_function_row(row, header_mapping):
-    """处理函数数据行"""
-    try:
-        library_name = str(row[header_mapping['library_name']]).strip()
-        module_name = str(row[header_mapping['module_name']]).strip()
-        function_name = str(row[header_mapping['function_name']]).strip()
-        
-        if not library_name or not module_name or not function_name or 'nan' in [library_name, module_name, function_name]:
-            return 0
-        
-        # 获取模块
-        try:
-            module = Module.objects.get(library__library_name=library_name, module_name=module_name)
-        except Module.DoesNotExist:
-            raise Exception(f"模块 '{library_name}.{module_name}' 不存在")
-        
-        # 获取操作类型
-        operation_type = None
-        if 'operation_type' in header_mapping:
-            operation_type_name = str(row[header_mapping['operation_type']]).strip()
-            if operation_type_name and operation_type_name != 'nan':
-                operation_type, _ = OperationType.objects.get_or_create(
-                    operation_name_cn=operation_type_name,
-                    defaults={'operation_name': operation_type_name}
-                )
-        
-        # 检查是否已存在
-        function, created = Function.objects.get_or_create(
-            module=module,
-            function_name=function_name,
-            defaults={
-                'function_name_cn': str(row[header_mapping['function_name_cn']]).strip() if 'function_name_cn' in header_mapping else '',
-                'description': str(row[header_mapping['description']]).strip() if 'description' in header_mapping else '',
-                'description_cn': str(row[header_mapping['description_cn']]).strip() if 'description_cn' in header_mapping else '',
-                'operation_type': operation_type,
-                'syntax': str(row[header_mapping['syntax']]).strip() if 'syntax' in header_mapping else '',
-                'parameters_text': str(row[header_mapping['parameters_text']]).strip() if 'parameters_text' in header_mapping else '',
-                'return_value': str(row[header_mapping['return_value']]).strip() if 'return_value' in header_mapping else '',
-                'return_value_cn': str(row[header_mapping['return_value_cn']]).strip() if 'return_value_cn' in header_mapping else '',
-                'example': str(row[header_mapping['example']]).strip() if 'example' in header_mapping else '',
-                'example_cn': str(row[header_mapping['example_cn']]).strip() if 'example_cn' in header_mapping else '',
-                'availability': str(row[header_mapping['availability']]).strip() if 'availability' in header_mapping else '',
-                'version_added': str(row[header_mapping['version_added']]).strip() if 'version_added' in header_mapping else '',
-            }
-        )
-        
-        if not created:
-            # 更新现有记录
-            function.function_name_cn = str(row[header_mapping['function_name_cn']]).strip() if 'function_name_cn' in header_mapping else ''
-            function.description = str(row[header_mapping['description']]).strip() if 'description' in header_mapping else ''
-            function.description_cn = str(row[header_mapping['description_cn']]).strip() if 'description_cn' in header_mapping else ''
-            function.operation_type = operation_type
-            function.syntax = str(row[header_mapping['syntax']]).strip() if 'syntax' in header_mapping else ''
-            function.parameters_text = str(row[header_mapping['parameters_text']]).strip() if 'parameters_text' in header_mapping else ''
-            function.return_value = str(row[header_mapping['return_value']]).strip() if 'return_value' in header_mapping else ''
-            function.return_value_cn = str(row[header_mapping['return_value_cn']]).strip() if 'return_value_cn' in header_mapping else ''
-            function.example = str(row[header_mapping['example']]).strip() if 'example' in header_mapping else ''
-            function.example_cn = str(row[header_mapping['example_cn']]).strip() if 'example_cn' in header_mapping else ''
-            function.availability = str(row[header_mapping['availability']]).strip() if 'availability' in header_mapping else ''
-            function.version_added = str(row[header_mapping['version_added']]).strip() if 'version_added' in header_mapping else ''
-            function.save()
-        
-        return 1
-    except Exception as e:
-        raise Exception(f"处理函数数据失败: {str(e)}")
-
-def process_parameter_row(row, header_mapping):
-    """处理参数数据行"""
-    try:
-        library_name = str(row[header_mapping['library_name']]).strip()
-        module_name = str(row[header_mapping['module_name']]).strip()
-        function_name = str(row[header_mapping['function_name']]).strip()
-        parameter_name = str(row[header_mapping['parameter_name']]).strip()
-        
-        if not all([library_name, module_name, function_name, parameter_name]) or 'nan' in [library_name, module_name, function_name, parameter_name]:
-            return 0
-        
-        # 获取函数
-        try:
-            function = Function.objects.get(
-                module__library__library_name=library_name,
-                module__module_name=module_name,
-                function_name=function_name
-            )
-        except Function.DoesNotExist:
-            raise Exception(f"函数 '{library_name}.{module_name}.{function_name}' 不存在")
-        
-        # 检查是否已存在
-        parameter, created = Parameter.objects.get_or_create(
-            function=function,
-            parameter_name=parameter_name,
-            defaults={
-                'parameter_name_cn': str(row[header_mapping['parameter_name_cn']]).strip() if 'parameter_name_cn' in header_mapping else '',
-                'data_type': str(row[header_mapping['data_type']]).strip() if 'data_type' in header_mapping else '',
-                'is_required': parse_boolean(row[header_mapping['is_required']]) if 'is_required' in header_mapping else True,
-                'default_value': str(row[header_mapping['default_value']]).strip() if 'default_value' in header_mapping else '',
-                'description': str(row[header_mapping['description']]).strip() if 'description' in header_mapping else '',
-                'description_cn': str(row[header_mapping['description_cn']]).strip() if 'description_cn' in header_mapping else '',
-            }
-        )
-        
-        if not created:
-            # 更新现有记录
-            parameter.parameter_name_cn = str(row[header_mapping['parameter_name_cn']]).strip() if 'parameter_name_cn' in header_mapping else ''
-            parameter.data_type = str(row[header_mapping['data_type']]).strip() if 'data_type' in header_mapping else ''
-            parameter.is_required = parse_boolean(row[header_mapping['is_required']]) if 'is_required' in header_mapping else True
-            parameter.default_value = str(row[header_mapping['default_value']]).strip() if 'default_value' in header_mapping else ''
-            parameter.description = str(row[header_mapping['description']]).strip() if 'description' in header_mapping else ''
-            parameter.description_cn = str(row[header_mapping['description_cn']]).strip() if 'description_cn' in header_mapping else ''
-            parameter.save()
-        
-        return 1
-    except Exception as e:
-        raise Exception(f"处理参数数据失败: {str(e)}")
-
-def process_operation_type_row(row, header_mapping):
-    """处理操作类型数据行"""
-    try:
-        operation_name = str(row[header_mapping['operation_name']]).strip()
-        if not operation_name or operation_name == 'nan':
-            return 0
-        
-        # 检查是否已存在
-        operation_type, created = OperationType.objects.get_or_create(
-            operation_name=operation_name,
-            defaults={
-                'operation_name_cn': str(row[header_mapping['operation_name_cn']]).strip() if 'operation_name_cn' in header_mapping else operation_name,
-                'description': str(row[header_mapping['description']]).strip() if 'description' in header_mapping else '',
-            }
-        )
-        
-        if not created:
-            # 更新现有记录
-            operation_type.operation_name_cn = str(row[header_mapping['operation_name_cn']]).strip() if 'operation_name_cn' in header_mapping else operation_name
-            operation_type.description = str(row[header_mapping['description']]).strip() if 'description' in header_mapping else ''
-            operation_type.save()
-        
-        return 1
-    except Exception as e:
-        raise Exception(f"处理操作类型数据失败: {str(e)}")
-
-def parse_boolean(value):
-    """解析布尔值"""
-    if isinstance(value, bool):
-        return value
-    if isinstance(value, str):
-        value = value.strip().lower()
-        if value in ['true', '1', 'yes', '是', 't']:
-            return True
-        elif value in ['false', '0', 'no', '否', 'f']:
-            return False
-    return False
+@require_http_methods(["GET"])
+def import_job_status_api(request, job_id):
+    """导入任务状态API"""
+    fail_stale_jobs()
+    job = ImportJob.objects.filter(job_id=job_id).first()
+    if job is None:
+        return JsonResponse({
+            'success': False,
+            'message': '导入任务不存在'
+        }, status=404)
+    return JsonResponse({'success': True, **get_job_status(job)})
 
 @require_http_methods(["GET"])
-def get_function_stats_api(request):
+async def get_function_stats_api(request):
     """获取函数统计信息API"""
     try:
-        from django.db.models import Count
-        
         stats = {
-            'libraries': Library.objects.count(),
-            'modules': Module.objects.count(),
-            'functions': Function.objects.count(),
-            'parameters': Parameter.objects.count()
+            'libraries': await Library.objects.acount(),
+            'modules': await Module.objects.acount(),
+            'functions': await Function.objects.acount(),
+            'parameters': await Parameter.objects.acount()
         }
         
         return JsonResponse({
@@ -1694,118 +1230,33 @@ def get_table_structure_api(request):
 def export_functions_api(request):
     """导出函数数据API"""
     try:
-        from django.http import HttpResponse
-        import openpyxl
-        from openpyxl.styles import Font, Alignment, PatternFill
-        from openpyxl.utils import get_column_letter
-        import io
-        
         # 获取查询参数
         format_type = request.GET.get('format', 'xlsx')  # 默认xlsx格式
         
-        if format_type == 'csv':
-            # CSV格式导出
-            import csv
-            response = HttpResponse(content_type='text/csv; charset=utf-8')
+        if format_type == 'template':
+            # 完整备份：按导入模板格式导出全部五张表，可直接上传恢复
+            return FileResponse(
+                export_xlsx_file(write_snapshot_xlsx),
+                as_attachment=True,
+                filename='函数数据库备份.xlsx',
+                content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+            )
+        
+        elif format_type == 'csv':
+            # CSV格式导出：边读取边输出
+            response = StreamingHttpResponse(iter_csv(), content_type='text/csv; charset=utf-8')
             response['Content-Disposition'] = 'attachment; filename="函数数据库表.csv"'
-            response.write('\ufeff')  # 添加BOM以支持中文
-            
-            writer = csv.writer(response)
-            writer.writerow(['库名称', '模块名称', '函数名称', '函数中文名称', '描述', '操作类型', '语法', '参数', '返回值', '示例'])
-            
-            functions = Function.objects.select_related('module', 'module__library', 'operation_type')
-            
-            for function in functions:
-                writer.writerow([
-                    function.module.library.library_name_cn,
-                    function.module.module_name,
-                    function.function_name,
-                    function.function_name_cn or '',
-                    function.description_cn or function.description or '',
-                    function.operation_type.operation_name_cn if function.operation_type else '',
-                    function.syntax or '',
-                    function.parameters_text or '',
-                    function.return_value_cn or function.return_value or '',
-                    function.example_cn or function.example or ''
-                ])
             
             return response
         
         else:
-            # XLSX格式导出
-            # 创建工作簿和工作表
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "函数数据库表"
-            
-            # 定义表头
-            headers = [
-                '库名称', '模块名称', '函数名称', '函数中文名称', '描述', 
-                '操作类型', '语法', '参数', '返回值', '示例'
-            ]
-            
-            # 设置表头样式
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            header_alignment = Alignment(horizontal="center", vertical="center")
-            
-            # 写入表头
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = header_alignment
-            
-            # 获取数据
-            functions = Function.objects.select_related('module', 'module__library', 'operation_type')
-            
-            # 写入数据
-            for row, function in enumerate(functions, 2):
-                ws.cell(row=row, column=1, value=function.module.library.library_name_cn)
-                ws.cell(row=row, column=2, value=function.module.module_name)
-                ws.cell(row=row, column=3, value=function.function_name)
-                ws.cell(row=row, column=4, value=function.function_name_cn or '')
-                ws.cell(row=row, column=5, value=function.description_cn or function.description or '')
-                ws.cell(row=row, column=6, value=function.operation_type.operation_name_cn if function.operation_type else '')
-                ws.cell(row=row, column=7, value=function.syntax or '')
-                ws.cell(row=row, column=8, value=function.parameters_text or '')
-                ws.cell(row=row, column=9, value=function.return_value_cn or function.return_value or '')
-                ws.cell(row=row, column=10, value=function.example_cn or function.example or '')
-            
-            # 自动调整列宽
-            for col in range(1, len(headers) + 1):
-                column_letter = get_column_letter(col)
-                max_length = 0
-                column = ws[column_letter]
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)  # 最大宽度50
-                ws.column_dimensions[column_letter].width = adjusted_width
-            
-            # 设置数据行样式
-            data_alignment = Alignment(horizontal="left", vertical="top", wrap_text=True)
-            for row in range(2, ws.max_row + 1):
-                for col in range(1, len(headers) + 1):
-                    cell = ws.cell(row=row, column=col)
-                    cell.alignment = data_alignment
-            
-            # 保存到内存
-            output = io.BytesIO()
-            wb.save(output)
-            output.seek(0)
-            
-            # 创建响应
-            response = HttpResponse(
-                output.getvalue(),
+            # XLSX格式导出：只写模式写入临时文件，响应结束后自动删除
+            return FileResponse(
+                export_xlsx_file(),
+                as_attachment=True,
+                filename='函数数据库表.xlsx',
                 content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
             )
-            response['Content-Disposition'] = 'attachment; filename="函数数据库表.xlsx"'
-            
-            return response
         
     except Exception as e:
         return JsonResponse({
@@ -1831,14 +1282,8 @@ def download_template_api(request):
             {
                 'name': '函数库表',
                 'sheet_name': 'Library',
-                'headers': [
-                    'library_name', 'library_name_cn', 'description', 'version', 
-                    'category', 'is_builtin', 'is_standard'
-                ],
-                'header_names': [
-                    '库名称(英文)', '库名称(中文)', '描述', '版本', 
-                    '分类', '是否内置', '是否标准库'
-                ],
+                'headers': LIBRARY_FIELDS,
+                'header_names': TEMPLATE_HEADERS['Library'],
                 'sample_data': [
                     ['os', '操作系统接口', '提供操作系统相关功能', '3.x', '系统', True, True],
                     ['sys', '系统相关参数', '系统相关的参数和函数', '3.x', '系统', True, True]
@@ -1847,12 +1292,8 @@ def download_template_api(request):
             {
                 'name': '模块表',
                 'sheet_name': 'Module',
-                'headers': [
-                    'library_name', 'module_name', 'description', 'is_builtin'
-                ],
-                'header_names': [
-                    '所属库名称', '模块名称', '描述', '是否内置'
-                ],
+                'headers': MODULE_FIELDS,
+                'header_names': TEMPLATE_HEADERS['Module'],
                 'sample_data': [
                     ['os', 'path', '路径操作相关函数', True],
                     ['os', 'file', '文件操作相关函数', True]
@@ -1861,18 +1302,8 @@ def download_template_api(request):
             {
                 'name': '函数表',
                 'sheet_name': 'Function',
-                'headers': [
-                    'library_name', 'module_name', 'function_name', 'function_name_cn',
-                    'description', 'description_cn', 'operation_type', 'syntax',
-                    'parameters_text', 'return_value', 'return_value_cn', 'example',
-                    'example_cn', 'availability', 'version_added'
-                ],
-                'header_names': [
-                    '所属库名称', '所属模块名称', '函数名称(英文)', '函数名称(中文)',
-                    '描述(英文)', '描述(中文)', '操作类型', '语法',
-                    '参数文本', '返回值(英文)', '返回值(中文)', '示例(英文)',
-                    '示例(中文)', '可用性', '版本'
-                ],
+                'headers': FUNCTION_FIELDS,
+                'header_names': TEMPLATE_HEADERS['Function'],
                 'sample_data': [
                     ['os', 'path', 'join', '路径拼接', 'Join path components', '拼接路径组件', '路径操作', 'os.path.join(path, *paths)', 'path, *paths', 'str', '字符串', 'os.path.join("a", "b")', 'os.path.join("a", "b")', 'All', '1.4']
                 ]
@@ -1880,16 +1311,8 @@ def download_template_api(request):
             {
                 'name': '参数表',
                 'sheet_name': 'Parameter',
-                'headers': [
-                    'library_name', 'module_name', 'function_name', 'parameter_name',
-                    'parameter_name_cn', 'data_type', 'is_required', 'default_value',
-                    'description', 'description_cn'
-                ],
-                'header_names': [
-                    '所属库名称', '所属模块名称', '所属函数名称', '参数名称(英文)',
-                    '参数名称(中文)', '数据类型', '是否必需', '默认值',
-                    '描述(英文)', '描述(中文)'
-                ],
+                'headers': PARAMETER_FIELDS,
+                'header_names': TEMPLATE_HEADERS['Parameter'],
                 'sample_data': [
                     ['os', 'path', 'join', 'path', '路径', 'str', True, '', 'Base path', '基础路径'],
                     ['os', 'path', 'join', '*paths', '路径列表', 'str', False, '', 'Additional paths', '额外路径']
@@ -1898,12 +1321,8 @@ def download_template_api(request):
             {
                 'name': '操作类型表',
                 'sheet_name': 'OperationType',
-                'headers': [
-                    'operation_name', 'operation_name_cn', 'description'
-                ],
-                'header_names': [
-                    '操作类型(英文)', '操作类型(中文)', '描述'
-                ],
+                'headers': OPERATION_TYPE_FIELDS,
+                'header_names': TEMPLATE_HEADERS['OperationType'],
                 'sample_data': [
                     ['File Operation', '文件操作', '文件相关的操作类型'],
                     ['Path Operation', '路径操作', '路径相关的操作类型']
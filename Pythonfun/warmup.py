@@ -0,0 +1,146 @@
+"""
+启动预热
+gunicorn 以 preload_app 启动时在主进程中执行（见 gunicorn.conf.py 的 when_ready/pre_fork）：
+编译 templates/ 下的全部模板（缓存模板加载器）、导入导入导出功能用到的 pandas/openpyxl、
+构建分类树和函数库快照。worker 由主进程 fork 而来，以写时复制方式共享这些内存，
+max_requests 回收后新 fork 的 worker 不必在前几个请求中重新编译、导入和构建。
+"""
+import importlib
+import logging
+import os
+import time
+
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+from django.template.exceptions import TemplateSyntaxError
+
+from . import caching
+from .category_tree import CACHE_NAMESPACE as CATEGORY_TREE_CACHE, get_category_tree
+from .function_catalog import CACHE_NAMESPACE as FUNCTION_LIBRARY_CACHE, available_encodings, get_function_library_payload
+from .models import Article
+
+logger = logging.getLogger(__name__)
+
+# 视图中按需导入的重量级模块（Excel 导入导出）
+HEAVY_MODULES = (
+    'pandas',
+    'openpyxl',
+    'openpyxl.cell',
+    'openpyxl.styles',
+    'openpyxl.utils',
+)
+
+# 预先构建的函数库数据版本：函数库页面请求的列式压缩格式，以及不带压缩的默认格式
+# brotli 最高压缩级别较慢（上千个函数约需 1 秒），其余组合请求较少，首次请求时再构建
+PREWARM_PAYLOADS = (
+    ('columnar', 'br'),
+    ('columnar', 'gzip'),
+    ('nested', 'identity'),
+)
+
+# fork 前重新构建的版本：pre_fork 在 gunicorn 主进程的循环中执行，期间不能回收和启动 worker，
+# 只构建耗时很短的版本，brotli 版本由 worker 在首次请求时构建
+FORK_PAYLOADS = tuple(payload for payload in PREWARM_PAYLOADS if payload[1] != 'br')
+
+# 按扩展名识别模板文件（templates/ 下还放有 Excel 数据文件）
+TEMPLATE_EXTENSIONS = ('.html', '.txt')
+
+# 上次构建缓存时各命名空间的代数，代数未变化时 fork 前不重新构建
+_warmed_generations = None
+
+
+def template_names(backend, subdirs=None):
+    """项目模板目录下的模板名称，subdirs 限定第一级子目录（如 front、admin）"""
+    for template_dir in backend.dirs:
+        for root, _, files in os.walk(template_dir):
+            for file_name in sorted(files):
+                if not file_name.endswith(TEMPLATE_EXTENSIONS):
+                    continue
+                name = os.path.relpath(os.path.join(root, file_name), template_dir).replace(os.sep, '/')
+                if subdirs is None or name.split('/')[0] in subdirs:
+                    yield name
+
+
+def compile_templates(subdirs=None, errors=None):
+    """
+    用缓存模板加载器编译项目 templates/ 目录下的模板，返回编译成功的模板数
+    编译失败的模板追加 (模板名, 错误信息) 到 errors；未给出 errors 时记录警告
+    """
+    count = 0
+    for backend in engines.all():
+        if not isinstance(backend, DjangoTemplates):
+            continue
+        for name in template_names(backend, subdirs):
+            try:
+                backend.engine.get_template(name)
+            except (TemplateSyntaxError, UnicodeDecodeError) as e:
+                if errors is None:
+                    logger.warning('模板编译失败 %s: %s', name, e)
+                else:
+                    errors.append((name, str(e)))
+                continue
+            count += 1
+    return count
+
+
+def import_heavy_modules():
+    for name in HEAVY_MODULES:
+        importlib.import_module(name)
+
+
+def _generations():
+    return tuple(caching.get_generation(namespace) for namespace in (CATEGORY_TREE_CACHE, FUNCTION_LIBRARY_CACHE))
+
+
+def warm_caches(payloads=PREWARM_PAYLOADS):
+    """
+    构建各内容类型的分类树和函数库快照（含 payloads 中的压缩版本），已有缓存时直接读取
+    返回是否执行了构建（缓存代数与上次构建时不同）
+    """
+    global _warmed_generations
+    generations = _generations()
+    if generations == _warmed_generations:
+        return False
+    for content_type in Article.ContentType.values:
+        get_category_tree(content_type)
+    encodings = available_encodings()
+    for format_type, encoding in payloads:
+        if encoding == 'identity' or encoding in encodings:
+            get_function_library_payload(format_type, encoding)
+    _warmed_generations = generations
+    return True
+
+
+def prewarm():
+    """编译模板、导入重量级模块并构建缓存，返回编译的模板数和各步骤耗时（毫秒）"""
+    global _warmed_generations
+    start = time.perf_counter()
+    timings = {'templates': compile_templates()}
+    timings['templates_ms'] = round((time.perf_counter() - start) * 1000, 1)
+
+    start = time.perf_counter()
+    import_heavy_modules()
+    timings['imports_ms'] = round((time.perf_counter() - start) * 1000, 1)
+
+    start = time.perf_counter()
+    _warmed_generations = None
+    warm_caches()
+    timings['caches_ms'] = round((time.perf_counter() - start) * 1000, 1)
+
+    logger.info(
+        f'启动预热完成: {timings["templates"]} 个模板 {timings["templates_ms"]}ms, '
+        f'模块导入 {timings["imports_ms"]}ms, 缓存 {timings["caches_ms"]}ms'
+    )
+    return timings
+
+
+def refresh_before_fork():
+    """
+    gunicorn pre_fork 钩子（主进程）：预热后缓存代数发生变化（worker 写入了数据）时重新构建 FORK_PAYLOADS，
+    返回是否重新构建；未预热时不构建
+    只有共享缓存中能看到 worker 递增的代数；本地内存缓存（单个 worker）下主进程的代数不变，
+    worker 继承的缓存在 LOCAL_CACHE_TIMEOUT 后过期
+    """
+    if _warmed_generations is None:
+        return False
+    return warm_caches(FORK_PAYLOADS)
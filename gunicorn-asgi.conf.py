@@ -0,0 +1,65 @@
+# Gunicorn ASGI配置文件（uvicorn worker）
+# 启动：gunicorn mysite.asgi:application -c gunicorn-asgi.conf.py
+# 每个 worker 用一个事件循环处理多个并发请求，异步视图等待数据库时不会占住整个 worker
+import multiprocessing
+import os
+
+# 异步视图的查询在线程中执行，持久连接会按线程累积且请求结束时不会被回收，ASGI 部署不使用持久连接
+os.environ.setdefault("DB_CONN_MAX_AGE", "0")
+
+# 服务器套接字
+bind = "0.0.0.0:8000"
+backlog = 2048
+
+# 工作进程：异步 worker 本身可以并发处理请求，数量与 CPU 核数相同即可
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_class = "uvicorn_worker.UvicornWorker"
+timeout = 30
+keepalive = 2
+
+# 重启
+max_requests = 1000
+max_requests_jitter = 50
+preload_app = True
+
+# 日志
+accesslog = "-"
+errorlog = "-"
+loglevel = "info"
+
+# 进程命名
+proc_name = "思维空间-asgi"
+
+# 用户和组
+user = None
+group = None
+
+# 临时目录
+tmp_upload_dir = None
+
+
+# 启动预热（见 Pythonfun/warmup.py）
+def when_ready(server):
+    if server.cfg.preload_app:
+        from Pythonfun.warmup import prewarm
+        prewarm()
+
+
+# 数据库连接：preload_app 时 worker 不能继承主进程的数据库连接（见 Pythonfun/db_connections.py）
+def pre_fork(server, worker):
+    if server.cfg.preload_app:
+        from Pythonfun.warmup import refresh_before_fork
+        refresh_before_fork()
+    from Pythonfun.db_connections import close_before_fork
+    close_before_fork()
+
+
+def post_fork(server, worker):
+    from Pythonfun.db_connections import reset_after_fork
+    reset_after_fork()
+
+
+# 缓存：多个 worker 各自的本地内存缓存无法同步失效，未设置 REDIS_URL 时记录警告（见 Pythonfun/caching.py）
+def post_worker_init(worker):
+    from Pythonfun.caching import require_shared_cache
+    require_shared_cache(worker.cfg.workers)
@@ -32,3 +32,32 @@ group = None
 
 # 临时目录
 tmp_upload_dir = None
+
+
+# 启动预热：preload_app 时在主进程中编译模板、导入重量级模块、构建缓存，
+# worker 以写时复制方式共享，回收后重新 fork 的 worker 没有冷启动开销（见 Pythonfun/warmup.py）
+def when_ready(server):
+    if server.cfg.preload_app:
+        from Pythonfun.warmup import prewarm
+        prewarm()
+
+
+# 数据库连接：preload_app 时主进程已加载 Django，worker 不能继承主进程的数据库连接
+# 每个 worker 之后按 CONN_MAX_AGE 复用自己的持久连接（见 Pythonfun/db_connections.py）
+def pre_fork(server, worker):
+    if server.cfg.preload_app:
+        from Pythonfun.warmup import refresh_before_fork
+        refresh_before_fork()
+    from Pythonfun.db_connections import close_before_fork
+    close_before_fork()
+
+
+def post_fork(server, worker):
+    from Pythonfun.db_connections import reset_after_fork
+    reset_after_fork()
+
+
+# 缓存：多个 worker 各自的本地内存缓存无法同步失效，未设置 REDIS_URL 时记录警告（见 Pythonfun/caching.py）
+def post_worker_init(worker):
+    from Pythonfun.caching import require_shared_cache
+    require_shared_cache(worker.cfg.workers)
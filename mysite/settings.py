@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.0/ref/settings/
 """
 import os
+import sys
 from pathlib import Path
 from decouple import config
 import dj_database_url  # <-- 移到顶部，方便Vercel检测依赖
@@ -44,20 +45,26 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    # WhiteNoise 静态文件服务（支持 ASGI 的子类）
+    'Pythonfun.middleware.StaticFilesMiddleware',
+    # 请求性能指标（查询次数、数据库/模板耗时），放在前面以统计整页缓存命中的请求
+    'Pythonfun.request_metrics.RequestMetricsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    # 前台页面整页缓存，依赖 request.user，需放在认证中间件之后
+    'Pythonfun.middleware.FrontPageCacheMiddleware',
 ]
 
 ROOT_URLCONF = 'mysite.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        # Django 模板后端，额外统计渲染耗时（见 Pythonfun.request_metrics）
+        'BACKEND': 'Pythonfun.request_metrics.TimedDjangoTemplates',
         'DIRS': [os.path.join(BASE_DIR, 'templates')],  # 指向 templates 根目录
         'APP_DIRS': True,
         'OPTIONS': {
@@ -80,7 +87,25 @@ WSGI_APPLICATION = 'mysite.wsgi.app'
 # 数据库配置
 DATABASE_URL = config('DATABASE_URL', default=None)
 
-if DEBUG:
+# 数据库持久连接（秒）：同步 worker 在请求之间复用连接，避免每个请求重新建立 TLS 连接
+# ASGI 部署设为 0（gunicorn-asgi.conf.py 中设置）
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=600, cast=int)
+
+# 运行测试时使用本地SQLite，避免连接远程数据库
+TESTING = len(sys.argv) > 1 and sys.argv[1] == 'test'
+# 设置后测试改用该 PostgreSQL 数据库（如本地 postgres://postgres@localhost/postgres），运行仅限 PostgreSQL 的测试
+TEST_DATABASE_URL = config('TEST_DATABASE_URL', default=None)
+
+if TESTING and TEST_DATABASE_URL:
+    DATABASES = {'default': dj_database_url.parse(TEST_DATABASE_URL)}
+elif TESTING:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'test_db.sqlite3',
+        }
+    }
+elif DEBUG:
     # 开发环境使用PostgreSQL连接池
     DATABASES = {
         'default': {
@@ -94,27 +119,105 @@ if DEBUG:
                 'sslmode': 'require',
                 'options': '-c search_path=public'  # 指定schema
             },
+            # 事务模式连接池不支持跨事务的服务端游标；大表按主键分段查询（见 function_export.iter_by_key）
+            'DISABLE_SERVER_SIDE_CURSORS': True,
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
         }
     }
-    print("[OK] 开发环境使用PostgreSQL连接池")
 elif DATABASE_URL:
     # 生产环境使用PostgreSQL
     if DATABASE_URL.startswith('postgresql://') or DATABASE_URL.startswith('postgres://'):
         DATABASES = {
-            'default': dj_database_url.config(
-                default=DATABASE_URL,
-                conn_max_age=600,  # 连接池最大存活时间（秒）
-                conn_health_checks=True,  # 启用连接健康检查
-                ssl_require=True  # 生产环境要求SSL
-            )
+            'default': {
+                **dj_database_url.config(
+                    default=DATABASE_URL,
+                    conn_max_age=DB_CONN_MAX_AGE,  # 持久连接最大存活时间（秒）
+                    conn_health_checks=True,  # 启用连接健康检查
+                    ssl_require=True  # 生产环境要求SSL
+                ),
+                # 生产环境同样通过 Supabase 事务模式连接池（6543 端口）连接
+                'DISABLE_SERVER_SIDE_CURSORS': True,
+            }
         }
-        print(f"[OK] 生产环境使用PostgreSQL数据库: {DATABASE_URL[:50]}...")
     else:
         raise ValueError(f"不支持的数据库URL格式: {DATABASE_URL}")
 else:
     raise ValueError("生产环境必须设置DATABASE_URL环境变量")
 
 
+# 缓存配置
+# 默认使用本地内存缓存；设置 REDIS_URL 后切换为Redis，多个进程共享缓存
+REDIS_URL = config('REDIS_URL', default=None)
+
+if REDIS_URL and not TESTING:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'pythonfun-cache',
+        }
+    }
+
+# 带版本号的缓存（分类树、函数库快照、整页缓存）的有效期（秒），见 Pythonfun/caching.py
+# 数据变更时递增的代数保存在缓存中：共享缓存下所有进程立即失效；
+# 本地内存缓存下只有执行写入的进程失效，其他 worker 和 Vercel 实例最多在 LOCAL_CACHE_TIMEOUT 秒内返回旧数据
+SHARED_CACHE_TIMEOUT = config('SHARED_CACHE_TIMEOUT', default=60 * 60 * 24, cast=int)
+LOCAL_CACHE_TIMEOUT = config('LOCAL_CACHE_TIMEOUT', default=60, cast=int)
+# 多个 gunicorn worker 使用本地内存缓存时默认只记录警告；设为 True 则 worker 启动失败，强制配置 REDIS_URL
+REQUIRE_SHARED_CACHE = config('REQUIRE_SHARED_CACHE', default=False, cast=bool)
+
+# 整页缓存版本，部署新版本模板后旧的页面缓存不再使用（Redis缓存跨部署保留）
+PAGE_CACHE_VERSION = config('PAGE_CACHE_VERSION', default=config('VERCEL_GIT_COMMIT_SHA', default='dev'))
+
+
+# 请求性能预算：URL名称 -> {queries, db_ms, template_ms, total_ms}，超出时记录警告
+# 查询次数按缓存未命中、管理员登录的情况估算；测试环境超出预算直接失败
+REQUEST_BUDGETS = {
+    'Pythonfun:index': {'queries': 6},
+    'Pythonfun:category': {'queries': 7},
+    'Pythonfun:data_structure': {'queries': 6},
+    'Pythonfun:ai_programming': {'queries': 6},
+    'Pythonfun:tutorial_detail': {'queries': 6},
+    'Pythonfun:function_library_api': {'queries': 4},
+    'Pythonfun:function_query_api': {'queries': 4},
+}
+REQUEST_BUDGET_RAISE = config('REQUEST_BUDGET_RAISE', default=TESTING, cast=bool)
+
+# 函数数据后台导入：上传后立即返回，由 gunicorn worker 进程内的线程执行导入（见 Pythonfun/import_jobs.py）
+# 只适用于常驻进程；Vercel 等无服务器环境返回响应后冻结实例，必须保持关闭，使用同步导入
+IMPORT_JOBS_BACKGROUND = config('IMPORT_JOBS_BACKGROUND', default=False, cast=bool)
+# 排队中/导入中的任务超过该秒数没有进度时视为已丢失（worker 回收或重启），标记为失败
+IMPORT_JOB_TIMEOUT = config('IMPORT_JOB_TIMEOUT', default=30 * 60, cast=int)
+
+# 冷启动预算：新进程导入 WSGI 应用并加载URL配置的耗时上限（毫秒），见 manage.py profile_imports
+STARTUP_BUDGET_MS = config('STARTUP_BUDGET_MS', default=1500, cast=int)
+
+# 日志配置
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'Pythonfun': {
+            'handlers': ['console'],
+            # 测试时只输出警告，避免每个请求的指标日志刷屏
+            'level': 'WARNING' if TESTING else 'INFO',
+        },
+    },
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -153,8 +256,22 @@ STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 STATICFILES_DIRS = [os.path.join(BASE_DIR, 'static')]
 
-# Whitenoise配置
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# 静态文件存储：collectstatic 时文件名加入内容哈希，并预先生成 gzip/brotli 压缩版本（需安装 Brotli）
+# WhiteNoise 对带哈希的文件返回一年的缓存有效期（immutable）；DEBUG 下 {% static %} 不使用哈希文件名
+# 测试环境没有运行 collectstatic，使用普通存储
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': (
+            'django.contrib.staticfiles.storage.StaticFilesStorage' if TESTING
+            else 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+        ),
+    },
+}
+# 未带哈希的静态文件（如直接引用的 /static/ 路径）缓存一天
+WHITENOISE_MAX_AGE = 60 * 60 * 24
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
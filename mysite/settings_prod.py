@@ -96,13 +96,7 @@ LOGGING = {
 # 确保日志目录存在
 os.makedirs(os.path.join(BASE_DIR, 'logs'), exist_ok=True)
 
-# 缓存配置（生产环境建议使用Redis）
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
-    }
-}
+# 缓存配置：沿用 settings.py 的 CACHES，设置 REDIS_URL 时使用Redis（多个 gunicorn worker 时必须设置）
 
 # 会话配置
 SESSION_COOKIE_AGE = 3600  # 1小时
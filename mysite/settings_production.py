@@ -9,7 +9,9 @@ import os
 from .settings import (
     BASE_DIR, SECRET_KEY, INSTALLED_APPS, MIDDLEWARE, ROOT_URLCONF, TEMPLATES,
     WSGI_APPLICATION, AUTH_PASSWORD_VALIDATORS, LANGUAGE_CODE, TIME_ZONE,
-    USE_I18N, USE_TZ, STATIC_URL, DEFAULT_AUTO_FIELD, LOGIN_URL, LOGIN_REDIRECT_URL
+    USE_I18N, USE_TZ, STATIC_URL, DEFAULT_AUTO_FIELD, LOGIN_URL, LOGIN_REDIRECT_URL,
+    CACHES, SHARED_CACHE_TIMEOUT, LOCAL_CACHE_TIMEOUT, REQUIRE_SHARED_CACHE, PAGE_CACHE_VERSION, REQUEST_BUDGETS, DB_CONN_MAX_AGE, STARTUP_BUDGET_MS,
+    STORAGES, WHITENOISE_MAX_AGE, IMPORT_JOBS_BACKGROUND, IMPORT_JOB_TIMEOUT
 )
 
 # 生产环境设置
@@ -26,6 +28,25 @@ SECURE_HSTS_SECONDS = 31536000
 SECURE_HSTS_INCLUDE_SUBDOMAINS = True
 SECURE_HSTS_PRELOAD = True
 
+# 模板：显式使用缓存模板加载器，每个模板在进程内只解析一次
+# 指定 loaders 时不能同时开启 APP_DIRS，由 app_directories 加载器读取应用模板（如 admin）
+TEMPLATES = [{
+    **TEMPLATES[0],
+    'APP_DIRS': False,
+    'OPTIONS': {
+        **TEMPLATES[0]['OPTIONS'],
+        'loaders': [
+            ('django.template.loaders.cached.Loader', [
+                'django.template.loaders.filesystem.Loader',
+                'django.template.loaders.app_directories.Loader',
+            ]),
+        ],
+    },
+}]
+
+# 超出性能预算只记录警告
+REQUEST_BUDGET_RAISE = False
+
 # 允许的主机
 ALLOWED_HOSTS = [
     '.vercel.app',
@@ -52,19 +73,18 @@ if not (DATABASE_URL.startswith('postgresql://') or DATABASE_URL.startswith('pos
 
 # 生产环境PostgreSQL配置
 DATABASES = {
-    'default': dj_database_url.parse(
-        DATABASE_URL,
-        conn_max_age=600,  # 连接池最大存活时间
-        conn_health_checks=True,  # 启用连接健康检查
-        ssl_require=True  # 强制SSL连接
-    )
+    'default': {
+        **dj_database_url.parse(
+            DATABASE_URL,
+            conn_max_age=DB_CONN_MAX_AGE,  # 持久连接最大存活时间
+            conn_health_checks=True,  # 启用连接健康检查
+            ssl_require=True  # 强制SSL连接
+        ),
+        # DATABASE_URL 指向 Supabase 事务模式连接池（6543 端口），不支持跨事务的服务端游标
+        'DISABLE_SERVER_SIDE_CURSORS': True,
+    }
 }
 
-print(f"[OK] 生产环境使用PostgreSQL数据库: {DATABASE_URL[:50]}...")
-print(f"[INFO] 数据库引擎: {DATABASES['default']['ENGINE']}")
-print(f"[INFO] 数据库主机: {DATABASES['default']['HOST']}")
-print(f"[INFO] 数据库端口: {DATABASES['default']['PORT']}")
-print(f"[INFO] 数据库名称: {DATABASES['default']['NAME']}")
 
 # 日志配置
 LOGGING = {
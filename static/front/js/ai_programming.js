@@ -0,0 +1,16 @@
+// 侧边栏选中状态管理
+document.addEventListener('DOMContentLoaded', function() {
+  // 获取当前URL中的分类slug
+  const urlParams = new URLSearchParams(window.location.search);
+  const currentSlug = window.location.pathname.split('/').pop();
+
+  if (currentSlug && currentSlug !== 'ai-programming') {
+    // 查找对应的侧边栏链接并添加选中状态
+    const sidebarLinks = document.querySelectorAll('.sidebar-menu a[data-slug]');
+    sidebarLinks.forEach(link => {
+      if (link.getAttribute('data-slug') === currentSlug) {
+        link.parentElement.classList.add('active');
+      }
+    });
+  }
+});
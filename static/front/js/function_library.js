@@ -0,0 +1,390 @@
+        let libraries = {};
+
+// 把列式数据还原为 {库: {name, modules: [{name, description, items}]}}
+// 模块的函数列表在首次访问时才生成
+function decodeColumnarLibrary(data) {
+    const result = {};
+    const functions = data.functions;
+    let moduleIndex = 0;
+    let functionIndex = 0;
+    data.libraries.key.forEach((libraryKey, libraryIndex) => {
+        const modules = [];
+        for (let m = 0; m < data.libraries.module_count[libraryIndex]; m++, moduleIndex++) {
+            const start = functionIndex;
+            const end = start + data.modules.function_count[moduleIndex];
+            functionIndex = end;
+            let items = null;
+            modules.push({
+                name: data.modules.name[moduleIndex],
+                description: data.modules.description[moduleIndex],
+                get items() {
+                    if (items === null) {
+                        items = [];
+                        for (let i = start; i < end; i++) {
+                            items.push({
+                                type: 'function',
+                                name: functions.name[i],
+                                semantic: functions.semantic[i],
+                                operation: data.strings[functions.operation[i]],
+                                input: data.strings[functions.input[i]],
+                                output: data.strings[functions.output[i]]
+                            });
+                        }
+                    }
+                    return items;
+                }
+            });
+        }
+        result[libraryKey] = {name: data.libraries.name[libraryIndex], modules: modules};
+    });
+    return result;
+}
+
+// 从API加载数据
+async function loadLibraryData() {
+    try {
+        const response = await fetch('/api/function-library/?format=columnar');
+        if (response.ok) {
+            libraries = decodeColumnarLibrary(await response.json());
+            console.log('数据加载成功:', libraries);
+            populateLibrarySelector();
+            init();
+        } else {
+            console.error('加载数据失败:', response.status);
+            // 如果API失败，使用默认数据
+            initWithDefaultData();
+        }
+    } catch (error) {
+        console.error('加载数据出错:', error);
+        // 如果API失败，使用默认数据
+        initWithDefaultData();
+    }
+}
+
+// 动态填充库选择器
+function populateLibrarySelector() {
+    const librarySelector = document.getElementById('library-selector');
+    librarySelector.innerHTML = '<option value="">-- 请选择库 --</option>';
+
+    for (const [libraryKey, libraryData] of Object.entries(libraries)) {
+        const option = document.createElement('option');
+        option.value = libraryKey;
+        option.textContent = libraryData.name;
+        librarySelector.appendChild(option);
+    }
+}
+
+
+
+let currentLibrary = null;
+let currentModule = null;
+let currentClass = null;
+let currentType = null;
+let currentOperation = null;
+let currentSearch = "";
+
+const librarySelector = document.getElementById('library-selector');
+const moduleSelector = document.getElementById('module-selector');
+const classSelector = document.getElementById('class-selector');
+const typeSelector = document.getElementById('type-selector');
+const operationSelector = document.getElementById('operation-selector');
+const searchBox = document.getElementById('search-box');
+const contentTable = document.getElementById('content-table');
+
+function init() {
+    librarySelector.addEventListener('change', function() {
+        currentLibrary = this.value;
+        currentModule = null;
+        currentClass = null;
+        currentType = null;
+        currentOperation = null;
+        currentSearch = "";
+        searchBox.value = "";
+        loadLibrary(currentLibrary);
+    });
+
+    moduleSelector.addEventListener('change', function() {
+        currentModule = this.value;
+        currentClass = null;
+        currentSearch = "";
+        searchBox.value = "";
+        loadClasses();
+        renderTable();
+    });
+
+    classSelector.addEventListener('change', function() {
+        currentClass = this.value;
+        renderTable();
+    });
+
+    typeSelector.addEventListener('change', function() {
+        currentType = this.value;
+        renderTable();
+    });
+
+    operationSelector.addEventListener('change', function() {
+        currentOperation = this.value;
+        renderTable();
+    });
+
+    searchBox.addEventListener('input', function() {
+        currentSearch = this.value.toLowerCase();
+        renderTable();
+    });
+
+    if (librarySelector.value) {
+        currentLibrary = librarySelector.value;
+        loadLibrary(currentLibrary);
+    }
+}
+
+function loadLibrary(libraryId) {
+    const library = libraries[libraryId];
+    generateModuleOptions(library.modules);
+    classSelector.innerHTML = '<option value="">-- 全部类 --</option>';
+    typeSelector.value = "";
+    operationSelector.value = "";
+    if (library.modules.length > 0) {
+        moduleSelector.value = library.modules[0].name;
+        currentModule = library.modules[0].name;
+        loadClasses();
+        renderTable();
+    } else {
+        contentTable.innerHTML = '<tr><td colspan="8" class="empty-message">该库没有可用模块</td></tr>';
+    }
+}
+
+function loadClasses() {
+    if (!currentLibrary || !currentModule) return;
+    const library = libraries[currentLibrary];
+    const module = library.modules.find(m => m.name === currentModule);
+    if (!module) return;
+    classSelector.innerHTML = '<option value="">-- 全部类 --</option>';
+    const classes = module.items.filter(item => item.type === 'class');
+    classes.forEach(cls => {
+        const option = document.createElement('option');
+        option.value = cls.name;
+        option.textContent = cls.name;
+        classSelector.appendChild(option);
+    });
+}
+
+function generateModuleOptions(modules) {
+    moduleSelector.innerHTML = "";
+    const defaultOption = document.createElement('option');
+    defaultOption.value = "";
+    defaultOption.textContent = "-- 选择模块 --";
+    moduleSelector.appendChild(defaultOption);
+    modules.forEach(module => {
+        const option = document.createElement('option');
+        option.value = module.name;
+        option.textContent = `${module.name} - ${module.description}`;
+        moduleSelector.appendChild(option);
+    });
+}
+
+function renderTable() {
+    if (!currentLibrary || !currentModule) {
+        contentTable.innerHTML = '<tr><td colspan="8" class="empty-message">请选择一个库和模块</td></tr>';
+        return;
+    }
+    const library = libraries[currentLibrary];
+    const module = library.modules.find(m => m.name === currentModule);
+    if (!module) {
+        contentTable.innerHTML = '<tr><td colspan="8" class="empty-message">请选择一个模块</td></tr>';
+        return;
+    }
+    let tableContent = "";
+    let hasResults = false;
+    module.items.forEach(item => {
+        if (item.type === 'class') {
+            if (currentClass && currentClass !== item.name) return;
+            if (item.methods) {
+                item.methods.forEach(method => {
+                    if ((!currentType || currentType === 'method') && 
+                        (!currentOperation || currentOperation === method.operation) &&
+                        matchesSearch(method.name, method.semantic)) {
+                        hasResults = true;
+                        tableContent += renderTableRow(
+                            module.name,
+                            item.name,
+                            'method',
+                            method.operation,
+                            method.name,
+                            method.semantic,
+                            method.input,
+                            method.output
+                        );
+                    }
+                });
+            }
+            if (item.attributes) {
+                item.attributes.forEach(attr => {
+                    if ((!currentType || currentType === 'attribute') && 
+                        (!currentOperation || currentOperation === attr.operation) &&
+                        matchesSearch(attr.name, attr.semantic)) {
+                        hasResults = true;
+                        tableContent += renderTableRow(
+                            module.name,
+                            item.name,
+                            'attribute',
+                            attr.operation,
+                            attr.name,
+                            attr.semantic,
+                            attr.input,
+                            attr.output
+                        );
+                    }
+                });
+            }
+        }
+        if (item.type === 'function') {
+            if ((!currentType || currentType === 'function') && 
+                (!currentClass || currentClass === '') && 
+                (!currentOperation || currentOperation === item.operation) &&
+                matchesSearch(item.name, item.semantic)) {
+                hasResults = true;
+                tableContent += renderTableRow(
+                    module.name,
+                    '-',
+                    'function',
+                    item.operation,
+                    item.name,
+                    item.semantic,
+                    item.input,
+                    item.output
+                );
+            }
+        }
+    });
+    if (!hasResults) {
+        tableContent = '<tr><td colspan="8" class="empty-message">没有找到匹配的结果</td></tr>';
+    }
+    contentTable.innerHTML = tableContent;
+}
+
+function renderTableRow(moduleName, className, type, operation, name, semantic, input, output) {
+    let typeBadge = '';
+    let nameElement = '';
+    switch(type) {
+        case 'function':
+            typeBadge = `<span class="type-badge type-function">函数</span>`;
+            nameElement = `<span class="function-name">${highlightSearch(name)}</span>`;
+            break;
+        case 'method':
+            typeBadge = `<span class="type-badge type-method">方法</span>`;
+            nameElement = `<span class="method-name">${highlightSearch(name)}</span>`;
+            break;
+        case 'attribute':
+            typeBadge = `<span class="type-badge type-attribute">属性</span>`;
+            nameElement = `<span class="attribute-name">${highlightSearch(name)}</span>`;
+            break;
+    }
+    return `
+        <tr>
+            <td class="module-name">${moduleName}</td>
+            <td>${className === '-' ? '-' : `<span class="class-name">${className}</span>`}</td>
+            <td>${typeBadge}</td>
+            <td class="operation-type">${operation}</td>
+            <td>${nameElement}</td>
+            <td class="semantic-desc">${highlightSearch(semantic)}</td>
+            <td class="input-structure">${highlightSearch(input)}</td>
+            <td class="output-structure">${highlightSearch(output)}</td>
+        </tr>
+    `;
+}
+
+function matchesSearch(name, semantic) {
+    if (!currentSearch) return true;
+    return name.toLowerCase().includes(currentSearch) || 
+           semantic.toLowerCase().includes(currentSearch);
+}
+
+function highlightSearch(text) {
+    if (!currentSearch || !text) return text;
+    const regex = new RegExp(currentSearch, 'gi');
+    return text.replace(regex, match => `<span class="search-highlight">${match}</span>`);
+}
+
+// 思维导图交互增强功能
+function enhanceTableInteractivity() {
+    // 为表格行添加点击高亮效果
+    contentTable.addEventListener('click', function(e) {
+        const row = e.target.closest('tr');
+        if (row && !row.classList.contains('empty-message')) {
+            // 移除其他行的高亮
+            document.querySelectorAll('.structure-table tr').forEach(tr => {
+                tr.classList.remove('highlighted-row');
+            });
+            // 添加当前行高亮
+            row.classList.add('highlighted-row');
+
+            // 平滑滚动到该行
+            row.scrollIntoView({ 
+                behavior: 'smooth', 
+                block: 'center' 
+            });
+        }
+    });
+
+    // 为类型标签添加点击筛选功能
+    contentTable.addEventListener('click', function(e) {
+        if (e.target.classList.contains('type-badge')) {
+            const type = e.target.textContent.trim();
+            let typeValue = '';
+            switch(type) {
+                case '函数': typeValue = 'function'; break;
+                case '方法': typeValue = 'method'; break;
+                case '属性': typeValue = 'attribute'; break;
+            }
+            if (typeValue) {
+                typeSelector.value = typeValue;
+                currentType = typeValue;
+                renderTable();
+
+                // 添加视觉反馈
+                e.target.style.transform = 'scale(1.1)';
+                setTimeout(() => {
+                    e.target.style.transform = 'scale(1.05)';
+                }, 200);
+            }
+        }
+    });
+
+    // 为操作类型添加点击筛选功能
+    contentTable.addEventListener('click', function(e) {
+        if (e.target.classList.contains('operation-type')) {
+            const operation = e.target.textContent.trim();
+            operationSelector.value = operation;
+            currentOperation = operation;
+            renderTable();
+
+            // 添加视觉反馈
+            e.target.style.color = '#3a0ca3';
+            setTimeout(() => {
+                e.target.style.color = '';
+            }, 500);
+        }
+    });
+}
+
+// 添加高亮行的样式
+const style = document.createElement('style');
+style.textContent = `
+    .highlighted-row {
+        background-color: rgba(67, 97, 238, 0.1) !important;
+        border-left: 4px solid #4361ee;
+        transform: translateX(4px);
+    }
+
+    .highlighted-row td {
+        font-weight: 500;
+    }
+`;
+document.head.appendChild(style);
+
+// 页面加载时从API获取数据
+loadLibraryData();
+
+// 初始化交互增强功能
+setTimeout(enhanceTableInteractivity, 100);
@@ -0,0 +1,291 @@
+// 数据变量
+let functions = [];
+let parameters = [];
+
+// 列表分页状态：下一页的游标、是否正在加载、当前搜索（有搜索词时列表显示搜索结果）
+let nextCursor = null;
+let hasMore = true;
+let loadingPage = false;
+let searchTerm = "";
+let searchSeq = 0;
+
+// 获取函数参数
+function getParameters(funcQN) {
+    return parameters.filter((p) => p["函数完整名称"] === funcQN);
+}
+
+// 列表只需要的字段，详情在点击时再加载
+const LIST_FIELDS = "id,module_name,function_name,description";
+
+// 每页加载的函数数；列表滚动到距底部不足 LOAD_MORE_OFFSET 像素时加载下一页
+const PAGE_LIMIT = 100;
+const LOAD_MORE_OFFSET = 200;
+
+// 转换API返回的函数数据
+function toFunctionEntry(func) {
+    return {
+        "ID": func.id,
+        "完整名称": `${func.module_name}.${func.function_name}`,
+        "函数名称": func.function_name,
+        "所属模块": func.module_name,
+        "描述": func.description || "暂无描述",
+        "函数类型": "函数",
+        "源码定义": func.syntax || `def ${func.function_name}(): ...`,
+        "返回值说明": func.return_value || "无返回值说明"
+    };
+}
+
+// 收集API返回的参数数据
+function collectParameters(data) {
+    const result = [];
+    for (const func of data) {
+        if (func.parameters_detail && func.parameters_detail.length > 0) {
+            for (const param of func.parameters_detail) {
+                result.push({
+                    "函数完整名称": `${func.module_name}.${func.function_name}`,
+                    "参数名称": param.name,
+                    "参数类型": param.data_type || "未知",
+                    "结构类型": "基础类型",
+                    "是否有默认值": param.default_value && param.default_value !== "",
+                    "默认值": param.default_value || "",
+                    "参数是否必填": param.is_required,
+                    "描述": param.description || "无描述"
+                });
+            }
+        }
+    }
+    return result;
+}
+
+// 显示加载错误
+function renderLoadError(error) {
+    console.error("加载数据失败:", error);
+    document.getElementById("function-list").innerHTML = `
+        <div style="padding: 20px; text-align: center; color: #e74c3c;">
+            <i class="fas fa-exclamation-circle"></i> 加载失败: ${error.message}
+        </div>
+    `;
+}
+
+// 加载下一页（按游标分页，只追加新的一页，不重建整个列表）
+async function loadNextPage() {
+    if (loadingPage || !hasMore) {
+        return;
+    }
+    loadingPage = true;
+    try {
+        const url = `/api/function-query/?fields=${LIST_FIELDS}&limit=${PAGE_LIMIT}` + (nextCursor ? `&cursor=${nextCursor}` : "");
+        const response = await fetch(url);
+        if (!response.ok) {
+            throw new Error(`API请求失败: ${response.status}`);
+        }
+        const data = await response.json();
+        const page = data.items.map(toFunctionEntry);
+        const firstPage = functions.length === 0;
+        functions.push(...page);
+        nextCursor = data.next_cursor;
+        hasMore = data.has_more;
+
+        // 搜索期间列表显示搜索结果，加载的分页只保存，清空搜索后再显示
+        if (!searchTerm) {
+            if (firstPage) {
+                renderFunctionList(functions);
+            } else {
+                appendFunctionItems(page);
+            }
+        }
+    } catch (error) {
+        hasMore = false;
+        renderLoadError(error);
+    } finally {
+        loadingPage = false;
+    }
+    fillFunctionList();
+}
+
+// 列表内容不足以滚动时继续加载，否则等待滚动到底部
+function fillFunctionList() {
+    const listEl = document.getElementById("function-list");
+    if (!searchTerm && hasMore && listEl.scrollHeight - listEl.scrollTop - listEl.clientHeight < LOAD_MORE_OFFSET) {
+        loadNextPage();
+    }
+}
+
+// 加载函数详情（语法、返回值和参数）
+async function loadFunctionDetail(func) {
+    try {
+        const response = await fetch(`/api/function-query/?function_id=${func["ID"]}`);
+        if (!response.ok) {
+            throw new Error(`API请求失败: ${response.status}`);
+        }
+        const data = await response.json();
+        if (data.items.length > 0) {
+            parameters = collectParameters(data.items);
+            renderFunctionDetail(toFunctionEntry(data.items[0]));
+        }
+    } catch (error) {
+        console.error("加载函数详情失败:", error);
+    }
+}
+
+// 渲染函数列表
+function renderFunctionList(funcs) {
+    const listEl = document.getElementById("function-list");
+
+    if (funcs.length === 0) {
+        listEl.innerHTML = `
+            <div style="padding: 20px; text-align: center;">
+                <i class="fas fa-search-minus"></i> 未找到匹配函数
+            </div>
+        `;
+        return;
+    }
+
+    listEl.innerHTML = "";
+    appendFunctionItems(funcs);
+}
+
+// 向列表末尾追加函数
+function appendFunctionItems(funcs) {
+    const listEl = document.getElementById("function-list");
+    const fragment = document.createDocumentFragment();
+    funcs.forEach((func) => {
+        const item = document.createElement("div");
+        item.className = "function-item";
+        item.dataset.qualifiedName = func["完整名称"];
+        item.innerHTML = `
+            <div class="function-name">
+                <i class="fas fa-${func["函数类型"] === "方法" ? "cube" : "code"}"></i>
+                ${func["函数名称"]}
+            </div>
+            <div class="function-module">${func["所属模块"]}</div>
+        `;
+        item.addEventListener("click", () => {
+            document.querySelectorAll(".function-item").forEach((el) =>
+                el.classList.remove("active")
+            );
+            item.classList.add("active");
+            loadFunctionDetail(func);
+        });
+        fragment.appendChild(item);
+    });
+    listEl.appendChild(fragment);
+}
+
+// 渲染函数详情
+function renderFunctionDetail(func) {
+    const content = document.getElementById("content");
+    const params = getParameters(func["完整名称"]);
+
+    let paramsTable = "";
+    if (params.length > 0) {
+        paramsTable = `
+            <table class="parameters-table">
+                <thead>
+                    <tr>
+                        <th>参数名</th>
+                        <th>类型</th>
+                        <th>结构类型</th>
+                        <th>默认值</th>
+                        <th>参数是否必填</th>
+                        <th>描述</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    ${params
+                        .map(
+                            (p) => `
+                        <tr>
+                            <td><code>${p["参数名称"]}</code></td>
+                            <td>${p["参数类型"] || "未知"}</td>
+                            <td>${p["结构类型"] || "未知"}</td>
+                            <td>${p["是否有默认值"] ? (p["默认值"] || "无") : "无"}</td>
+                            <td>${p["参数是否必填"] ? "是" : "否"}</td>
+                            <td>${p["描述"] || "无描述"}</td>
+                        </tr>
+                    `
+                        )
+                        .join("")}
+                </tbody>
+            </table>
+        `;
+    } else {
+        paramsTable = "<p>该函数没有参数。</p>";
+    }
+
+    content.innerHTML = `
+        <div class="function-header">
+            <h1 class="function-title">${func["函数名称"]}</h1>
+            <div class="function-path">${func["完整名称"]}</div>
+            <div class="function-meta">
+                <div class="meta-item">
+                    <span>模块:</span>
+                    <span>${func["所属模块"]}</span>
+                </div>
+                <div class="meta-item">
+                    <span>类型:</span>
+                    <span>${func["函数类型"]}</span>
+                </div>
+            </div>
+        </div>
+
+        <div style="margin-bottom: 20px;">
+            <h3>功能描述</h3>
+            <p>${func["描述"]}</p>
+        </div>
+
+        <div style="margin-bottom: 20px;">
+            <h3>函数定义</h3>
+            <div class="code-block">${func["源码定义"]}</div>
+        </div>
+
+        <div style="margin-bottom: 20px;">
+            <h3>参数说明</h3>
+            ${paramsTable}
+        </div>
+
+        <div style="margin-bottom: 20px;">
+            <h3>返回值</h3>
+            <p>${func["返回值说明"] || "无返回值说明"}</p>
+        </div>
+    `;
+}
+
+// 搜索功能（服务端按相关度排序）
+async function performSearch() {
+    const term = document.getElementById("search-input").value.trim();
+    // 较早发出的搜索请求晚于后一次搜索返回时丢弃其结果
+    const seq = ++searchSeq;
+    searchTerm = term;
+    if (!term) {
+        renderFunctionList(functions);
+        fillFunctionList();
+        return;
+    }
+
+    try {
+        const response = await fetch(`/api/function-query/?search=${encodeURIComponent(term)}&fields=${LIST_FIELDS}&page_size=100`);
+        if (!response.ok) {
+            throw new Error(`API请求失败: ${response.status}`);
+        }
+        const data = await response.json();
+        if (seq === searchSeq) {
+            renderFunctionList(data.items.map(toFunctionEntry));
+        }
+    } catch (error) {
+        if (seq === searchSeq) {
+            renderLoadError(error);
+        }
+    }
+}
+
+// 初始化
+document.addEventListener("DOMContentLoaded", () => {
+    loadNextPage();
+    document.getElementById("function-list").addEventListener("scroll", fillFunctionList);
+
+    document.getElementById("search-button").addEventListener("click", performSearch);
+    document.getElementById("search-input").addEventListener("keyup", (e) => {
+        if (e.key === "Enter") performSearch();
+    });
+});
@@ -0,0 +1,16 @@
+document.querySelectorAll('.article-list a').forEach(link => {
+  link.addEventListener('click', function(e) {
+    e.preventDefault();
+
+    // 更新左侧激活状态
+    document.querySelectorAll('.article-list a').forEach(a => a.classList.remove('active'));
+    this.classList.add('active');
+
+    // 切换内容
+    const target = this.getAttribute('data-post');
+    document.querySelectorAll('.post').forEach(post => {
+      post.classList.remove('active');
+    });
+    document.getElementById(target).classList.add('active');
+  });
+});
@@ -0,0 +1,385 @@
+// ================= API & 全局变量 =================
+const mainCategoryApiUrl = `/api/main-categories/`;
+const subCategoryApiUrl = `/api/sub-categories/`;
+let mainCategoriesCache = []; // 用于子分类下拉列表
+let currentMainPage = 1;
+let currentSubPage = 1;
+
+// CSRF Token for Django
+function getCookie(name) {
+    let cookieValue = null;
+    if (document.cookie && document.cookie !== '') {
+        const cookies = document.cookie.split(';');
+        for (let i = 0; i < cookies.length; i++) {
+            const cookie = cookies[i].trim();
+            if (cookie.substring(0, name.length + 1) === (name + '=')) {
+                cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+                break;
+            }
+        }
+    }
+    return cookieValue;
+}
+const csrftoken = getCookie('csrftoken');
+
+// ================= Toast提示框 =================
+function showToast(message, type = 'success') {
+  const toastContainer = document.getElementById('toastContainer');
+  const toast = document.createElement('div');
+  toast.className = `toast ${type}`;
+  const iconClass = type === 'success' ? 'fa-check-circle' : 'fa-times-circle';
+  toast.innerHTML = `<i class="fas ${iconClass} toast-icon"></i> ${message}`;
+
+  toastContainer.appendChild(toast);
+
+  setTimeout(() => { toast.classList.add('show'); }, 100);
+
+  setTimeout(() => {
+    toast.classList.remove('show');
+    setTimeout(() => { toast.remove(); }, 500);
+  }, 3000);
+}
+
+// ================= 模态框控制 =================
+const categoryModal = document.getElementById('categoryModal');
+const subCategoryModal = document.getElementById('subCategoryModal');
+const addCategoryBtn = document.getElementById('addCategoryBtn');
+const addSubCategoryBtn = document.getElementById('addSubCategoryBtn');
+
+function setupModal(modal, openBtn, closeBtnId, cancelBtnId, formId, titleId) {
+    const closeBtn = document.getElementById(closeBtnId);
+    const cancelBtn = document.getElementById(cancelBtnId);
+
+    openBtn.addEventListener('click', () => {
+        // 重置表单
+        document.getElementById(formId).reset();
+
+        // 修复：确保清空隐藏的ID字段，避免编辑模式
+        if (formId === 'categoryForm') {
+            document.getElementById('categoryId').value = '';
+            document.getElementById('modalTitle').textContent = '添加主分类';
+        } else if (formId === 'subCategoryForm') {
+            document.getElementById('subCategoryId').value = '';
+            document.getElementById('subModalTitle').textContent = '添加子分类';
+            updateParentCategoryOptions();
+        }
+
+        modal.classList.add('show');
+    });
+
+    const closeModal = () => modal.classList.remove('show');
+    closeBtn.addEventListener('click', closeModal);
+    cancelBtn.addEventListener('click', closeModal);
+    modal.addEventListener('click', (e) => { if (e.target === modal) closeModal(); });
+}
+
+setupModal(categoryModal, addCategoryBtn, 'closeModal', 'cancelBtn', 'categoryForm', 'modalTitle');
+setupModal(subCategoryModal, addSubCategoryBtn, 'closeSubModal', 'cancelSubBtn', 'subCategoryForm', 'subModalTitle');
+
+// ================= 分页渲染 =================
+function renderPagination(container, currentPage, totalPages, onPageClick) {
+  container.innerHTML = '';
+  if (totalPages <= 1) return;
+
+  const createBtn = (text, page, enabled = true) => {
+      const btn = document.createElement('button');
+      btn.innerHTML = text;
+      btn.classList.add('pagination-btn');
+      if (!enabled) btn.classList.add('disabled');
+      btn.addEventListener('click', () => { if (enabled) onPageClick(page); });
+      return btn;
+  }
+
+  container.appendChild(createBtn('&laquo; 上一页', currentPage - 1, currentPage > 1));
+
+  for (let i = 1; i <= totalPages; i++) {
+    const pageLink = document.createElement('a');
+    pageLink.href = '#';
+    pageLink.textContent = i;
+    pageLink.classList.add('page-link');
+    if (i === currentPage) pageLink.classList.add('active');
+    pageLink.addEventListener('click', (e) => { e.preventDefault(); onPageClick(i); });
+    container.appendChild(pageLink);
+  }
+
+  container.appendChild(createBtn('下一页 &raquo;', currentPage + 1, currentPage < totalPages));
+}
+
+// ================= 主分类 CRUD =================
+async function fetchMainCategories(page = 1) {
+    try {
+        const response = await fetch(`${mainCategoryApiUrl}?page=${page}`);
+        if (!response.ok) throw new Error('Network response was not ok');
+        const data = await response.json();
+
+        currentMainPage = data.current_page;
+        mainCategoriesCache = data.items; // 更新缓存
+        const tableBody = document.getElementById('mainCategoryTableBody');
+        tableBody.innerHTML = '';
+
+        if(data.items.length === 0) {
+            tableBody.innerHTML = `<tr><td colspan="6" style="text-align:center;">暂无数据</td></tr>`;
+        }
+
+        data.items.forEach(cat => {
+            const statusBadge = cat.is_enabled ? `<span class="badge badge-success">已启用</span>` : `<span class="badge badge-warning">未启用</span>`;
+            const row = document.createElement('tr');
+            row.innerHTML = `
+                <td>${cat.id}</td>
+                <td>${cat.name}</td>
+                <td>${cat.slug}</td>
+                <td>${cat.order}</td>
+                <td>${statusBadge}</td>
+                <td>
+                    <div class="btn-group">
+                        <button class="btn btn-outline btn-sm" onclick="editCategory(${cat.id})"><i class="fas fa-edit"></i> 编辑</button>
+                        <button class="btn btn-danger btn-sm" onclick="deleteCategory(${cat.id})"><i class="fas fa-trash-alt"></i> 删除</button>
+                    </div>
+                </td>
+            `;
+            tableBody.appendChild(row);
+        });
+
+        renderPagination(document.getElementById('mainCategoryPagination'), data.current_page, data.total_pages, fetchMainCategories);
+    } catch (error) {
+        showToast('加载主分类失败', 'danger');
+        console.error('Fetch error:', error);
+    }
+}
+
+document.getElementById('saveCategoryBtn').addEventListener('click', async () => {
+    const id = document.getElementById('categoryId').value;
+    const name = document.getElementById('categoryName').value.trim();
+    const slug = document.getElementById('categorySlug').value.trim();
+    if (!name || !slug) return showToast('分类名称和别名不能为空!', 'danger');
+
+    const url = id ? `${mainCategoryApiUrl}${id}/` : mainCategoryApiUrl;
+    const method = id ? 'PUT' : 'POST';
+
+    const body = JSON.stringify({
+        name: name,
+        slug: slug,
+        order: parseInt(document.getElementById('categoryOrder').value) || 0,
+        is_enabled: document.getElementById('categoryStatus').value === 'true'
+    });
+
+    try {
+        const response = await fetch(url, {
+            method: method,
+            headers: { 'Content-Type': 'application/json', 'X-CSRFToken': csrftoken },
+            body: body
+        });
+
+        if (!response.ok) throw new Error(await response.text());
+
+        showToast(`主分类已${id ? '更新' : '添加'}`);
+        categoryModal.classList.remove('show');
+        fetchMainCategories(id ? currentMainPage : 1); // 编辑时留着当前页，添加时去第一页
+        // 修复：主分类更新后同时刷新子分类列表，确保主分类选项同步
+        fetchSubCategories(currentSubPage);
+    } catch (error) {
+        showToast(`操作失败: ${error.message}`, 'danger');
+    }
+});
+
+async function editCategory(id) {
+    try {
+        // 修复：使用专门的API端点获取单个主分类信息
+        const response = await fetch(`${mainCategoryApiUrl}${id}/`);
+        if (!response.ok) throw new Error('获取主分类信息失败');
+        const cat = await response.json();
+
+        document.getElementById('modalTitle').textContent = '编辑主分类';
+        document.getElementById('categoryId').value = cat.id;
+        document.getElementById('categoryName').value = cat.name;
+        document.getElementById('categorySlug').value = cat.slug || '';
+        document.getElementById('categoryOrder').value = cat.order || 0;
+        document.getElementById('categoryStatus').value = cat.is_enabled.toString();
+        categoryModal.classList.add('show');
+    } catch (error) {
+        showToast('获取主分类信息失败: ' + error.message, 'danger');
+        console.error('Edit category error:', error);
+    }
+}
+
+async function deleteCategory(id) {
+    if (!confirm('确定要删除这个主分类吗？\n\n⚠️ 注意：如果该主分类下有子分类或文章，删除操作将被阻止。\n此操作不可撤销！')) return;
+
+    try {
+        const response = await fetch(`${mainCategoryApiUrl}${id}/`, {
+            method: 'DELETE',
+            headers: { 'X-CSRFToken': csrftoken }
+        });
+
+        if (response.ok) {
+            showToast('主分类已删除');
+            fetchMainCategories(currentMainPage);
+            // 修复：删除主分类后同时刷新子分类列表，避免显示不存在的主分类
+            fetchSubCategories(currentSubPage);
+        } else {
+            const errorData = await response.json();
+            if (errorData.message) {
+                showToast(errorData.message, 'danger');
+            } else {
+                showToast('删除失败：未知错误', 'danger');
+            }
+        }
+    } catch (error) {
+        showToast('删除失败：' + error.message, 'danger');
+    }
+}
+
+// ================= 子分类 CRUD =================
+async function fetchSubCategories(page = 1) {
+    try {
+        const response = await fetch(`${subCategoryApiUrl}?page=${page}`);
+        if (!response.ok) throw new Error('Network response was not ok');
+        const data = await response.json();
+
+        currentSubPage = data.current_page;
+        const tableBody = document.getElementById('subCategoryTableBody');
+        tableBody.innerHTML = '';
+
+        if(data.items.length === 0) {
+            tableBody.innerHTML = `<tr><td colspan="6" style="text-align:center;">暂无数据</td></tr>`;
+        }
+
+        data.items.forEach(cat => {
+            const statusBadge = cat.is_enabled ? `<span class="badge badge-success">已启用</span>` : `<span class="badge badge-warning">未启用</span>`;
+            const row = document.createElement('tr');
+            row.innerHTML = `
+                <td>${cat.id}</td>
+                <td>${cat.parent_name}</td>
+                <td>${cat.name}</td>
+                <td>${cat.slug}</td>
+                <td>${statusBadge}</td>
+                <td>
+                    <div class="btn-group">
+                        <button class="btn btn-outline btn-sm" onclick="editSubCategory(${cat.id})"><i class="fas fa-edit"></i> 编辑</button>
+                        <button class="btn btn-danger btn-sm" onclick="deleteSubCategory(${cat.id})"><i class="fas fa-trash-alt"></i> 删除</button>
+                    </div>
+                </td>
+            `;
+            tableBody.appendChild(row);
+        });
+
+        renderPagination(document.getElementById('subCategoryPagination'), data.current_page, data.total_pages, fetchSubCategories);
+    } catch (error) {
+        showToast('加载子分类失败', 'danger');
+        console.error('Fetch error:', error);
+    }
+}
+
+function updateParentCategoryOptions() {
+    const select = document.getElementById('parentCategory');
+    select.innerHTML = '<option value="">请选择主分类</option>';
+    // 修复：确保主分类缓存存在且有效
+    if (mainCategoriesCache && mainCategoriesCache.length > 0) {
+        mainCategoriesCache.forEach(cat => {
+            const option = document.createElement('option');
+            option.value = cat.id;
+            option.textContent = cat.name;
+            select.appendChild(option);
+        });
+    } else {
+        // 如果缓存为空，重新获取主分类数据
+        fetchMainCategories().then(() => {
+            mainCategoriesCache.forEach(cat => {
+                const option = document.createElement('option');
+                option.value = cat.id;
+                option.textContent = cat.name;
+                select.appendChild(option);
+            });
+        });
+    }
+}
+
+document.getElementById('saveSubCategoryBtn').addEventListener('click', async () => {
+    const id = document.getElementById('subCategoryId').value;
+    const name = document.getElementById('subCategoryName').value.trim();
+    const slug = document.getElementById('subCategorySlug').value.trim();
+    const parentId = document.getElementById('parentCategory').value;
+    if (!name || !slug || !parentId) return showToast('所有字段均为必填项!', 'danger');
+
+    const url = id ? `${subCategoryApiUrl}${id}/` : subCategoryApiUrl;
+    const method = id ? 'PUT' : 'POST';
+
+    const body = JSON.stringify({
+        name: name,
+        slug: slug,
+        parent_id: parseInt(parentId),
+        is_enabled: document.getElementById('subCategoryStatus').value === 'true'
+    });
+
+    try {
+        const response = await fetch(url, {
+            method: method,
+            headers: { 'Content-Type': 'application/json', 'X-CSRFToken': csrftoken },
+            body: body
+        });
+
+        if (!response.ok) throw new Error(await response.text());
+
+        showToast(`子分类已${id ? '更新' : '添加'}`);
+        subCategoryModal.classList.remove('show');
+        fetchSubCategories(id ? currentSubPage : 1);
+    } catch (error) {
+        showToast(`操作失败: ${error.message}`, 'danger');
+    }
+});
+
+async function editSubCategory(id) {
+    try {
+        // 修复：使用专门的API端点获取单个子分类信息
+        const response = await fetch(`${subCategoryApiUrl}${id}/`);
+        if (!response.ok) throw new Error('获取子分类信息失败');
+        const cat = await response.json();
+
+        // 先更新主分类选项
+        await updateParentCategoryOptions();
+
+        // 设置表单数据
+        document.getElementById('subModalTitle').textContent = '编辑子分类';
+        document.getElementById('subCategoryId').value = cat.id;
+        document.getElementById('subCategoryName').value = cat.name;
+        document.getElementById('subCategorySlug').value = cat.slug || '';
+        document.getElementById('parentCategory').value = cat.parent_id || '';
+        document.getElementById('subCategoryStatus').value = cat.is_enabled.toString();
+
+        subCategoryModal.classList.add('show');
+    } catch (error) {
+        showToast('获取子分类信息失败: ' + error.message, 'danger');
+        console.error('Edit sub category error:', error);
+    }
+}
+
+async function deleteSubCategory(id) {
+    if (!confirm('确定要删除这个子分类吗？\n\n⚠️ 注意：如果该子分类下有文章，删除操作将被阻止。\n此操作不可撤销！')) return;
+
+    try {
+        const response = await fetch(`${subCategoryApiUrl}${id}/`, {
+            method: 'DELETE',
+            headers: { 'X-CSRFToken': csrftoken }
+        });
+
+        if (response.ok) {
+            showToast('子分类已删除');
+            fetchSubCategories(currentSubPage);
+        } else {
+            const errorData = await response.json();
+            if (errorData.message) {
+                showToast(errorData.message, 'danger');
+            } else {
+                showToast('删除失败：未知错误', 'danger');
+            }
+        }
+    } catch (error) {
+        showToast('删除失败：' + error.message, 'danger');
+    }
+}
+
+// ================= 初始加载 =================
+document.addEventListener('DOMContentLoaded', () => {
+  fetchMainCategories(1);
+  fetchSubCategories(1);
+});
@@ -0,0 +1,1076 @@
+// 页面地址由模板通过 script 标签的 data- 属性传入
+const pageConfig = document.currentScript.dataset;
+
+// 全局变量
+let currentPage = 1;
+let totalPages = 1;
+let selectedCourses = new Set(); // 存储选中的教程ID
+
+// 页面加载完成后执行
+document.addEventListener('DOMContentLoaded', function() {
+  loadCourses();
+  setupEventListeners();
+  setupBulkActions();
+});
+
+// 设置事件监听器
+function setupEventListeners() {
+  // 添加教程按钮点击事件
+  document.getElementById('addTutorialBtn').addEventListener('click', function(e) {
+    e.preventDefault();
+    window.location.href = pageConfig.articleEditUrl;
+  });
+
+  // 全选复选框事件
+  document.getElementById('selectAllCheckbox').addEventListener('change', function() {
+    toggleSelectAll(this.checked);
+  });
+
+  // 搜索按钮点击事件
+  document.getElementById('searchBtn').addEventListener('click', function() {
+    performSearch();
+  });
+
+  // 搜索输入框回车事件
+  document.getElementById('searchInput').addEventListener('keypress', function(e) {
+    if (e.key === 'Enter') {
+      performSearch();
+    }
+  });
+}
+
+// 设置批量操作事件
+function setupBulkActions() {
+  // 批量编辑
+  document.getElementById('bulkEditBtn').addEventListener('click', function() {
+    if (selectedCourses.size === 0) {
+      Swal.fire('提示', '请先选择要编辑的教程', 'info');
+      return;
+    }
+    if (selectedCourses.size > 1) {
+      Swal.fire('提示', '批量编辑功能暂不支持多个教程，请逐个编辑', 'info');
+      return;
+    }
+    const courseId = Array.from(selectedCourses)[0];
+    editCourse(courseId);
+  });
+
+  // 批量发布
+  document.getElementById('bulkPublishBtn').addEventListener('click', function() {
+    if (selectedCourses.size === 0) {
+      Swal.fire('提示', '请先选择要发布的教程', 'info');
+      return;
+    }
+    bulkPublishCourses();
+  });
+
+  // 批量取消发布
+  document.getElementById('bulkUnpublishBtn').addEventListener('click', function() {
+    if (selectedCourses.size === 0) {
+      Swal.fire('提示', '请先选择要取消发布的教程', 'info');
+      return;
+    }
+    bulkUnpublishCourses();
+  });
+
+  // 批量删除
+  document.getElementById('bulkDeleteBtn').addEventListener('click', function() {
+    if (selectedCourses.size === 0) {
+      Swal.fire('提示', '请先选择要删除的教程', 'info');
+      return;
+    }
+    bulkDeleteCourses();
+  });
+
+  // 清除选择
+  document.getElementById('clearSelectionBtn').addEventListener('click', function() {
+    clearSelection();
+  });
+}
+
+// 全选/取消全选
+function toggleSelectAll(checked) {
+  const checkboxes = document.querySelectorAll('.course-checkbox');
+  checkboxes.forEach(checkbox => {
+    checkbox.checked = checked;
+    if (checked) {
+      selectedCourses.add(checkbox.dataset.id);
+    } else {
+      selectedCourses.delete(checkbox.dataset.id);
+    }
+  });
+  updateBulkActionsToolbar();
+}
+
+// 更新批量操作工具栏
+function updateBulkActionsToolbar() {
+  const selectedCount = document.getElementById('selectedCount');
+  selectedCount.textContent = selectedCourses.size;
+}
+
+// 清除选择
+function clearSelection() {
+  selectedCourses.clear();
+  const checkboxes = document.querySelectorAll('.course-checkbox');
+  checkboxes.forEach(checkbox => {
+    checkbox.checked = false;
+  });
+  document.getElementById('selectAllCheckbox').checked = false;
+  updateBulkActionsToolbar();
+}
+
+// 执行搜索
+function performSearch() {
+  const searchTerm = document.getElementById('searchInput').value.trim();
+  if (searchTerm) {
+    loadCourses(1, searchTerm);
+  } else {
+    loadCourses(1);
+  }
+}
+
+// 批量发布教程
+function bulkPublishCourses() {
+  const courseIds = Array.from(selectedCourses);
+
+  Swal.fire({
+    title: '确认批量发布',
+    text: `确定要发布选中的 ${courseIds.length} 个教程吗？`,
+    icon: 'question',
+    showCancelButton: true,
+    confirmButtonColor: '#28a745',
+    cancelButtonColor: '#6c757d',
+    confirmButtonText: '确认发布',
+    cancelButtonText: '取消'
+  }).then((result) => {
+    if (result.isConfirmed) {
+      // 显示加载中状态
+      Swal.fire({
+        title: '发布中...',
+        text: '正在批量发布教程，请稍候',
+        allowOutsideClick: false,
+        showConfirmButton: false,
+        didOpen: () => {
+          Swal.showLoading();
+        }
+      });
+
+      // 逐个发布教程
+      let successCount = 0;
+      let failCount = 0;
+
+      Promise.allSettled(
+        courseIds.map(courseId => 
+          fetch(`/api/courses/${courseId}/publish/`, {
+            method: 'POST',
+            headers: {
+              'Content-Type': 'application/json',
+              'X-CSRFToken': getCsrfToken()
+            },
+            body: JSON.stringify({ action: 'publish' })
+          }).then(response => response.json())
+        )
+      ).then(results => {
+        results.forEach((result, index) => {
+          if (result.status === 'fulfilled' && result.value.status === 'success') {
+            successCount++;
+          } else {
+            failCount++;
+          }
+        });
+
+        Swal.fire({
+          title: failCount > 0 ? '批量发布部分完成' : '批量发布完成',
+          html: `
+            <div style="text-align: center;">
+              <p style="color: #28a745;">✓ 成功发布: ${successCount} 个</p>
+              ${failCount > 0 ? `<p style="color: #dc3545;">✗ 发布失败: ${failCount} 个</p>` : ''}
+            </div>
+          `,
+          icon: failCount > 0 ? 'warning' : 'success',
+          confirmButtonText: '确定'
+        });
+
+        // 刷新数据
+        loadCourses(currentPage);
+        clearSelection();
+      });
+    }
+  });
+}
+
+// 批量取消发布教程
+function bulkUnpublishCourses() {
+  const courseIds = Array.from(selectedCourses);
+
+  Swal.fire({
+    title: '确认批量取消发布',
+    text: `确定要取消发布选中的 ${courseIds.length} 个教程吗？取消后这些教程将从前台页面消失。`,
+    icon: 'warning',
+    showCancelButton: true,
+    confirmButtonColor: '#ff9800',
+    cancelButtonColor: '#6c757d',
+    confirmButtonText: '确认取消发布',
+    cancelButtonText: '取消'
+  }).then((result) => {
+    if (result.isConfirmed) {
+      // 显示加载中状态
+      Swal.fire({
+        title: '取消发布中...',
+        text: '正在批量取消发布教程，请稍候',
+        allowOutsideClick: false,
+        showConfirmButton: false,
+        didOpen: () => {
+          Swal.showLoading();
+        }
+      });
+
+      // 逐个取消发布教程
+      let successCount = 0;
+      let failCount = 0;
+
+      Promise.allSettled(
+        courseIds.map(courseId => 
+          fetch(`/api/courses/${courseId}/publish/`, {
+            method: 'POST',
+            headers: {
+              'Content-Type': 'application/json',
+              'X-CSRFToken': getCsrfToken()
+            },
+            body: JSON.stringify({ action: 'unpublish' })
+          }).then(response => response.json())
+        )
+      ).then(results => {
+        results.forEach((result, index) => {
+          if (result.status === 'fulfilled' && result.value.status === 'success') {
+            successCount++;
+          } else {
+            failCount++;
+          }
+        });
+
+        Swal.fire({
+          title: failCount > 0 ? '批量取消发布部分完成' : '批量取消发布完成',
+          html: `
+            <div style="text-align: center;">
+              <p style="color: #28a745;">✓ 成功取消发布: ${successCount} 个</p>
+              ${failCount > 0 ? `<p style="color: #dc3545;">✗ 取消发布失败: ${failCount} 个</p>` : ''}
+            </div>
+          `,
+          icon: failCount > 0 ? 'warning' : 'success',
+          confirmButtonText: '确定'
+        });
+
+        // 刷新数据
+        loadCourses(currentPage);
+        clearSelection();
+      });
+    }
+  });
+}
+
+// 批量删除教程
+function bulkDeleteCourses() {
+  const courseIds = Array.from(selectedCourses);
+
+  Swal.fire({
+    title: '确认批量删除',
+    html: `
+      <div style="text-align: left;">
+        <p><strong>警告：</strong>此操作不可恢复！</p>
+        <p>确定要删除选中的 ${courseIds.length} 个教程吗？</p>
+        <ul style="margin: 10px 0; padding-left: 20px;">
+          <li>删除后所有内容将永久丢失</li>
+          <li>包括教程内容、代码示例、标签等</li>
+          <li>已发布的教程将从前台消失</li>
+        </ul>
+      </div>
+    `,
+    icon: 'warning',
+    showCancelButton: true,
+    confirmButtonColor: '#dc3545',
+    cancelButtonColor: '#6c757d',
+    confirmButtonText: '确认删除',
+    cancelButtonText: '取消'
+  }).then((result) => {
+    if (result.isConfirmed) {
+      // 显示加载中状态
+      Swal.fire({
+        title: '删除中...',
+        text: '正在批量删除教程，请稍候',
+        allowOutsideClick: false,
+        showConfirmButton: false,
+        didOpen: () => {
+          Swal.showLoading();
+        }
+      });
+
+      // 逐个删除教程
+      let successCount = 0;
+      let failCount = 0;
+
+      Promise.allSettled(
+        courseIds.map(courseId => 
+          fetch(`/api/courses/${courseId}/`, {
+            method: 'DELETE',
+            headers: {
+              'X-CSRFToken': getCsrfToken()
+            }
+          }).then(response => response.json())
+        )
+      ).then(results => {
+        results.forEach((result, index) => {
+          if (result.status === 'fulfilled' && result.value.status === 'success') {
+            successCount++;
+          } else {
+            failCount++;
+          }
+        });
+
+        Swal.fire({
+          title: failCount > 0 ? '批量删除部分完成' : '批量删除完成',
+          html: `
+            <div style="text-align: center;">
+              <p style="color: #28a745;">✓ 成功删除: ${successCount} 个</p>
+              ${failCount > 0 ? `<p style="color: #dc3545;">✗ 删除失败: ${failCount} 个</p>` : ''}
+            </div>
+          `,
+          icon: failCount > 0 ? 'warning' : 'success',
+          confirmButtonText: '确定'
+        });
+
+        // 刷新数据
+        loadCourses(currentPage);
+        clearSelection();
+      });
+    }
+  });
+}
+
+// 编辑教程
+async function editCourse(courseId) {
+    try {
+        // 显示加载提示
+        Swal.fire({
+            title: '正在加载数据...',
+            text: '请稍候，正在获取教程信息',
+            allowOutsideClick: false,
+            allowEscapeKey: false,
+            showConfirmButton: false,
+            didOpen: () => {
+                Swal.showLoading();
+            }
+        });
+
+        // 获取教程数据
+        const response = await fetch(`/api/courses/${courseId}/`);
+        if (!response.ok) {
+            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        }
+
+        const courseData = await response.json();
+
+        // 关闭加载提示
+        Swal.close();
+
+        // 显示成功提示
+        Swal.fire({
+            title: '数据加载成功！',
+            text: '正在跳转到编辑页面...',
+            icon: 'success',
+            timer: 1500,
+            showConfirmButton: false
+        }).then(() => {
+            // 跳转到文章编辑页面，传递教程ID和类型参数
+            window.location.href = `/manage/article-edit/?id=${courseId}&type=course`;
+        });
+
+    } catch (error) {
+        console.error('加载教程数据失败:', error);
+
+        // 关闭加载提示
+        Swal.close();
+
+        // 显示错误提示
+        Swal.fire({
+            title: '加载失败',
+            text: error.message || '无法加载教程数据，请稍后重试',
+            icon: 'error',
+            confirmButtonText: '确定'
+        });
+    }
+}
+
+// 加载分类数据
+async function loadCategories() {
+    try {
+        const response = await fetch('/api/sub-categories/');
+        if (!response.ok) {
+            throw new Error('获取分类数据失败');
+        }
+
+        const data = await response.json();
+        const categorySelect = document.getElementById('categoryFilter');
+
+        // 清空现有选项
+        categorySelect.innerHTML = '<option value="">所有分类</option>';
+
+        if (data.items && data.items.length > 0) {
+            data.items.forEach(category => {
+                const option = document.createElement('option');
+                option.value = category.id;
+                option.textContent = category.name;
+                categorySelect.appendChild(option);
+            });
+        } else {
+            const option = document.createElement('option');
+            option.value = "";
+            option.textContent = "暂无分类数据";
+            option.disabled = true;
+            categorySelect.appendChild(option);
+        }
+    } catch (error) {
+        console.error('加载分类失败:', error);
+        const categorySelect = document.getElementById('categoryFilter');
+        categorySelect.innerHTML = '<option value="">加载失败</option>';
+    }
+}
+
+// 从API加载教程列表
+function loadCourses(page = 1, searchTerm = '') {
+  currentPage = page;
+
+  let url = `/api/courses/?page=${page}&admin=true`;
+  if (searchTerm) {
+    url += `&search=${encodeURIComponent(searchTerm)}`;
+  }
+
+  return fetch(url)
+    .then(response => {
+      if (!response.ok) {
+        throw new Error('加载教程列表失败');
+      }
+      return response.json();
+    })
+    .then(data => {
+      renderCourseTable(data.items || []);
+      totalPages = data.total_pages || 1;
+      updatePagination(data.current_page || page, data.total_pages || 1);
+      return data;
+    })
+    .catch(error => {
+      console.error('加载教程列表失败:', error);
+
+      // 使用 SweetAlert2 显示错误信息
+      Swal.fire({
+        title: '加载失败',
+        text: '加载教程列表失败: ' + error.message,
+        icon: 'error',
+        confirmButtonText: '确定'
+      });
+
+      // 显示空数据
+      renderCourseTable([]);
+      updatePagination(1, 1);
+
+      throw error; // 重新抛出错误以便调用者处理
+    });
+}
+
+// 渲染教程表格
+function renderCourseTable(courses) {
+  const tableBody = document.querySelector('.table tbody');
+  tableBody.innerHTML = '';
+
+  if (courses.length === 0) {
+    const emptyRow = document.createElement('tr');
+    emptyRow.innerHTML = '<td colspan="8" class="text-center">暂无教程数据</td>';
+    tableBody.appendChild(emptyRow);
+    return;
+  }
+
+  courses.forEach(course => {
+    const row = document.createElement('tr');
+
+    // 格式化标签
+    const tagsList = course.tags ? course.tags.map(tag => tag.name).join(', ') : '';
+
+    // 检查是否缺少必填字段
+    const hasRequiredFields = course.title && course.title.trim() && 
+                            course.category_name && course.category_name.trim();
+
+    // 根据内容类型设置不同的样式
+    let contentTypeBadge = '';
+    if (course.content_type === 'GR') {
+      contentTypeBadge = '<span class="badge badge-primary">语法</span>';
+    } else if (course.content_type === 'DS') {
+      contentTypeBadge = '<span class="badge badge-info">数据结构</span>';
+    } else if (course.content_type === 'AI') {
+      contentTypeBadge = '<span class="badge badge-success">AI编程</span>';
+    } else {
+      contentTypeBadge = '<span class="badge badge-secondary">其他</span>';
+    }
+
+    row.innerHTML = `
+      <td><input type="checkbox" class="course-checkbox" data-id="${course.id}"></td>
+      <td>${course.id}</td>
+      <td>${escapeHtml(course.title || '无标题')}</td>
+      <td>${course.category_name ? escapeHtml(course.category_name) : '未分类'}</td>
+      <td>${contentTypeBadge}</td>
+      <td>${escapeHtml(tagsList)}</td>
+      <td>
+        ${course.is_published ? 
+          '<span class="badge badge-success">已发布</span>' : 
+          '<span class="badge badge-warning">草稿</span>'
+        }
+      </td>
+      <td>${course.id}</td>
+      <td>
+        <div class="btn-group">
+          <button class="btn btn-outline btn-sm" onclick="editCourse(${course.id})" title="编辑">
+            <i class="fas fa-edit"></i> 编辑
+          </button>
+          <button class="btn btn-outline btn-sm" onclick="deleteCourse(${course.id})" title="删除" style="margin-left: 5px;">
+            <i class="fas fa-trash"></i> 删除
+          </button>
+        </div>
+      </td>
+    `;
+
+    tableBody.appendChild(row);
+  });
+
+  // 添加复选框事件监听器
+  document.querySelectorAll('.course-checkbox').forEach(checkbox => {
+    checkbox.addEventListener('change', function() {
+      if (this.checked) {
+        selectedCourses.add(this.dataset.id);
+      } else {
+        selectedCourses.delete(this.dataset.id);
+      }
+      updateBulkActionsToolbar();
+
+      // 更新全选复选框状态
+      const allCheckboxes = document.querySelectorAll('.course-checkbox');
+      const checkedCheckboxes = document.querySelectorAll('.course-checkbox:checked');
+      const selectAllCheckbox = document.getElementById('selectAllCheckbox');
+
+      if (checkedCheckboxes.length === 0) {
+        selectAllCheckbox.checked = false;
+        selectAllCheckbox.indeterminate = false;
+      } else if (checkedCheckboxes.length === allCheckboxes.length) {
+        selectAllCheckbox.checked = true;
+        selectAllCheckbox.indeterminate = false;
+      } else {
+        selectAllCheckbox.checked = false;
+        selectAllCheckbox.indeterminate = true;
+      }
+    });
+  });
+
+  // 清除选择状态
+  selectedCourses.clear();
+  updateBulkActionsToolbar();
+  document.getElementById('selectAllCheckbox').checked = false;
+  document.getElementById('selectAllCheckbox').indeterminate = false;
+}
+
+// 更新分页控件
+function updatePagination(currentPage, totalPages) {
+  const paginationContainer = document.getElementById('paginationContainer');
+
+  // 如果只有一页，则不显示分页控件
+  if (totalPages <= 1) {
+    paginationContainer.innerHTML = '';
+    return;
+  }
+
+  // 创建分页HTML
+  let paginationHtml = '<div class="pagination">';
+
+  // 上一页按钮
+  if (currentPage > 1) {
+    paginationHtml += `<button class="page-btn" data-page="${currentPage - 1}">上一页</button>`;
+  } else {
+    paginationHtml += `<button class="page-btn disabled">上一页</button>`;
+  }
+
+  // 页码按钮
+  const startPage = Math.max(1, currentPage - 2);
+  const endPage = Math.min(totalPages, startPage + 4);
+
+  for (let i = startPage; i <= endPage; i++) {
+    if (i === currentPage) {
+      paginationHtml += `<button class="page-btn active">${i}</button>`;
+    } else {
+      paginationHtml += `<button class="page-btn" data-page="${i}">${i}</button>`;
+    }
+  }
+
+  // 下一页按钮
+  if (currentPage < totalPages) {
+    paginationHtml += `<button class="page-btn" data-page="${currentPage + 1}">下一页</button>`;
+  } else {
+    paginationHtml += `<button class="page-btn disabled">下一页</button>`;
+  }
+
+  paginationHtml += '</div>';
+  paginationContainer.innerHTML = paginationHtml;
+
+  // 添加页码按钮事件监听器
+  document.querySelectorAll('.page-btn:not(.disabled):not(.active)').forEach(btn => {
+    btn.addEventListener('click', function() {
+      const page = parseInt(this.dataset.page);
+      loadCourses(page);
+    });
+  });
+}
+
+// 发布教程
+function publishCourse(courseId) {
+  // 先获取教程详情进行验证
+  fetch(`/api/courses/${courseId}/`)
+    .then(response => response.json())
+    .then(course => {
+      console.log('获取教程详情:', course);
+
+      if (course.is_published) {
+        Swal.fire({
+          title: '提示',
+          text: '该教程已发布',
+          icon: 'info',
+          confirmButtonText: '确定'
+        });
+        return;
+      }
+
+      // 检查是否有必填字段缺失
+      const missingFields = [];
+      if (!course.title || course.title.trim() === '') {
+        missingFields.push('教程标题');
+      }
+      if (!course.category_name || course.category_name.trim() === '') {
+        missingFields.push('教程分类');
+      }
+      if (!course.summary || course.summary.trim() === '') {
+        missingFields.push('教程摘要');
+      }
+
+      if (missingFields.length > 0) {
+        Swal.fire({
+          title: '发布失败',
+          html: `无法发布：${missingFields.join('、')}不能为空<br><br>请编辑教程并填写完整信息后重试。`,
+          icon: 'warning',
+          confirmButtonText: '确定'
+        });
+        return;
+      }
+
+      // 使用SweetAlert2确认弹窗
+      Swal.fire({
+        title: '确认发布',
+        text: `确定要发布教程 "${course.title}" 吗？发布后该教程将在前台显示。`,
+        icon: 'question',
+        showCancelButton: true,
+        confirmButtonColor: '#28a745',
+        cancelButtonColor: '#6c757d',
+        confirmButtonText: '确认发布',
+        cancelButtonText: '取消',
+        reverseButtons: true
+      }).then((result) => {
+        if (result.isConfirmed) {
+          // 显示加载中状态
+          Swal.fire({
+            title: '发布中...',
+            text: '正在发布教程，请稍候',
+            allowOutsideClick: false,
+            showConfirmButton: false,
+            didOpen: () => {
+              Swal.showLoading();
+            }
+          });
+
+          // 调用发布API
+          fetch(`/api/courses/${courseId}/publish/`, {
+            method: 'POST',
+            headers: {
+              'Content-Type': 'application/json',
+              'X-CSRFToken': getCsrfToken()
+            },
+            body: JSON.stringify({
+              action: 'publish'
+            })
+          })
+          .then(response => {
+            return response.json().then(data => {
+              if (!response.ok) {
+                throw new Error(data.message || '发布失败');
+              }
+              return data;
+            });
+          })
+          .then(data => {
+            console.log('发布成功响应:', data);
+            // 显示成功提示
+            Swal.fire({
+              title: '发布成功！',
+              html: `教程 "${course.title}" 已成功发布<br>现在用户可以在前台看到该教程了。`,
+              icon: 'success',
+              confirmButtonColor: '#28a745',
+              confirmButtonText: '好的'
+            });
+
+            // 实时更新当前行的状态显示
+            updateCourseStatusInTable(courseId, true);
+
+            // 强制刷新数据以确保同步
+            setTimeout(() => {
+              loadCourses(currentPage);
+            }, 1000);
+          })
+          .catch(error => {
+            console.error('发布教程失败:', error);
+            Swal.fire({
+              title: '发布失败',
+              text: error.message || '发布过程中出现错误，请稍后重试',
+              icon: 'error',
+              confirmButtonText: '确定'
+            });
+          });
+        }
+      });
+    })
+    .catch(error => {
+      console.error('获取教程详情失败:', error);
+      Swal.fire({
+        title: '获取信息失败',
+        text: '获取教程信息失败，请稍后重试',
+        icon: 'error',
+        confirmButtonText: '确定'
+      });
+    });
+}
+
+// 取消发布教程
+function unpublishCourse(courseId) {
+  // 先获取教程详情进行验证
+  fetch(`/api/courses/${courseId}/`)
+    .then(response => response.json())
+    .then(course => {
+      console.log('获取教程详情:', course);
+
+      if (!course.is_published) {
+        Swal.fire({
+          title: '提示',
+          text: '该教程已经是草稿状态',
+          icon: 'info',
+          confirmButtonText: '确定'
+        });
+        return;
+      }
+
+      // 使用SweetAlert2确认弹窗
+      Swal.fire({
+        title: '确认取消发布',
+        text: `确定要取消发布教程 "${course.title}" 吗？取消后该教程将从前台页面消失。`,
+        icon: 'warning',
+        showCancelButton: true,
+        confirmButtonColor: '#ff9800',
+        cancelButtonColor: '#6c757d',
+        confirmButtonText: '确认取消发布',
+        cancelButtonText: '取消',
+        reverseButtons: true
+      }).then((result) => {
+        if (result.isConfirmed) {
+          // 显示加载中状态
+          Swal.fire({
+            title: '取消发布中...',
+            text: '正在取消发布教程，请稍候',
+            allowOutsideClick: false,
+            showConfirmButton: false,
+            didOpen: () => {
+              Swal.showLoading();
+            }
+          });
+
+          // 调用取消发布API
+          fetch(`/api/courses/${courseId}/publish/`, {
+            method: 'POST',
+            headers: {
+              'Content-Type': 'application/json',
+              'X-CSRFToken': getCsrfToken()
+            },
+            body: JSON.stringify({
+              action: 'unpublish'
+            })
+          })
+          .then(response => {
+            return response.json().then(data => {
+              if (!response.ok) {
+                throw new Error(data.message || '取消发布失败');
+              }
+              return data;
+            });
+          })
+          .then(data => {
+            console.log('取消发布成功响应:', data);
+            // 显示成功提示
+            Swal.fire({
+              title: '取消发布成功！',
+              html: `教程 "${course.title}" 已成功取消发布<br>现在该教程已变为草稿状态，不再在前台显示。`,
+              icon: 'success',
+              confirmButtonColor: '#ff9800',
+              confirmButtonText: '好的'
+            });
+
+            // 实时更新当前行的状态显示
+            updateCourseStatusInTable(courseId, false);
+
+            // 强制刷新数据以确保同步
+            setTimeout(() => {
+              loadCourses(currentPage);
+            }, 1000);
+          })
+          .catch(error => {
+            console.error('取消发布教程失败:', error);
+            Swal.fire({
+              title: '取消发布失败',
+              text: error.message || '取消发布过程中出现错误，请稍后重试',
+              icon: 'error',
+              confirmButtonText: '确定'
+            });
+          });
+        }
+      });
+    })
+    .catch(error => {
+      console.error('获取教程详情失败:', error);
+      Swal.fire({
+        title: '获取信息失败',
+        text: '获取教程信息失败，请稍后重试',
+        icon: 'error',
+        confirmButtonText: '确定'
+      });
+    });
+}
+
+// 实时更新表格中的状态显示
+function updateCourseStatusInTable(courseId, isPublished) {
+  // 查找包含该课程ID的行
+  const rows = document.querySelectorAll('.table tbody tr');
+  for (let row of rows) {
+    const editBtn = row.querySelector('.edit-btn');
+    if (editBtn && editBtn.dataset.id == courseId) {
+      const statusCell = row.cells[5]; // 状态列
+      const publishBtn = row.querySelector('.publish-btn');
+
+      // 更新状态显示
+      statusCell.innerHTML = isPublished ? 
+        '<span class="badge badge-success">已发布</span>' : 
+        '<span class="badge badge-warning">草稿</span>';
+
+      // 更新发布按钮
+      if (isPublished) {
+        publishBtn.style.display = 'none';
+      } else {
+        publishBtn.style.display = 'inline-flex';
+      }
+      break;
+    }
+  }
+}
+
+// 删除教程
+function deleteCourse(courseId) {
+  console.log('开始删除教程，ID:', courseId);
+
+  // 验证课程ID
+  if (!courseId || isNaN(courseId)) {
+    Swal.fire({
+      title: '参数错误',
+      text: '无效的教程ID',
+      icon: 'error',
+      confirmButtonText: '确定'
+    });
+    return;
+  }
+
+  // 先获取教程名称用于提示
+  fetch(`/api/courses/${courseId}/`)
+    .then(response => {
+      console.log('获取教程详情响应:', response);
+      if (!response.ok) {
+        throw new Error(`获取教程详情失败: ${response.status}`);
+      }
+      return response.json();
+    })
+    .then(course => {
+      console.log('获取到教程信息:', course);
+
+      // 检查教程是否已发布，给出相应提示
+      const isPublished = course.is_published;
+      const warningText = isPublished ? 
+        `警告：该教程 "${course.title}" 当前已发布，删除后将从前台页面消失！` :
+        `确定要删除教程 "${course.title}" 吗？此操作不可恢复！`;
+
+      Swal.fire({
+        title: '确认删除',
+        html: `
+          <div style="text-align: left;">
+            <p><strong>教程信息：</strong></p>
+            <ul style="margin: 10px 0; padding-left: 20px;">
+              <li>标题：${course.title}</li>
+              <li>分类：${course.category_name || '未分类'}</li>
+              <li>状态：${isPublished ? '<span style="color: #28a745;">已发布</span>' : '<span style="color: #ff9800;">草稿</span>'}</li>
+              <li>创建时间：${course.created_at ? new Date(course.created_at).toLocaleString('zh-CN') : '未知'}</li>
+            </ul>
+            <p style="color: #dc3545; font-weight: bold;">${warningText}</p>
+            <p style="font-size: 14px; color: #666; margin-top: 15px;">
+              <i class="fas fa-info-circle"></i> 删除后，该教程的所有内容将永久丢失，包括：
+              <br>• 教程内容
+              <br>• 代码示例
+              <br>• 相关标签
+              <br>• 访问统计
+            </p>
+          </div>
+        `,
+        icon: 'warning',
+        showCancelButton: true,
+        confirmButtonColor: '#dc3545',
+        cancelButtonColor: '#6c757d',
+        confirmButtonText: '确认删除',
+        cancelButtonText: '取消',
+        reverseButtons: true,
+        width: '600px'
+      }).then((result) => {
+        if (result.isConfirmed) {
+          // 显示删除中状态
+          Swal.fire({
+            title: '删除中...',
+            text: '正在删除教程，请稍候',
+            allowOutsideClick: false,
+            showConfirmButton: false,
+            didOpen: () => {
+              Swal.showLoading();
+            }
+          });
+
+          console.log('发送删除请求，URL:', `/api/courses/${courseId}/`);
+          fetch(`/api/courses/${courseId}/`, {
+            method: 'DELETE',
+            headers: {
+              'X-CSRFToken': getCsrfToken()
+            }
+          })
+          .then(response => {
+            console.log('删除API响应:', response);
+
+            // 尝试解析响应内容
+            return response.json().then(data => {
+              if (!response.ok) {
+                throw new Error(data.message || `删除失败: ${response.status}`);
+              }
+              return data;
+            });
+          })
+          .then(data => {
+            console.log('删除成功响应:', data);
+
+            // 显示删除成功提示
+            Swal.fire({
+              title: '删除成功！',
+              html: `
+                <div style="text-align: center;">
+                  <p style="color: #28a745; font-size: 18px;">✓ 教程已成功删除</p>
+                  <p style="margin: 15px 0;">${data.message}</p>
+                  <p style="font-size: 14px; color: #666; margin-top: 15px;">
+                    <i class="fas fa-exclamation-triangle"></i> 注意：此操作不可撤销
+                  </p>
+                  <p style="font-size: 14px; color: #666;">页面将在3秒后自动刷新...</p>
+                </div>
+              `,
+              icon: 'success',
+              confirmButtonColor: '#28a745',
+              confirmButtonText: '好的',
+              timer: 3000,
+              timerProgressBar: true
+            });
+
+            // 延迟刷新页面数据
+            setTimeout(() => {
+              loadCourses(currentPage);
+            }, 1000);
+          })
+          .catch(error => {
+            console.error('删除教程失败:', error);
+
+            // 关闭加载提示
+            Swal.close();
+
+            // 显示详细错误信息
+            Swal.fire({
+              title: '删除失败',
+              html: `
+                <div style="text-align: left;">
+                  <p style="color: #dc3545; margin-bottom: 15px;">删除过程中出现错误：</p>
+                  <div style="background: #f8f9fa; padding: 10px; border-radius: 5px; font-family: monospace; font-size: 12px;">
+                    ${error.message}
+                  </div>
+                  <p style="margin-top: 15px; font-size: 14px; color: #666;">
+                    请检查网络连接或联系管理员
+                  </p>
+                </div>
+              `,
+              icon: 'error',
+              confirmButtonColor: '#dc3545',
+              confirmButtonText: '确定',
+              width: '500px'
+            });
+          });
+        }
+      });
+    })
+    .catch(error => {
+      console.error('获取教程详情失败:', error);
+
+      // 显示获取信息失败的错误提示
+      Swal.fire({
+        title: '获取信息失败',
+        html: `
+          <div style="text-align: left;">
+            <p style="color: #dc3545; margin-bottom: 15px;">无法获取教程信息：</p>
+            <div style="background: #f8f9fa; padding: 10px; border-radius: 5px; font-family: monospace; font-size: 12px;">
+              ${error.message}
+            </div>
+            <p style="margin-top: 15px; font-size: 14px; color: #666;">
+              可能的原因：<br>
+              • 教程已被删除<br>
+              • 网络连接问题<br>
+              • 服务器错误
+            </p>
+          </div>
+        `,
+        icon: 'error',
+        confirmButtonColor: '#dc3545',
+        confirmButtonText: '确定',
+        width: '500px'
+      });
+    });
+}
+
+// 获取CSRF令牌
+function getCsrfToken() {
+  const cookieValue = document.cookie
+    .split('; ')
+    .find(row => row.startsWith('csrftoken='))
+    ?.split('=')[1];
+  console.log('CSRF令牌:', cookieValue);
+  return cookieValue || '';
+}
+
+// HTML转义
+function escapeHtml(text) {
+  const div = document.createElement('div');
+  div.textContent = text;
+  return div.innerHTML;
+}
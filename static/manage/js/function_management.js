@@ -0,0 +1,276 @@
+// 接口地址和CSRF令牌由模板通过 script 标签的 data- 属性传入
+const pageConfig = document.currentScript.dataset;
+
+// 页面加载完成后初始化
+document.addEventListener('DOMContentLoaded', function () {
+  loadStats();
+  loadTableInfo();
+  setupFileUpload();
+});
+
+// 设置文件上传
+function setupFileUpload() {
+  const fileInput = document.getElementById('file-input');
+  const progressBar = document.getElementById('progress-bar');
+  const progressFill = document.getElementById('progress-fill');
+  const successAlert = document.getElementById('success-alert');
+  const errorAlert = document.getElementById('error-alert');
+  const infoAlert = document.getElementById('info-alert');
+  const loading = document.getElementById('loading');
+  const uploadStatus = document.getElementById('upload-status');
+  const uploadedFilename = document.getElementById('uploaded-filename');
+
+  // 显示提示信息
+  function showAlert(type, message) {
+    const alert = type === 'success' ? successAlert :
+                 type === 'error' ? errorAlert : infoAlert;
+    alert.textContent = message;
+    alert.style.display = 'block';
+    setTimeout(() => {
+      alert.style.display = 'none';
+    }, 5000);
+  }
+
+          // 处理文件上传
+    fileInput.addEventListener('change', function () {
+      const file = fileInput.files[0];
+      if (!file) return;
+
+      const validTypes = [
+        'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        'application/vnd.ms-excel',
+        'text/csv'
+      ];
+      const validExtensions = ['.xlsx', '.xls', '.csv'];
+      const fileExtension = file.name.toLowerCase().substring(file.name.lastIndexOf('.'));
+
+      if (!validTypes.includes(file.type) && !validExtensions.includes(fileExtension)) {
+        showAlert('error', '仅支持 .xlsx、.xls 或 .csv 文件！');
+        return;
+      }
+
+      // 检查文件大小 (50MB)
+      const maxSize = 50 * 1024 * 1024; // 50MB in bytes
+      if (file.size > maxSize) {
+        showAlert('error', `文件大小超过限制。最大允许：50MB，当前文件：${(file.size / (1024*1024)).toFixed(2)}MB`);
+        return;
+      }
+
+      // 显示加载状态
+    loading.style.display = 'block';
+    progressBar.style.display = 'block';
+    progressFill.style.width = '0%';
+    showAlert('info', `正在上传: ${file.name}`);
+
+    const formData = new FormData();
+    formData.append('file', file);
+    formData.append('csrfmiddlewaretoken', pageConfig.csrfToken);
+    // 服务器开启后台导入时上传后轮询任务进度，否则等待同步导入完成
+    if (pageConfig.backgroundImport === '1') {
+      formData.append('background', '1');
+    }
+
+    const xhr = new XMLHttpRequest();
+    xhr.open('POST', pageConfig.uploadUrl, true);
+
+    xhr.upload.onprogress = function (e) {
+      if (e.lengthComputable) {
+        const percent = (e.loaded / e.total) * 100;
+        progressFill.style.width = percent + '%';
+      }
+    };
+
+    // 显示导入结果
+    function showImportResult(res) {
+      let message = res.message || '上传成功！';
+
+      // 如果有警告信息，添加到消息中
+      const warnings = res.warnings || res.errors || [];
+      const totalErrors = res.total_errors !== undefined ? res.total_errors : res.error_count;
+      if (warnings.length > 0) {
+        message += '\n\n警告信息：';
+        warnings.forEach((warning, index) => {
+          message += `\n${index + 1}. ${warning}`;
+        });
+        if (totalErrors > warnings.length) {
+          message += `\n... 还有 ${totalErrors - warnings.length} 个错误未显示`;
+        }
+      }
+
+      showAlert('success', message);
+
+      // 显示已上传文件名
+      uploadedFilename.textContent = file.name;
+      uploadStatus.style.display = 'block';
+
+      loadStats();
+      loadTableInfo();
+    }
+
+    // 轮询导入任务进度
+    function pollImportJob(statusUrl) {
+      fetch(statusUrl)
+        .then(res => res.json())
+        .then(job => {
+          if (!job.success) {
+            throw new Error(job.message || '获取导入进度失败');
+          }
+          if (job.total_rows > 0) {
+            progressFill.style.width = (job.processed_rows / job.total_rows * 100) + '%';
+          }
+          if (job.status === 'pending' || job.status === 'running') {
+            showAlert('info', `${job.status_display}: 已处理 ${job.processed_rows}/${job.total_rows} 行，${job.rows_per_second} 行/秒`);
+            setTimeout(() => pollImportJob(statusUrl), 1000);
+            return;
+          }
+          loading.style.display = 'none';
+          progressBar.style.display = 'none';
+          if (job.status === 'succeeded') {
+            showImportResult(job);
+          } else {
+            showAlert('error', job.message || '导入失败');
+          }
+        })
+        .catch(err => {
+          loading.style.display = 'none';
+          progressBar.style.display = 'none';
+          showAlert('error', err.message);
+        });
+    }
+
+    xhr.onload = function () {
+      if (xhr.status === 202) {
+        try {
+          const res = JSON.parse(xhr.responseText);
+          progressFill.style.width = '0%';
+          showAlert('info', res.message);
+          pollImportJob(res.status_url);
+        } catch (err) {
+          loading.style.display = 'none';
+          progressBar.style.display = 'none';
+          showAlert('error', '解析响应失败');
+        }
+        return;
+      }
+      loading.style.display = 'none';
+      progressBar.style.display = 'none';
+      if (xhr.status === 200) {
+        try {
+          const res = JSON.parse(xhr.responseText);
+          if (res.success) {
+            progressFill.style.width = '100%';
+            showImportResult(res);
+          } else {
+            showAlert('error', res.message || '上传失败');
+          }
+        } catch (err) {
+          showAlert('error', '解析响应失败');
+        }
+      } else {
+        showAlert('error', `服务器错误 (${xhr.status})`);
+      }
+    };
+
+    xhr.onerror = () => {
+      loading.style.display = 'none';
+      showAlert('error', '网络错误');
+    };
+
+    xhr.send(formData);
+  });
+}
+
+// 下载模板
+function downloadTemplate() {
+  const link = document.createElement('a');
+  link.href = pageConfig.downloadTemplateUrl;
+  link.download = '函数数据库模板.xlsx';
+  link.click();
+}
+
+// 下载数据库表
+function downloadDatabase() {
+  const link = document.createElement('a');
+  link.href = pageConfig.exportUrl;
+  link.download = '函数数据库表.csv';
+  link.click();
+}
+
+// 按导入模板格式备份全部数据，可直接上传恢复
+function downloadBackup() {
+  const link = document.createElement('a');
+  link.href = pageConfig.exportUrl + '?format=template';
+  link.download = '函数数据库备份.xlsx';
+  link.click();
+}
+
+// 加载统计
+function loadStats() {
+  fetch(pageConfig.statsUrl)
+    .then(res => res.json())
+    .then(data => {
+      if (data.success) {
+        document.getElementById('library-count').textContent = data.stats.libraries || 0;
+        document.getElementById('module-count').textContent = data.stats.modules || 0;
+        document.getElementById('function-count').textContent = data.stats.functions || 0;
+        document.getElementById('parameter-count').textContent = data.stats.parameters || 0;
+      }
+    })
+    .catch(err => console.error('加载统计失败:', err));
+}
+
+
+
+// 加载表结构
+function loadTableInfo() {
+  const tableGrid = document.getElementById('table-grid');
+  tableGrid.innerHTML = '<div style="grid-column: 1 / -1; text-align: center; padding: 2rem; color: #666;">正在加载表结构信息...</div>';
+
+  fetch(pageConfig.tableStructureUrl)
+    .then(res => res.json())
+    .then(data => {
+      if (data.success) {
+        tableGrid.innerHTML = '';
+
+        Object.values(data.tables).forEach(table => {
+          const card = document.createElement('div');
+          card.className = 'table-card';
+
+          const title = document.createElement('div');
+          title.className = 'table-name';
+          title.textContent = table.name;
+          card.appendChild(title);
+
+          const list = document.createElement('ul');
+          list.className = 'field-list';
+          table.fields.forEach(field => {
+            const li = document.createElement('li');
+            li.className = 'field-item';
+
+            // 分离字段名和类型
+            const fieldParts = field.split(' (');
+            const fieldName = fieldParts[0];
+            const fieldType = fieldParts[1] ? fieldParts[1].replace(')', '') : '';
+
+            li.textContent = fieldName;
+            if (fieldType) {
+              const span = document.createElement('span');
+              span.className = 'field-type';
+              span.textContent = fieldType;
+              li.appendChild(span);
+            }
+            list.appendChild(li);
+          });
+          card.appendChild(list);
+
+          tableGrid.appendChild(card);
+        });
+      } else {
+        tableGrid.innerHTML = '<div style="grid-column: 1 / -1; text-align: center; padding: 2rem; color: #e74c3c;">加载表结构失败: ' + (data.message || '未知错误') + '</div>';
+      }
+    })
+    .catch(err => {
+      console.error('加载表结构失败:', err);
+      tableGrid.innerHTML = '<div style="grid-column: 1 / -1; text-align: center; padding: 2rem; color: #e74c3c;">加载表结构失败: ' + err.message + '</div>';
+    });
+}
@@ -0,0 +1,147 @@
+// 初始化编辑器
+document.addEventListener('DOMContentLoaded', function() {
+    // 初始化富文本编辑器
+    tinymce.init({
+        selector: '#rich-text-editor',
+        plugins: 'code table lists link image media codesample autoresize',
+        toolbar: 'undo redo | blocks | bold italic | alignleft aligncenter alignright | indent outdent | bullist numlist | code table link image media codesample',
+        min_height: 300,
+        autoresize_bottom_margin: 20,
+        autoresize_on_init: true,
+        skin: window.matchMedia('(prefers-color-scheme: dark)').matches ? 'oxide-dark' : 'oxide',
+        content_css: window.matchMedia('(prefers-color-scheme: dark)').matches ? 'dark' : 'default',
+        content_style: 'body { margin: 1rem; font-size: 14px; line-height: 1.6; }',
+        menubar: false,
+        statusbar: false,
+        branding: false,
+        setup: function(editor) {
+            // 编辑器内容变化时自动滚动到底部
+            editor.on('change', function() {
+                const editorContainer = editor.editorContainer;
+                if (editorContainer) {
+                    editorContainer.scrollTop = editorContainer.scrollHeight;
+                }
+            });
+        }
+    });
+
+    // 初始化Monaco编辑器
+    require.config({ paths: { 'vs': 'https://cdnjs.cloudflare.com/ajax/libs/monaco-editor/0.44.0/min/vs' }});
+    require(['vs/editor/editor.main'], function() {
+        window.monacoEditor = monaco.editor.create(document.getElementById('monaco-editor'), {
+            value: '// 在这里编写您的代码\nconsole.log("Hello, World!");',
+            language: 'javascript',
+            theme: window.matchMedia('(prefers-color-scheme: dark)').matches ? 'vs-dark' : 'vs',
+            automaticLayout: true,
+            minimap: { enabled: false },
+            scrollBeyondLastLine: true
+        });
+
+        // 自动调整编辑器大小
+        window.addEventListener('resize', function() {
+            monacoEditor.layout();
+        });
+    });
+
+    // 标签输入功能
+    const tagInput = document.getElementById('tag-input');
+    const tagContainer = document.getElementById('tag-container');
+
+    tagInput.addEventListener('keydown', function(e) {
+        if (e.key === 'Enter' && this.value.trim()) {
+            e.preventDefault();
+            const tag = document.createElement('div');
+            tag.className = 'tag';
+            tag.innerHTML = `
+                ${this.value.trim()}
+                <button class="tag-remove">&times;</button>
+            `;
+            tagContainer.insertBefore(tag, tagInput);
+            tag.querySelector('.tag-remove').addEventListener('click', function() {
+                tag.remove();
+            });
+            this.value = '';
+        }
+    });
+
+    // 标签页切换功能
+    document.querySelectorAll('.editor-tab').forEach(tab => {
+        tab.addEventListener('click', function() {
+            // 移除所有活动标签
+            document.querySelectorAll('.editor-tab').forEach(t => t.classList.remove('active'));
+            document.querySelectorAll('.editor-pane').forEach(p => p.classList.remove('active'));
+
+            // 激活当前标签
+            this.classList.add('active');
+            const paneId = this.getAttribute('data-tab') + '-pane';
+            document.getElementById(paneId).classList.add('active');
+
+            // 调整编辑器大小
+            if (window.monacoEditor) {
+                setTimeout(() => {
+                    monacoEditor.layout();
+                }, 0);
+            }
+        });
+    });
+
+    // 内容类型切换
+    document.querySelectorAll('.content-type-tab').forEach(tab => {
+        tab.addEventListener('click', function() {
+            document.querySelectorAll('.content-type-tab').forEach(t => t.classList.remove('active'));
+            this.classList.add('active');
+            // 这里可以添加切换内容类型的逻辑
+        });
+    });
+});
+
+// 预览功能
+function previewContent() {
+    const previewContent = document.getElementById('preview-content');
+    const title = document.getElementById('title').value || '无标题';
+    const content = tinymce.activeEditor.getContent();
+
+    previewContent.innerHTML = `
+        <h1>${title}</h1>
+        ${content || '<p>暂无内容</p>'}
+    `;
+
+    // 切换到预览标签
+    document.querySelector('.editor-tab[data-tab="preview"]').click();
+}
+
+// 保存功能
+function saveContent() {
+    Swal.fire({
+        title: '保存成功',
+        text: '文章已保存到内容列表',
+        icon: 'success',
+        confirmButtonText: '确定'
+    });
+}
+
+// 代码编辑器功能
+function formatCode() {
+    monacoEditor.getAction('editor.action.formatDocument').run();
+}
+
+function runCode() {
+    // 这里可以添加运行代码的逻辑
+    Swal.fire({
+        title: '运行代码',
+        text: '代码执行功能需要后端支持',
+        icon: 'info',
+        confirmButtonText: '确定'
+    });
+}
+
+function insertCodeBlock() {
+    const code = monacoEditor.getValue();
+    tinymce.activeEditor.execCommand('mceInsertContent', false, `<pre class="language-${document.getElementById('code-language').value}"><code>${code}</code></pre>`);
+    Swal.fire({
+        title: '插入成功',
+        text: '代码已插入到富文本编辑器中',
+        icon: 'success',
+        confirmButtonText: '确定'
+    });
+}
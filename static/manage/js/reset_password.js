@@ -0,0 +1,64 @@
+function resetPassword() {
+    const btn = document.querySelector('.btn');
+    const result = document.getElementById('result');
+
+    btn.disabled = true;
+    btn.textContent = '重置中...';
+    result.innerHTML = '';
+
+    fetch('/api/reset-admin-password/', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'X-CSRFToken': getCookie('csrftoken')
+        }
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            result.innerHTML = `
+                <div class="success">
+                    <h3>✅ 密码重置成功！</h3>
+                    <p>${data.message}</p>
+                    <p><strong>用户名：</strong> ${data.username}</p>
+                    <p><strong>新密码：</strong> ${data.password}</p>
+                    <p><a href="/login/" style="color: #155724; font-weight: bold;">立即登录</a></p>
+                </div>
+            `;
+        } else {
+            result.innerHTML = `
+                <div class="error">
+                    <h3>❌ 重置失败</h3>
+                    <p>${data.message}</p>
+                </div>
+            `;
+        }
+    })
+    .catch(error => {
+        result.innerHTML = `
+            <div class="error">
+                <h3>❌ 错误</h3>
+                <p>请求失败：${error.message}</p>
+            </div>
+        `;
+    })
+    .finally(() => {
+        btn.disabled = false;
+        btn.textContent = '重置密码';
+    });
+}
+
+function getCookie(name) {
+    let cookieValue = null;
+    if (document.cookie && document.cookie !== '') {
+        const cookies = document.cookie.split(';');
+        for (let i = 0; i < cookies.length; i++) {
+            const cookie = cookies[i].trim();
+            if (cookie.substring(0, name.length + 1) === (name + '=')) {
+                cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+                break;
+            }
+        }
+    }
+    return cookieValue;
+}